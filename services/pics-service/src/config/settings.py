@@ -1,11 +1,68 @@
 """Application settings from environment variables."""
 
-from typing import Optional
-from pydantic_settings import BaseSettings
-
-
-class Settings(BaseSettings):
-    """Application settings from environment variables."""
+import os
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union, get_args, get_origin, get_type_hints
+
+ENV_FILE = ".env"
+
+_TRUE_VALUES = {"1", "true", "t", "yes", "y", "on"}
+_FALSE_VALUES = {"0", "false", "f", "no", "n", "off"}
+
+
+def _read_env_file(path: str) -> Dict[str, str]:
+    """Parse KEY=VALUE lines from a dotenv file, returning {} when it is missing."""
+    try:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return {}
+
+    values: Dict[str, str] = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        key = key.strip().removeprefix("export ").strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in {'"', "'"}:
+            value = value[1:-1]
+        values[key] = value
+    return values
+
+
+def _coerce(name: str, raw: str, annotation: Any) -> Any:
+    """Convert a raw environment string to the field's annotated type."""
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+
+    if annotation is bool:
+        normalized = raw.strip().lower()
+        if normalized in _TRUE_VALUES:
+            return True
+        if normalized in _FALSE_VALUES:
+            return False
+        raise ValueError(f"{name.upper()} must be a boolean, got {raw!r}")
+
+    if annotation in (int, float):
+        try:
+            return annotation(raw.strip())
+        except ValueError as error:
+            raise ValueError(
+                f"{name.upper()} must be {annotation.__name__}, got {raw!r}"
+            ) from error
+
+    return raw
+
+
+@dataclass(slots=True)
+class Settings:
+    """Application settings from environment variables.
+
+    Field names match environment variables case-insensitively; the process
+    environment overrides values from a local .env file.
+    """
 
     # Database
     supabase_url: Optional[str] = None
@@ -24,6 +81,20 @@ class Settings(BaseSettings):
     pics_latest_state_target: str = "supabase"  # 'supabase' or 'tiger'
     pics_latest_state_tiger_url: Optional[str] = None
 
+    # Max concurrent independent database calls per upsert batch: relation-table
+    # and Steam Deck writes, plus the storefront-authority lookups. Set to 1 to
+    # run them sequentially.
+    pics_relation_sync_workers: int = 3
+
+    # Rows per latest-state upsert request. App rows are wide, so they use a
+    # smaller chunk than junction rows (Steam Deck, DLC links). Chunks rejected
+    # with HTTP 413 are halved and retried.
+    pics_app_upsert_batch_size: int = 2000
+    pics_junction_upsert_batch_size: int = 5000
+    # Tiger app batches with at least this many rows are streamed with COPY into
+    # a staging table instead of being sent as one JSON recordset.
+    pics_app_copy_min_rows: int = 200
+
     # One-time PICS change-history backfill controls.
     pics_change_history_backfill_batch_size: int = 500
     pics_change_history_backfill_limit: Optional[int] = None
@@ -44,14 +115,19 @@ class Settings(BaseSettings):
     bulk_request_delay: float = 0.5
     bulk_timeout: int = 60  # Timeout per batch fetch (seconds)
     bulk_max_retries: int = 5  # Retry attempts per batch
+    bulk_max_in_flight: int = 4  # Concurrent PICS product-info requests
+    bulk_upsert_in_flight: int = 2  # Concurrent upsert_apps_batch calls
     first_pass_batch_limit: int = 500
     first_pass_candidate_pool_size: int = 1000
     first_pass_recent_release_days: int = 30
     first_pass_near_release_days: int = 14
 
     # Change monitor options
-    poll_interval: int = 30
+    poll_interval: int = 30  # Initial seconds between polls; adapts within the bounds below
+    min_poll_interval: int = 5  # Floor while changes or a queue backlog are pending
+    max_poll_interval: int = 120  # Ceiling after consecutive empty polls
     process_batch_size: int = 100
+    process_coalesce_seconds: int = 10  # Hold partial batches this long so bursts coalesce
     max_queue_size: int = 10000
 
     # Steam connection settings
@@ -62,10 +138,30 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     log_json: bool = True
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        extra = "ignore"
-
-
-settings = Settings()
+    @classmethod
+    def from_env(
+        cls,
+        environ: Optional[Mapping[str, str]] = None,
+        env_file: Optional[str] = ENV_FILE,
+    ) -> "Settings":
+        """Build settings from the process environment and an optional .env file."""
+        values = {
+            key.lower(): value
+            for key, value in (_read_env_file(env_file) if env_file else {}).items()
+        }
+        values.update(
+            (key.lower(), value)
+            for key, value in (os.environ if environ is None else environ).items()
+        )
+
+        type_hints = get_type_hints(cls)
+        return cls(
+            **{
+                field.name: _coerce(field.name, values[field.name], type_hints[field.name])
+                for field in fields(cls)
+                if field.name in values
+            }
+        )
+
+
+settings = Settings.from_env()
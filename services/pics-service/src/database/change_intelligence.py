@@ -6,7 +6,7 @@ import hashlib
 import json
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from ..extractors.common import Association, ExtractedPICSData
 
@@ -26,9 +26,14 @@ class PICSEvent:
 
 def normalize_pics_snapshot(app: ExtractedPICSData) -> Dict[str, Any]:
     """Normalize extracted PICS payload to a stable JSON shape for hashing/versioning."""
-    developer_names = _normalize_association_names(app.developer, app.associations, "developer")
-    publisher_names = _normalize_association_names(app.publisher, app.associations, "publisher")
-    franchise_names = _normalize_association_names(None, app.associations, "franchise")
+    associations_by_type = app.associations_by_type
+    developer_names = _normalize_association_names(
+        app.developer, associations_by_type.get("developer", ())
+    )
+    publisher_names = _normalize_association_names(
+        app.publisher, associations_by_type.get("publisher", ())
+    )
+    franchise_names = _normalize_association_names(None, associations_by_type.get("franchise", ()))
 
     return {
         "appid": app.appid,
@@ -140,8 +145,7 @@ def _append_value_change(
 
 def _normalize_association_names(
     primary_name: Optional[str],
-    associations: List[Association],
-    assoc_type: str,
+    associations: Sequence[Association],
 ) -> List[str]:
     names = set()
 
@@ -149,7 +153,7 @@ def _normalize_association_names(
         names.add(primary_name.strip())
 
     for association in associations:
-        if association.type == assoc_type and association.name:
+        if association.name:
             names.add(association.name.strip())
 
     return sorted(names)
@@ -1,15 +1,21 @@
 """Supabase client wrapper for PICS service."""
 
+import json as stdlib_json
 import logging
 import os
-from typing import Optional
+from typing import Any, Optional
 
-from supabase import create_client, Client
+import httpx
+import orjson
+from supabase import ClientOptions, create_client, Client
 
 from ..config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Matches postgrest-py's default client timeout.
+SUPABASE_HTTP_TIMEOUT_SECONDS = 120
+
 ALLOWED_SUPABASE_SERVICE_PURPOSES = {
     "auth",
     "legacy-read",
@@ -52,20 +58,40 @@ def _assert_supabase_service_client_allowed() -> None:
     )
 
 
+class OrjsonHttpxClient(httpx.Client):
+    """httpx client that encodes JSON request bodies with orjson.
+
+    postgrest-py passes upsert and RPC payloads as ``json=``, which httpx encodes
+    with the stdlib json module; for 500-row app batches that encode is the main
+    client-side CPU cost of a write. Options match the Tiger store's JSONB
+    encoding, so int dict keys and non-JSON scalars are accepted; payloads orjson
+    still rejects (ints wider than 64 bits) fall back to the stdlib encoder.
+    """
+
+    def build_request(
+        self, method: str, url: Any, *, json: Any = None, **kwargs: Any
+    ) -> httpx.Request:
+        if json is not None and kwargs.get("content") is None:
+            headers = httpx.Headers(kwargs.pop("headers", None))
+            headers.setdefault("Content-Type", "application/json")
+            try:
+                kwargs["content"] = orjson.dumps(json, default=str, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                kwargs["content"] = stdlib_json.dumps(json).encode()
+            kwargs["headers"] = headers
+        return super().build_request(method, url, **kwargs)
+
+
 class SupabaseClient:
     """Supabase client wrapper for PICS service."""
 
-    _instance: Optional["SupabaseClient"] = None
-
     def __init__(self):
         self._client: Optional[Client] = None
 
     @classmethod
     def get_instance(cls) -> "SupabaseClient":
         """Get singleton instance."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return _instance
 
     def connect(self) -> Client:
         """Initialize Supabase connection."""
@@ -77,18 +103,29 @@ class SupabaseClient:
         if not url or not key:
             raise ValueError("Missing SUPABASE_URL or SUPABASE_SERVICE_KEY")
 
-        self._client = create_client(url, key)
+        http_client = OrjsonHttpxClient(
+            timeout=SUPABASE_HTTP_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            http2=True,
+        )
+        self._client = create_client(url, key, options=ClientOptions(httpx_client=http_client))
         logger.info("Connected to Supabase")
         return self._client
 
     @property
     def client(self) -> Client:
         """Get the Supabase client, connecting if needed."""
-        if self._client is None:
+        client = self._client
+        if client is None:
             return self.connect()
-        return self._client
+        return client
 
     def disconnect(self):
         """Disconnect from Supabase (cleanup)."""
         self._client = None
         logger.info("Disconnected from Supabase")
+
+
+# Created at import time: __init__ only sets up state and the actual connection
+# stays lazy, so this is cheap and avoids a racy check-then-init in get_instance.
+_instance = SupabaseClient()
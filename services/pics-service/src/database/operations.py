@@ -1,11 +1,34 @@
 """Database operations for PICS data."""
 
+import json
 import logging
+import os
+import random
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, TypeVar
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 import httpx
+import orjson
+from cachetools import TTLCache
 
 from .client import SupabaseClient
 from .change_intelligence import (
@@ -18,12 +41,35 @@ from .change_intelligence import (
 from .tiger_change_history import TigerPICSChangeHistoryStore
 from .tiger_latest_state import TigerPICSLatestStateStore
 from ..config.settings import settings
-from ..extractors.common import ExtractedPICSData, Association
+from ..extractors.common import ExtractedPICSData, Association, SteamDeckCompatibility
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
+
+@dataclass(frozen=True)
+class AppSyncState:
+    """Pre-upsert state for a batch of appids."""
+
+    existing_appids: Set[int]
+    existing_names: Dict[int, str]
+    storefront_date_appids: Set[int]  # apps with an authoritative release_date_raw
+    storefront_sync_appids: Set[int]  # apps whose booleans are storefront-owned
+
+
 STEAM_TAGS_URL = "https://store.steampowered.com/tagdata/populartags/english"
+# Tag names change rarely, so persist them across process restarts and only hit
+# the Steam API when the local copy goes stale. The jitter spreads refreshes out
+# across replicas that were deployed together.
+STEAM_TAGS_CACHE_PATH = Path(tempfile.gettempdir()) / "publisheriq-steam-tags.json"
+STEAM_TAGS_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+STEAM_TAGS_CACHE_TTL_JITTER_SECONDS = 24 * 60 * 60
+
+
+def _tag_name_cache_validators_path() -> Path:
+    """Sidecar file holding the ETag/Last-Modified headers for the tag name cache."""
+    return STEAM_TAGS_CACHE_PATH.with_name(f"{STEAM_TAGS_CACHE_PATH.name}.validators")
+
 
 # Genre ID → Name mapping (from Steam PICS data)
 GENRE_NAMES: Dict[int, str] = {
@@ -139,6 +185,83 @@ CATEGORY_NAMES: Dict[int, str] = {
     79: "Save Anytime",
 }
 
+# PICS type (lowercased) → apps.type enum value
+APP_TYPE_MAP: Dict[str, str] = {
+    "game": "game",
+    "dlc": "dlc",
+    "demo": "demo",
+    "mod": "mod",
+    "video": "video",
+    "tool": "tool",
+    "application": "application",
+    "hardware": "hardware",
+    "music": "music",
+    "episode": "episode",
+    "series": "series",
+    "advertising": "advertising",
+}
+
+
+@lru_cache(maxsize=64)
+def _app_type_for(pics_type: str) -> str:
+    """Map a raw PICS type string; PICS only emits a handful of casings, so each is lowered once."""
+    return APP_TYPE_MAP.get(pics_type.lower(), "game")
+
+
+# Name heuristics used by _infer_type when PICS has no type, checked in order.
+_DEMO_NAME_PATTERNS = (" demo", "(demo)", "[demo]")
+_DEMO_NAME_EXCLUSIONS = ("demon", "democracy", "demolition")
+_INFERRED_TYPE_NAME_PATTERNS = (
+    ("music", ("soundtrack", " ost", "original score", "music pack")),
+    ("tool", (" sdk", "dedicated server", "level editor", "modding tool")),
+    ("video", ("trailer", "- video", "making of", "behind the scenes")),
+)
+
+STEAM_DECK_CATEGORY_MAP = {0: "unknown", 1: "unsupported", 2: "playable", 3: "verified"}
+
+
+@lru_cache(maxsize=4096)
+def _deck_test_timestamp_iso(test_timestamp: int) -> str:
+    """Format a Deck test epoch; Valve tests in sweeps, so many apps share a timestamp."""
+    return datetime.fromtimestamp(test_timestamp).isoformat()
+
+
+def _build_name_table(names: Dict[int, str]) -> Tuple[Optional[str], ...]:
+    """Compile a small dense id -> name mapping into a tuple indexed by id."""
+    return tuple(names.get(item_id) for item_id in range(max(names) + 1))
+
+
+# Genre and category ids are small dense ints, so per-row name lookups index
+# these tuples directly instead of hashing into the dicts above.
+_GENRE_NAME_TABLE = _build_name_table(GENRE_NAMES)
+_CATEGORY_NAME_TABLE = _build_name_table(CATEGORY_NAMES)
+
+
+# Unknown ids fall back to formatted placeholders. The name helpers are cached
+# so repeated ids reuse one string instead of formatting it again per row.
+@lru_cache(maxsize=4096)
+def _genre_name(genre_id: int) -> str:
+    name = _GENRE_NAME_TABLE[genre_id] if 0 <= genre_id < len(_GENRE_NAME_TABLE) else None
+    return name if name is not None else f"Genre {genre_id}"
+
+
+@lru_cache(maxsize=4096)
+def _category_name(category_id: int) -> str:
+    name = (
+        _CATEGORY_NAME_TABLE[category_id] if 0 <= category_id < len(_CATEGORY_NAME_TABLE) else None
+    )
+    return name if name is not None else f"Category {category_id}"
+
+
+@lru_cache(maxsize=32768)
+def _tag_placeholder_name(tag_id: int) -> str:
+    return f"Tag {tag_id}"
+
+
+def _utc_now_iso() -> str:
+    """Naive UTC ISO timestamp, matching the format the old datetime.utcnow() calls produced."""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
 
 def _parse_iso_datetime(value: Any) -> Optional[datetime]:
     if not isinstance(value, str) or not value:
@@ -222,12 +345,22 @@ class PICSDatabase:
     """Database operations for PICS data."""
 
     UPSERT_BATCH_SIZE = 500
+    APP_ID_PAGE_SIZE = 50000  # appids per get_*_app_ids_after page
     HISTORY_MAX_RETRIES = 3
     HISTORY_RETRY_DELAY_SECONDS = 1.0
     HISTORY_FAILURE_COOLDOWN_SECONDS = 60.0
+    WRITE_MAX_RETRIES = 3
+    WRITE_RETRY_DELAY_SECONDS = 1.0
+    APP_STATE_CACHE_MAX_SIZE = 500_000
+    APP_STATE_CACHE_TTL_SECONDS = 60.0
+    # appid -> (has_raw_date, has_storefront_sync) for apps known to exist; None
+    # unless the instance was created with cache_app_state=True.
+    _app_state_cache: Optional[TTLCache] = None
     _tag_name_cache: Dict[int, str] = {}  # Class-level cache
+    _tag_names_load_attempted = False
+    _tag_names_lock = threading.Lock()
 
-    def __init__(self):
+    def __init__(self, cache_app_state: bool = False):
         self._history_target = settings.pics_change_history_target.strip().lower()
         if self._history_target not in {"supabase", "tiger"}:
             raise ValueError("PICS_CHANGE_HISTORY_TARGET must be 'supabase' or 'tiger'")
@@ -240,7 +373,13 @@ class PICSDatabase:
             if self._history_target == "supabase" or self._latest_state_target == "supabase"
             else None
         )
-        self._load_tag_names()
+        # Lookup rows (id -> name) already upserted by this process, so repeated
+        # categories/genres/tags are only re-sent when their name changes.
+        self._upserted_lookup_names: Dict[str, Dict[int, str]] = {
+            "steam_categories": {},
+            "steam_genres": {},
+            "steam_tags": {},
+        }
         self._history_available = True
         self._history_disabled_until: Optional[float] = None
         self._tiger_history_store = (
@@ -249,6 +388,11 @@ class PICSDatabase:
         self._tiger_latest_state_store = (
             self._create_tiger_latest_state_store() if self._latest_state_target == "tiger" else None
         )
+        if cache_app_state:
+            self._app_state_cache = TTLCache(
+                maxsize=self.APP_STATE_CACHE_MAX_SIZE,
+                ttl=self.APP_STATE_CACHE_TTL_SECONDS,
+            )
 
     def _create_tiger_change_history_store(self) -> TigerPICSChangeHistoryStore:
         return TigerPICSChangeHistoryStore.from_settings(settings)
@@ -256,24 +400,103 @@ class PICSDatabase:
     def _create_tiger_latest_state_store(self) -> TigerPICSLatestStateStore:
         return TigerPICSLatestStateStore.from_settings(settings)
 
+    def _get_tag_names(self) -> Dict[int, str]:
+        """Return Steam tag names, loading them once per process on first use."""
+        if not PICSDatabase._tag_names_load_attempted:
+            with PICSDatabase._tag_names_lock:
+                if not PICSDatabase._tag_names_load_attempted:
+                    self._load_tag_names()
+                    PICSDatabase._tag_names_load_attempted = True
+        return PICSDatabase._tag_name_cache
+
     def _load_tag_names(self):
-        """Load Steam tag names from API (cached at class level)."""
+        """Load Steam tag names from the local file cache or API (cached at class level)."""
         if PICSDatabase._tag_name_cache:
             return  # Already loaded
 
+        cached_tags, is_fresh = self._read_tag_name_file_cache()
+        if cached_tags and is_fresh:
+            PICSDatabase._tag_name_cache = cached_tags
+            logger.info(f"Loaded {len(cached_tags)} Steam tag names from {STEAM_TAGS_CACHE_PATH}")
+            return
+
         try:
             logger.info("Loading Steam tag names from API...")
-            response = httpx.get(STEAM_TAGS_URL, timeout=30.0)
+            # Revalidate a stale copy with its ETag/Last-Modified so an unchanged
+            # tag list costs a 304 instead of the full ~400KB download.
+            headers = self._read_tag_name_cache_validators() if cached_tags else {}
+            response = httpx.get(STEAM_TAGS_URL, headers=headers, timeout=30.0)
+            if response.status_code == 304 and cached_tags:
+                PICSDatabase._tag_name_cache = cached_tags
+                os.utime(STEAM_TAGS_CACHE_PATH)  # Restart the TTL
+                logger.info(f"Steam tag names unchanged, reusing {len(cached_tags)} cached names")
+                return
+
             response.raise_for_status()
-            tags = response.json()
+            tags = orjson.loads(response.content)
             PICSDatabase._tag_name_cache = {t["tagid"]: t["name"] for t in tags}
             logger.info(f"Loaded {len(PICSDatabase._tag_name_cache)} Steam tag names")
+            self._write_tag_name_file_cache(
+                PICSDatabase._tag_name_cache,
+                {
+                    header: value
+                    for header, value in (
+                        ("If-None-Match", response.headers.get("etag")),
+                        ("If-Modified-Since", response.headers.get("last-modified")),
+                    )
+                    if value
+                },
+            )
         except Exception as e:
+            if cached_tags:
+                PICSDatabase._tag_name_cache = cached_tags
+                logger.warning(
+                    f"Failed to refresh Steam tag names, using {len(cached_tags)} "
+                    f"stale cached names: {e}"
+                )
+                return
             logger.warning(f"Failed to load Steam tag names: {e}")
 
-    def _get_tag_name(self, tag_id: int) -> str:
-        """Get tag name from cache, or fallback to placeholder."""
-        return PICSDatabase._tag_name_cache.get(tag_id, f"Tag {tag_id}")
+    def _read_tag_name_file_cache(self) -> tuple[Dict[int, str], bool]:
+        """Read cached tag names from disk, returning (tags, is_fresh)."""
+        try:
+            age_seconds = time.time() - STEAM_TAGS_CACHE_PATH.stat().st_mtime
+            raw_tags = json.loads(STEAM_TAGS_CACHE_PATH.read_text(encoding="utf-8"))
+            tags = {int(tag_id): str(name) for tag_id, name in raw_tags.items()}
+        except FileNotFoundError:
+            return {}, False
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Steam tag name cache {STEAM_TAGS_CACHE_PATH}: {e}")
+            return {}, False
+
+        ttl_seconds = STEAM_TAGS_CACHE_TTL_SECONDS + random.uniform(
+            0, STEAM_TAGS_CACHE_TTL_JITTER_SECONDS
+        )
+        return tags, age_seconds < ttl_seconds
+
+    def _read_tag_name_cache_validators(self) -> Dict[str, str]:
+        """Read the conditional-request headers saved alongside the tag name cache."""
+        try:
+            validators = json.loads(_tag_name_cache_validators_path().read_text(encoding="utf-8"))
+            return {str(header): str(value) for header, value in validators.items()}
+        except Exception:
+            return {}
+
+    def _write_tag_name_file_cache(
+        self, tags: Dict[int, str], validators: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Atomically persist tag names so the next process start can skip the API call."""
+        files = [
+            (STEAM_TAGS_CACHE_PATH, tags),
+            (_tag_name_cache_validators_path(), validators or {}),
+        ]
+        try:
+            for path, payload in files:
+                temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                temp_path.write_text(json.dumps(payload), encoding="utf-8")
+                os.replace(temp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to write Steam tag name cache {STEAM_TAGS_CACHE_PATH}: {e}")
 
     def upsert_apps_batch(
         self,
@@ -295,12 +518,16 @@ class PICSDatabase:
         if not apps:
             return stats
 
-        # Get existing appids from database - only process apps that exist
+        # Get existing appids, names, and storefront authority in one lookup -
+        # only process apps that exist. Stored names are only needed as a
+        # fallback for apps whose PICS payload has no name.
         all_appids = [app.appid for app in apps]
-        existing_appids = set(self._get_existing_appids(all_appids))
-        existing_names = self._get_existing_app_names(
-            [app.appid for app in apps if app.appid in existing_appids]
+        sync_state = self._get_app_sync_state(
+            all_appids,
+            name_appids=[app.appid for app in apps if not app.name],
         )
+        existing_appids = sync_state.existing_appids
+        existing_names = sync_state.existing_names
 
         # Filter to only apps that exist in database
         apps_to_process = [app for app in apps if app.appid in existing_appids]
@@ -323,13 +550,11 @@ class PICSDatabase:
 
         # Get apps that already have storefront release dates (authoritative)
         # PICS should only set release_date as a fallback when storefront data is missing
-        appids_to_process = [app.appid for app in apps_to_process]
-        apps_with_storefront_dates = self._get_apps_with_storefront_dates(appids_to_process)
-        logger.info(f"{len(apps_with_storefront_dates)} apps have storefront release dates (will not overwrite)")
-
         # Get apps that have been synced via storefront API (authoritative for storefront-owned booleans)
         # PICS should only set is_free / is_released as fallbacks when storefront hasn't synced yet
-        apps_with_storefront_sync = self._get_apps_with_storefront_sync(appids_to_process)
+        apps_with_storefront_dates = sync_state.storefront_date_appids
+        apps_with_storefront_sync = sync_state.storefront_sync_appids
+        logger.info(f"{len(apps_with_storefront_dates)} apps have storefront release dates (will not overwrite)")
         logger.info(
             "%s apps have storefront sync (will not overwrite storefront-owned booleans)",
             len(apps_with_storefront_sync),
@@ -339,6 +564,7 @@ class PICSDatabase:
         app_records = []
         appid_to_app = {}  # Track which apps we're processing
         build_failures = 0
+        updated_at = _utc_now_iso()
         for app in apps_to_process:
             has_storefront_date = app.appid in apps_with_storefront_dates
             has_storefront_sync = app.appid in apps_with_storefront_sync
@@ -347,6 +573,7 @@ class PICSDatabase:
                 has_storefront_date=has_storefront_date,
                 has_storefront_sync=has_storefront_sync,
                 existing_name=existing_names.get(app.appid),
+                updated_at=updated_at,
             )
             if record:
                 app_records.append(record)
@@ -364,20 +591,162 @@ class PICSDatabase:
 
         # Upsert apps in batches. Each bulk upsert must use a homogeneous key set so
         # storefront-owned columns omitted by some rows are never nulled by a mixed payload.
-        for i in range(0, len(app_records), self.UPSERT_BATCH_SIZE):
-            batch = app_records[i : i + self.UPSERT_BATCH_SIZE]
-            for homogeneous_batch in self._group_app_records_by_keyset(batch):
-                batch_successful_appids, batch_failures = self._upsert_app_records(homogeneous_batch)
-                stats["updated"] += len(batch_successful_appids)
-                stats["failed"] += batch_failures
-                successful_appids.update(batch_successful_appids)
+        # The batches cover disjoint appids, so they are written concurrently.
+        app_batch_size = max(1, settings.pics_app_upsert_batch_size)
+        homogeneous_batches = [
+            homogeneous_batch
+            for i in range(0, len(app_records), app_batch_size)
+            for homogeneous_batch in self._group_app_records_by_keyset(
+                app_records[i : i + app_batch_size]
+            )
+        ]
+        for batch_successful_appids, batch_failures in self._run_concurrently(
+            [lambda batch=batch: self._upsert_app_records(batch) for batch in homogeneous_batches]
+        ):
+            stats["updated"] += len(batch_successful_appids)
+            stats["failed"] += batch_failures
+            successful_appids.update(batch_successful_appids)
 
         # Process relationships only for successfully upserted apps
         successful_apps = [appid_to_app[appid] for appid in successful_appids if appid in appid_to_app]
-        self._sync_relationships(successful_apps, successful_appids, trigger_cursor=trigger_cursor)
+        self._sync_relationships(
+            successful_apps, successful_appids, trigger_cursor=trigger_cursor, now=updated_at
+        )
 
         return stats
 
+    def _get_app_sync_state(
+        self,
+        appids: List[int],
+        name_appids: Optional[Collection[int]] = None,
+    ) -> AppSyncState:
+        """Fetch existence, names, and storefront authority for appids in one query per page.
+
+        Names are only returned for ``name_appids`` when it is given, so batches
+        where PICS supplied every name do not pull stored names back over the wire.
+        Pages of more than 1000 appids are requested concurrently.
+
+        Falls back to the separate per-column lookups if the combined query fails
+        (for example before the check_app_sync_state migration is applied).
+        """
+        if not appids:
+            return AppSyncState(set(), {}, set(), set())
+
+        cache = self._app_state_cache
+        if cache is None:
+            return self._fetch_app_sync_state(appids, name_appids)
+
+        # Only existing apps are cached, and apps that need a fallback name are
+        # always looked up because names are not cached.
+        needs_name = set(name_appids or ())
+        cached_states: Dict[int, Tuple[bool, bool]] = {}
+        for appid in appids:
+            cached = cache.get(appid) if appid not in needs_name else None
+            if cached is not None:
+                cached_states[appid] = cached
+        lookup_appids = [appid for appid in appids if appid not in cached_states]
+        state = (
+            self._fetch_app_sync_state(lookup_appids, name_appids)
+            if lookup_appids
+            else AppSyncState(set(), {}, set(), set())
+        )
+
+        for appid in state.existing_appids:
+            cache[appid] = (
+                appid in state.storefront_date_appids,
+                appid in state.storefront_sync_appids,
+            )
+        for appid, (has_raw_date, has_storefront_sync) in cached_states.items():
+            state.existing_appids.add(appid)
+            if has_raw_date:
+                state.storefront_date_appids.add(appid)
+            if has_storefront_sync:
+                state.storefront_sync_appids.add(appid)
+
+        return state
+
+    def _fetch_app_sync_state(
+        self,
+        appids: List[int],
+        name_appids: Optional[Collection[int]] = None,
+    ) -> AppSyncState:
+        """Query app sync state for appids, see _get_app_sync_state."""
+        try:
+            if self._tiger_latest_state_store is not None:
+                rows = self._tiger_latest_state_store.get_app_sync_state(
+                    appids, name_appids=name_appids
+                )
+            else:
+                batch_size = 1000  # PostgREST max rows per response
+                name_appid_set = None if name_appids is None else set(name_appids)
+
+                def page_params(batch: List[int]) -> Dict[str, Any]:
+                    if name_appid_set is None:
+                        return {"p_appids": batch}
+                    return {
+                        "p_appids": batch,
+                        "p_name_appids": [appid for appid in batch if appid in name_appid_set],
+                    }
+
+                pages = self._run_concurrently(
+                    [
+                        lambda params=page_params(appids[i : i + batch_size]): self._db.client.rpc(
+                            "check_app_sync_state",
+                            params,
+                        ).execute()
+                        for i in range(0, len(appids), batch_size)
+                    ]
+                )
+                rows = [row for page in pages for row in page.data or []]
+        except Exception as e:
+            logger.warning(f"Failed to fetch combined app sync state, using separate lookups: {e}")
+            return self._get_app_sync_state_separately(appids, name_appids)
+
+        existing_appids: Set[int] = set()
+        existing_names: Dict[int, str] = {}
+        storefront_date_appids: Set[int] = set()
+        storefront_sync_appids: Set[int] = set()
+        for row in rows:
+            appid = int(row["appid"])
+            existing_appids.add(appid)
+            name = row.get("name")
+            if isinstance(name, str) and name:
+                existing_names[appid] = name
+            if row.get("has_raw_date"):
+                storefront_date_appids.add(appid)
+            if row.get("has_storefront_sync"):
+                storefront_sync_appids.add(appid)
+
+        return AppSyncState(
+            existing_appids, existing_names, storefront_date_appids, storefront_sync_appids
+        )
+
+    def _get_app_sync_state_separately(
+        self,
+        appids: List[int],
+        name_appids: Optional[Collection[int]] = None,
+    ) -> AppSyncState:
+        """Build AppSyncState from the individual lookups, overlapping the independent ones."""
+        existing_appids = sorted(set(self._get_existing_appids(appids)))
+        if name_appids is None:
+            names_to_fetch = existing_appids
+        else:
+            name_appid_set = set(name_appids)
+            names_to_fetch = [appid for appid in existing_appids if appid in name_appid_set]
+        existing_names, storefront_date_appids, storefront_sync_appids = self._run_concurrently(
+            [
+                lambda: self._get_existing_app_names(names_to_fetch),
+                lambda: self._get_apps_with_storefront_dates(existing_appids),
+                lambda: self._get_apps_with_storefront_sync(existing_appids),
+            ]
+        )
+        return AppSyncState(
+            set(existing_appids),
+            existing_names,
+            storefront_date_appids,
+            storefront_sync_appids,
+        )
+
     def _get_existing_app_names(self, appids: List[int]) -> Dict[int, str]:
         """Fetch existing non-null app names so PICS upserts can preserve them."""
         if not appids:
@@ -522,7 +891,7 @@ class PICSDatabase:
         if not apps or not self._is_history_capture_enabled():
             return
 
-        observed_at = datetime.utcnow().isoformat()
+        observed_at = _utc_now_iso()
         latest_snapshots = self._get_latest_history_snapshots([app.appid for app in apps])
         if latest_snapshots is None:
             return
@@ -809,6 +1178,14 @@ class PICSDatabase:
         if isinstance(error, (httpx.TimeoutException, httpx.TransportError, httpx.NetworkError)):
             return True
 
+        # Gateway statuses come from the response status or postgrest's code, never
+        # from digits in the message, which may just echo an appid like 5030
+        if isinstance(error, httpx.HTTPStatusError):
+            if error.response.status_code in {502, 503, 504}:
+                return True
+        if str(self._history_error_payload(error).get("code")) in {"502", "503", "504"}:
+            return True
+
         message = self._history_error_text(error)
         transient_markers = (
             "timeout",
@@ -821,13 +1198,32 @@ class PICSDatabase:
             "could not connect",
             "ssl syscall",
             "server disconnected",
+            "server closed the connection",
+            "terminating connection",
+            "connection is closed",
             "temporarily unavailable",
-            "502",
-            "503",
-            "504",
+            "deadlock detected",
+            "bad gateway",
+            "service unavailable",
+            "gateway timeout",
         )
         return any(marker in message for marker in transient_markers)
 
+    def _is_payload_too_large_error(self, error: Exception) -> bool:
+        """Detect HTTP 413 rejections of an oversized request body."""
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 413:
+            return True
+
+        # postgrest reports the HTTP status as the code of a non-JSON error body
+        if str(self._history_error_payload(error).get("code")) == "413":
+            return True
+
+        # Match phrases only: a bare "413" also appears in unrelated ids like appid 41300
+        message = self._history_error_text(error)
+        return any(
+            marker in message for marker in ("payload too large", "request entity too large")
+        )
+
     def _is_history_schema_cache_error(self, error: Exception) -> bool:
         """Detect transient PostgREST schema cache misses."""
         payload = self._history_error_payload(error)
@@ -862,7 +1258,10 @@ class PICSDatabase:
 
         if self._tiger_latest_state_store is not None:
             try:
-                return self._tiger_latest_state_store.upsert_app_records(records), 0
+                return self._run_write_with_retries(
+                    "app batch upsert",
+                    lambda: self._tiger_latest_state_store.upsert_app_records(records),
+                ), 0
             except Exception as e:
                 logger.error(f"Failed to upsert Tiger app batch: {e}")
 
@@ -889,9 +1288,24 @@ class PICSDatabase:
             return successful_appids, failed
 
         try:
-            self._db.client.table("apps").upsert(records, on_conflict="appid").execute()
+            self._run_write_with_retries(
+                "app batch upsert",
+                lambda: self._db.client.table("apps")
+                .upsert(records, on_conflict="appid")
+                .execute(),
+            )
             return batch_appids, 0
         except Exception as e:
+            if len(records) > 1 and self._is_payload_too_large_error(e):
+                midpoint = len(records) // 2
+                logger.warning(
+                    "Splitting %s PICS app upserts after payload-too-large response",
+                    len(records),
+                )
+                first_successful, first_failed = self._upsert_app_records(records[:midpoint])
+                second_successful, second_failed = self._upsert_app_records(records[midpoint:])
+                return first_successful | second_successful, first_failed + second_failed
+
             logger.error(f"Failed to upsert app batch: {e}")
 
         if len(records) == 1:
@@ -945,22 +1359,24 @@ class PICSDatabase:
         has_storefront_date: bool = False,
         has_storefront_sync: bool = False,
         existing_name: Optional[str] = None,
+        updated_at: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Build a database record from extracted PICS data."""
+        """Build a database record from extracted PICS data.
+
+        ``updated_at`` lets batch callers share one timestamp across every record.
+        """
         try:
-            # Use PICS type if available, otherwise infer from other data
-            app_type = app.type if app.type else self._infer_type(app)
             app_name = app.name or existing_name
 
             if not app_name:
                 logger.warning("Skipping PICS app %s because no name is available", app.appid)
                 return None
 
-            return {
+            record: Dict[str, Any] = {
                 "appid": app.appid,
                 "name": app_name,
-                # Always set type - either from PICS or inferred
-                "type": self._map_app_type(app_type),
+                # Always set type - either from PICS or inferred from other data
+                "type": self._map_app_type(app.type if app.type else self._infer_type(app)),
                 # PICS-specific fields
                 "pics_review_score": app.review_score,
                 "pics_review_percentage": app.review_percentage,
@@ -983,21 +1399,22 @@ class PICSDatabase:
                 "content_descriptors": app.content_descriptors if app.content_descriptors else None,
                 "languages": app.languages if app.languages else None,
                 "has_workshop": app.has_workshop,
-                # is_free from PICS - only as fallback when storefront hasn't synced yet
-                # Storefront API is authoritative for is_free
-                **({"is_free": app.is_free} if not has_storefront_sync else {}),
-                # Release date from PICS - only as fallback when storefront data is missing
-                # Storefront API is authoritative for release dates
-                **(
-                    {"release_date": app.steam_release_date.date().isoformat()}
-                    if app.steam_release_date and not has_storefront_date
-                    else {}
-                ),
-                # is_released from PICS - only as fallback when storefront hasn't synced yet
-                # Storefront API is authoritative for is_released (uses reliable coming_soon field)
-                **({"is_released": app.release_state == "released"} if not has_storefront_sync else {}),
-                "updated_at": datetime.utcnow().isoformat(),
             }
+
+            # Storefront API is authoritative for is_free and is_released (uses reliable
+            # coming_soon field), so PICS only sets them as fallbacks when storefront
+            # hasn't synced yet.
+            if not has_storefront_sync:
+                record["is_free"] = app.is_free
+                record["is_released"] = app.release_state == "released"
+
+            # Release date from PICS - only as fallback when storefront data is missing
+            # Storefront API is authoritative for release dates
+            if app.steam_release_date and not has_storefront_date:
+                record["release_date"] = app.steam_release_date.date().isoformat()
+
+            record["updated_at"] = updated_at or _utc_now_iso()
+            return record
         except Exception as e:
             logger.error(f"Failed to build record for app {app.appid}: {e}")
             return None
@@ -1007,67 +1424,175 @@ class PICSDatabase:
         apps: List[ExtractedPICSData],
         successful_appids: Set[int],
         trigger_cursor: Optional[str] = None,
+        now: Optional[str] = None,
     ):
         """Sync developer/publisher/tag/genre/category/franchise relationships.
 
         Only processes apps in the successful_appids set to avoid FK violations
         when updating sync_status for apps that failed to upsert.
+
+        Categories, genres, and store tags are replaced for the whole batch at
+        once; an app is only marked as PICS-synced when every relation write for
+        it succeeded. Every timestamp written for the batch uses the same `now`.
         """
-        processed_appids = []
+        # Only process apps that were successfully upserted
+        batch_apps = [app for app in apps if app.appid in successful_appids]
+        if not batch_apps:
+            return
 
-        for app in apps:
-            # Only process apps that were successfully upserted
-            if app.appid not in successful_appids:
-                continue
+        now = now or _utc_now_iso()
+        failed_appids = self._sync_relation_tables(batch_apps, now)
 
-            try:
-                # Steam Deck compatibility
-                if app.steam_deck:
-                    self._upsert_steam_deck(app.appid, app.steam_deck)
+        processed_appids = [app.appid for app in batch_apps if app.appid not in failed_appids]
 
-                # Categories
-                self._sync_categories(app.appid, app.categories)
+        # Batch update sync status only for successfully processed apps
+        if processed_appids:
+            self._batch_update_sync_status(processed_appids, trigger_cursor=trigger_cursor, now=now)
 
-                # Genres
-                self._sync_genres(app.appid, app.genres, app.primary_genre)
+    def _sync_relation_tables(self, apps: List[ExtractedPICSData], now: str) -> Set[int]:
+        """Sync categories, genres, store tags, franchises, Steam Deck, and DLC rows for a batch.
 
-                # Store tags
-                self._sync_store_tags(app.appid, app.store_tags)
+        Returns the appids whose relation writes failed. The tables are
+        independent, so their batch writes run concurrently and the batch costs
+        the slowest round-trips instead of the sum of all of them. Steam Deck
+        and DLC failures are logged but, as before, do not block the sync
+        status update.
+        """
+        results = self._run_concurrently(
+            [
+                lambda: self._sync_categories_batch(apps),
+                lambda: self._sync_genres_batch(apps),
+                lambda: self._sync_store_tags_batch(apps, now),
+                lambda: self._sync_franchises_batch(apps),
+                lambda: self._upsert_steam_deck_batch(apps, now),
+                lambda: self._sync_dlc_relationships_batch(apps),
+            ]
+        )
 
-                # Franchises from associations
-                franchises = [a for a in app.associations if a.type == "franchise"]
-                for franchise in franchises:
-                    self._upsert_franchise_link(app.appid, franchise.name)
+        failed_appids: Set[int] = set()
+        for relation_failed_appids in results:
+            if relation_failed_appids:
+                failed_appids |= relation_failed_appids
+        return failed_appids
 
-                # DLC relationships (from listofdlc field)
-                if app.dlc_appids:
-                    self._sync_dlc_relationships(app.appid, app.dlc_appids)
+    def _run_concurrently(self, operations: List[Callable[[], T]]) -> List[T]:
+        """Run independent database calls, bounded by PICS_RELATION_SYNC_WORKERS.
 
-                # Mark as successfully processed
-                processed_appids.append(app.appid)
+        Results are returned in the order of operations. With one worker the
+        calls run sequentially on the calling thread.
+        """
+        workers = max(1, min(settings.pics_relation_sync_workers, len(operations)))
+        if workers == 1:
+            return [operation() for operation in operations]
 
-            except Exception as e:
-                logger.error(f"Failed to sync relationships for app {app.appid}: {e}")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda operation: operation(), operations))
 
-        # Batch update sync status only for successfully processed apps
-        if processed_appids:
-            self._batch_update_sync_status(processed_appids, trigger_cursor=trigger_cursor)
+    def _run_write_with_retries(self, operation_name: str, operation: Callable[[], T]) -> T:
+        """Run an idempotent latest-state write, retrying transient failures with backoff.
 
-    def _upsert_steam_deck(self, appid: int, deck: "SteamDeckCompatibility"):
-        """Upsert Steam Deck compatibility data."""
-        category_map = {0: "unknown", 1: "unsupported", 2: "playable", 3: "verified"}
-        record = {
-            "category": category_map.get(deck.category, "unknown"),
+        Non-transient errors, and the last transient one, are re-raised so the
+        caller's fallback still runs.
+        """
+        for attempt in range(1, self.WRITE_MAX_RETRIES):
+            try:
+                return operation()
+            except Exception as error:
+                if not self._is_history_transient_error(error):
+                    raise
+
+                logger.warning(
+                    "Retrying PICS %s after transient failure (%s/%s): %s",
+                    operation_name,
+                    attempt,
+                    self.WRITE_MAX_RETRIES,
+                    error,
+                )
+                time.sleep(self.WRITE_RETRY_DELAY_SECONDS * attempt)
+
+        return operation()
+
+    def _run_relation_batch(
+        self,
+        relation_name: str,
+        apps: List[ExtractedPICSData],
+        batch_operation: Callable[[], None],
+        single_operation: Callable[[ExtractedPICSData], bool],
+    ) -> Set[int]:
+        """Run a batch relation write, falling back to per-app writes when it fails.
+
+        Returns the appids whose relation write still failed after the fallback.
+        """
+        try:
+            self._run_write_with_retries(f"{relation_name} batch", batch_operation)
+            return set()
+        except Exception as e:
+            logger.error(f"Failed to sync {relation_name} for batch of {len(apps)} apps: {e}")
+
+        if len(apps) == 1:
+            return {apps[0].appid}
+
+        logger.warning(
+            "Retrying %s PICS %s syncs individually after batch failure",
+            len(apps),
+            relation_name,
+        )
+        return {app.appid for app in apps if not single_operation(app)}
+
+    def _build_steam_deck_record(
+        self, deck: SteamDeckCompatibility, updated_at: str
+    ) -> Dict[str, Any]:
+        """Build an app_steam_deck row (without appid) from PICS deck data."""
+        return {
+            "category": STEAM_DECK_CATEGORY_MAP.get(deck.category, "unknown"),
             "test_timestamp": (
-                datetime.fromtimestamp(deck.test_timestamp).isoformat()
-                if deck.test_timestamp
-                else None
+                _deck_test_timestamp_iso(deck.test_timestamp) if deck.test_timestamp else None
             ),
             "tested_build_id": deck.tested_build_id,
             "tests": deck.tests,
-            "updated_at": datetime.utcnow().isoformat(),
+            "updated_at": updated_at,
         }
 
+    def _upsert_steam_deck_batch(self, apps: List[ExtractedPICSData], now: str):
+        """Upsert Steam Deck compatibility data for a batch, falling back per app on failure."""
+        deck_apps = [app for app in apps if app.steam_deck]
+        if not deck_apps:
+            return
+
+        chunk_size = max(1, settings.pics_junction_upsert_batch_size)
+        for i in range(0, len(deck_apps), chunk_size):
+            chunk = deck_apps[i:i + chunk_size]
+            records = [
+                {"appid": app.appid, **self._build_steam_deck_record(app.steam_deck, now)}
+                for app in chunk
+            ]
+
+            try:
+                if self._tiger_latest_state_store is not None:
+                    self._tiger_latest_state_store.upsert_steam_deck_batch(records)
+                else:
+                    self._db.client.table("app_steam_deck").upsert(
+                        records, on_conflict="appid"
+                    ).execute()
+            except Exception as e:
+                logger.error(
+                    f"Failed to upsert Steam Deck data for batch of {len(chunk)} apps: {e}"
+                )
+                if len(chunk) == 1:
+                    continue
+                logger.warning(
+                    "Retrying %s Steam Deck upserts individually after batch failure",
+                    len(chunk),
+                )
+                for app in chunk:
+                    self._upsert_steam_deck(app.appid, app.steam_deck, now=now)
+
+    def _upsert_steam_deck(
+        self, appid: int, deck: SteamDeckCompatibility, now: Optional[str] = None
+    ):
+        """Upsert Steam Deck compatibility data."""
+        record = self._build_steam_deck_record(deck, now or _utc_now_iso())
+
         try:
             if self._tiger_latest_state_store is not None:
                 self._tiger_latest_state_store.upsert_steam_deck(appid, record)
@@ -1083,37 +1608,144 @@ class PICSDatabase:
         except Exception as e:
             logger.error(f"Failed to upsert Steam Deck data for {appid}: {e}")
 
-    def _sync_categories(self, appid: int, categories: Dict[int, bool]):
+    def _build_category_rows(
+        self, categories: Dict[int, bool]
+    ) -> tuple[List[int], List[Dict[str, Any]]]:
+        """Build enabled category ids and their steam_categories lookup rows."""
+        enabled_cat_ids = sorted(
+            {cat_id for cat_id, enabled in (categories or {}).items() if enabled}
+        )
+        cat_records = [
+            {"category_id": cat_id, "name": _category_name(cat_id)}
+            for cat_id in enabled_cat_ids
+        ]
+        return enabled_cat_ids, cat_records
+
+    def _build_genre_rows(self, genres: List[int]) -> tuple[List[int], List[Dict[str, Any]]]:
+        """Build ordered genre ids and their steam_genres lookup rows."""
+        desired_genres = list(
+            dict.fromkeys(genre_id for genre_id in (genres or []) if genre_id is not None)
+        )
+        genre_records = [
+            {"genre_id": genre_id, "name": _genre_name(genre_id)}
+            for genre_id in desired_genres
+        ]
+        return desired_genres, genre_records
+
+    def _build_store_tag_rows(
+        self, tag_ids: List[int], now: str
+    ) -> tuple[List[int], List[Dict[str, Any]]]:
+        """Build ranked store tag ids and their steam_tags lookup rows."""
+        ordered_tag_ids = list(
+            dict.fromkeys(tag_id for tag_id in (tag_ids or []) if tag_id is not None)
+        )
+        get_cached_name = self._get_tag_names().get
+        tag_records = [
+            {
+                "tag_id": tag_id,
+                "name": get_cached_name(tag_id) or _tag_placeholder_name(tag_id),
+                "updated_at": now,
+            }
+            for tag_id in ordered_tag_ids
+        ]
+        return ordered_tag_ids, tag_records
+
+    def _filter_new_lookup_records(
+        self,
+        table_name: str,
+        key_name: str,
+        records: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Drop lookup rows this process already upserted with the same name."""
+        known_names = self._upserted_lookup_names[table_name]
+        return [record for record in records if known_names.get(record[key_name]) != record["name"]]
+
+    def _remember_lookup_records(
+        self, table_name: str, key_name: str, records: List[Dict[str, Any]]
+    ) -> None:
+        """Record lookup rows that were persisted so later batches can skip them."""
+        known_names = self._upserted_lookup_names[table_name]
+        for record in records:
+            known_names[record[key_name]] = record["name"]
+
+    def _sync_categories(self, appid: int, categories: Dict[int, bool]) -> bool:
         """Sync app categories."""
         try:
-            enabled_cat_ids = sorted({cat_id for cat_id, enabled in (categories or {}).items() if enabled})
-            cat_records = [
-                {"category_id": cat_id, "name": CATEGORY_NAMES.get(cat_id, f"Category {cat_id}")}
-                for cat_id in enabled_cat_ids
-            ]
+            enabled_cat_ids, cat_records = self._build_category_rows(categories)
+            cat_records = self._filter_new_lookup_records(
+                "steam_categories", "category_id", cat_records
+            )
 
             if self._tiger_latest_state_store is not None:
                 self._tiger_latest_state_store.replace_categories(appid, cat_records, enabled_cat_ids)
-                return
+                self._remember_lookup_records("steam_categories", "category_id", cat_records)
+                return True
 
-            if enabled_cat_ids:
+            if cat_records:
                 self._db.client.table("steam_categories").upsert(cat_records, on_conflict="category_id").execute()
+                self._remember_lookup_records("steam_categories", "category_id", cat_records)
 
             self._db.client.rpc(
                 "replace_app_categories",
                 {"p_appid": appid, "p_category_ids": enabled_cat_ids},
             ).execute()
+            return True
         except Exception as e:
             logger.error(f"Failed to sync categories for {appid}: {e}")
+            return False
 
-    def _sync_genres(self, appid: int, genres: List[int], primary_genre: Optional[int]):
+    def _sync_categories_batch(self, apps: List[ExtractedPICSData]) -> Set[int]:
+        """Sync categories for a batch of apps with one lookup upsert and one replace call."""
+        category_ids_by_appid: Dict[int, List[int]] = {}
+        lookup_records: Dict[int, Dict[str, Any]] = {}
+
+        for app in apps:
+            enabled_cat_ids, cat_records = self._build_category_rows(app.categories)
+            category_ids_by_appid[app.appid] = enabled_cat_ids
+            lookup_records.update((record["category_id"], record) for record in cat_records)
+
+        cat_records = self._filter_new_lookup_records(
+            "steam_categories",
+            "category_id",
+            list(lookup_records.values()),
+        )
+
+        def replace_batch() -> None:
+            if self._tiger_latest_state_store is not None:
+                self._tiger_latest_state_store.replace_categories_batch(
+                    cat_records, category_ids_by_appid
+                )
+                self._remember_lookup_records("steam_categories", "category_id", cat_records)
+                return
+
+            if cat_records:
+                self._db.client.table("steam_categories").upsert(cat_records, on_conflict="category_id").execute()
+                self._remember_lookup_records("steam_categories", "category_id", cat_records)
+
+            self._db.client.rpc(
+                "replace_app_categories_batch",
+                {
+                    "p_records": [
+                        {"appid": appid, "category_ids": category_ids}
+                        for appid, category_ids in category_ids_by_appid.items()
+                    ]
+                },
+            ).execute()
+
+        return self._run_relation_batch(
+            "categories",
+            apps,
+            replace_batch,
+            lambda app: self._sync_categories(app.appid, app.categories),
+        )
+
+    def _sync_genres(self, appid: int, genres: List[int], primary_genre: Optional[int]) -> bool:
         """Sync app genres."""
         try:
-            desired_genres = list(dict.fromkeys(genre_id for genre_id in (genres or []) if genre_id is not None))
-            genre_records = [
-                {"genre_id": genre_id, "name": GENRE_NAMES.get(genre_id, f"Genre {genre_id}")}
-                for genre_id in desired_genres
-            ]
+            desired_genres, genre_records = self._build_genre_rows(genres)
+            genre_records = self._filter_new_lookup_records(
+                "steam_genres", "genre_id", genre_records
+            )
 
             if self._tiger_latest_state_store is not None:
                 self._tiger_latest_state_store.replace_genres(
@@ -1122,10 +1754,12 @@ class PICSDatabase:
                     desired_genres,
                     primary_genre,
                 )
-                return
+                self._remember_lookup_records("steam_genres", "genre_id", genre_records)
+                return True
 
-            if desired_genres:
+            if genre_records:
                 self._db.client.table("steam_genres").upsert(genre_records, on_conflict="genre_id").execute()
+                self._remember_lookup_records("steam_genres", "genre_id", genre_records)
 
             self._db.client.rpc(
                 "replace_app_genres",
@@ -1135,43 +1769,130 @@ class PICSDatabase:
                     "p_primary_genre_id": primary_genre,
                 },
             ).execute()
+            return True
         except Exception as e:
             logger.error(f"Failed to sync genres for {appid}: {e}")
+            return False
+
+    def _sync_genres_batch(self, apps: List[ExtractedPICSData]) -> Set[int]:
+        """Sync genres for a batch of apps with one lookup upsert and one replace call."""
+        genres_by_appid: Dict[int, tuple[List[int], Optional[int]]] = {}
+        lookup_records: Dict[int, Dict[str, Any]] = {}
+
+        for app in apps:
+            desired_genres, genre_records = self._build_genre_rows(app.genres)
+            genres_by_appid[app.appid] = (desired_genres, app.primary_genre)
+            lookup_records.update((record["genre_id"], record) for record in genre_records)
+
+        genre_records = self._filter_new_lookup_records(
+            "steam_genres", "genre_id", list(lookup_records.values())
+        )
+
+        def replace_batch() -> None:
+            if self._tiger_latest_state_store is not None:
+                self._tiger_latest_state_store.replace_genres_batch(genre_records, genres_by_appid)
+                self._remember_lookup_records("steam_genres", "genre_id", genre_records)
+                return
+
+            if genre_records:
+                self._db.client.table("steam_genres").upsert(genre_records, on_conflict="genre_id").execute()
+                self._remember_lookup_records("steam_genres", "genre_id", genre_records)
 
-    def _sync_store_tags(self, appid: int, tag_ids: List[int]):
+            self._db.client.rpc(
+                "replace_app_genres_batch",
+                {
+                    "p_records": [
+                        {"appid": appid, "genre_ids": genre_ids, "primary_genre_id": primary_genre}
+                        for appid, (genre_ids, primary_genre) in genres_by_appid.items()
+                    ]
+                },
+            ).execute()
+
+        return self._run_relation_batch(
+            "genres",
+            apps,
+            replace_batch,
+            lambda app: self._sync_genres(app.appid, app.genres, app.primary_genre),
+        )
+
+    def _sync_store_tags(self, appid: int, tag_ids: List[int], now: Optional[str] = None) -> bool:
         """Sync store tags for an app."""
         try:
-            ordered_tag_ids = list(dict.fromkeys(tag_id for tag_id in (tag_ids or []) if tag_id is not None))
-
-            if ordered_tag_ids:
-                now = datetime.utcnow().isoformat()
-                tag_records = [
-                    {"tag_id": tag_id, "name": self._get_tag_name(tag_id), "updated_at": now}
-                    for tag_id in ordered_tag_ids
-                ]
-            else:
-                tag_records = []
+            ordered_tag_ids, tag_records = self._build_store_tag_rows(
+                tag_ids, now or _utc_now_iso()
+            )
+            tag_records = self._filter_new_lookup_records("steam_tags", "tag_id", tag_records)
 
             if self._tiger_latest_state_store is not None:
                 self._tiger_latest_state_store.replace_store_tags(appid, tag_records, ordered_tag_ids)
-                return
+                self._remember_lookup_records("steam_tags", "tag_id", tag_records)
+                return True
 
-            if ordered_tag_ids:
+            if tag_records:
                 self._db.client.table("steam_tags").upsert(tag_records, on_conflict="tag_id").execute()
+                self._remember_lookup_records("steam_tags", "tag_id", tag_records)
 
             self._db.client.rpc(
                 "replace_app_steam_tags",
                 {"p_appid": appid, "p_tag_ids": ordered_tag_ids},
             ).execute()
+            return True
         except Exception as e:
             logger.error(f"Failed to sync store tags for {appid}: {e}")
+            return False
+
+    def _sync_store_tags_batch(
+        self, apps: List[ExtractedPICSData], now: Optional[str] = None
+    ) -> Set[int]:
+        """Sync store tags for a batch of apps with one lookup upsert and one replace call."""
+        tag_ids_by_appid: Dict[int, List[int]] = {}
+        lookup_records: Dict[int, Dict[str, Any]] = {}
+        now = now or _utc_now_iso()
+
+        for app in apps:
+            ordered_tag_ids, tag_records = self._build_store_tag_rows(app.store_tags, now)
+            tag_ids_by_appid[app.appid] = ordered_tag_ids
+            lookup_records.update((record["tag_id"], record) for record in tag_records)
+
+        tag_records = self._filter_new_lookup_records(
+            "steam_tags", "tag_id", list(lookup_records.values())
+        )
+
+        def replace_batch() -> None:
+            if self._tiger_latest_state_store is not None:
+                self._tiger_latest_state_store.replace_store_tags_batch(
+                    tag_records, tag_ids_by_appid
+                )
+                self._remember_lookup_records("steam_tags", "tag_id", tag_records)
+                return
 
-    def _upsert_franchise_link(self, appid: int, franchise_name: str):
+            if tag_records:
+                self._db.client.table("steam_tags").upsert(tag_records, on_conflict="tag_id").execute()
+                self._remember_lookup_records("steam_tags", "tag_id", tag_records)
+
+            self._db.client.rpc(
+                "replace_app_steam_tags_batch",
+                {
+                    "p_records": [
+                        {"appid": appid, "tag_ids": tag_ids}
+                        for appid, tag_ids in tag_ids_by_appid.items()
+                    ]
+                },
+            ).execute()
+
+        return self._run_relation_batch(
+            "store tags",
+            apps,
+            replace_batch,
+            lambda app: self._sync_store_tags(app.appid, app.store_tags, now=now),
+        )
+
+    def _upsert_franchise_link(self, appid: int, franchise_name: str) -> bool:
         """Create/update franchise and link to app."""
         try:
             if self._tiger_latest_state_store is not None:
                 self._tiger_latest_state_store.upsert_franchise_link(appid, franchise_name)
-                return
+                return True
 
             # Upsert franchise
             result = self._db.client.rpc("upsert_franchise", {"p_name": franchise_name}).execute()
@@ -1183,8 +1904,171 @@ class PICSDatabase:
                     {"appid": appid, "franchise_id": franchise_id},
                     on_conflict="appid,franchise_id",
                 ).execute()
+            return True
         except Exception as e:
             logger.error(f"Failed to link franchise {franchise_name} to {appid}: {e}")
+            return False
+
+    def _sync_franchises_batch(self, apps: List[ExtractedPICSData]) -> Set[int]:
+        """Upsert every franchise referenced by the batch and link apps in one pass."""
+        franchise_links: List[Tuple[int, str]] = []
+        franchise_apps: List[ExtractedPICSData] = []
+
+        for app in apps:
+            franchises = app.associations_by_type.get("franchise")
+            if franchises:
+                franchise_links.extend((app.appid, association.name) for association in franchises)
+                franchise_apps.append(app)
+
+        if not franchise_links:
+            return set()
+
+        def link_batch() -> None:
+            if self._tiger_latest_state_store is not None:
+                self._tiger_latest_state_store.upsert_franchise_links_batch(franchise_links)
+                return
+
+            # upsert_franchises_bulk trims names the same way upsert_franchise does
+            names = list(dict.fromkeys(name.strip(" ") for _, name in franchise_links))
+            result = self._db.client.rpc("upsert_franchises_bulk", {"p_names": names}).execute()
+            franchise_ids = {row["name"]: row["id"] for row in result.data or []}
+
+            link_records: Dict[Tuple[int, int], Dict[str, int]] = {}
+            for appid, name in franchise_links:
+                franchise_id = franchise_ids.get(name.strip(" "))
+                if franchise_id:
+                    link_records[(appid, franchise_id)] = {
+                        "appid": appid,
+                        "franchise_id": franchise_id,
+                    }
+
+            if link_records:
+                self._db.client.table("app_franchises").upsert(
+                    list(link_records.values()),
+                    on_conflict="appid,franchise_id",
+                ).execute()
+
+        return self._run_relation_batch(
+            "franchises",
+            franchise_apps,
+            link_batch,
+            lambda app: all(
+                [
+                    self._upsert_franchise_link(app.appid, association.name)
+                    for association in app.associations_by_type.get("franchise", ())
+                ]
+            ),
+        )
+
+    def _normalize_dlc_appids(self, parent_appid: int, dlc_appids: List[int]) -> List[int]:
+        """Drop invalid, duplicate, and self-referencing DLC appids."""
+        return sorted(
+            {int(dlc_id) for dlc_id in (dlc_appids or []) if isinstance(dlc_id, int) and dlc_id > 0 and dlc_id != parent_appid}
+        )
+
+    def _sync_dlc_relationships_batch(self, apps: List[ExtractedPICSData]):
+        """Seed and link DLC for a batch with one seed RPC and chunked app_dlc upserts."""
+        dlc_appids_by_parent: Dict[int, List[int]] = {}
+        for app in apps:
+            if app.dlc_appids:
+                normalized_dlc_appids = self._normalize_dlc_appids(app.appid, app.dlc_appids)
+                if normalized_dlc_appids:
+                    dlc_appids_by_parent[app.appid] = normalized_dlc_appids
+
+        if not dlc_appids_by_parent:
+            return
+
+        try:
+            if self._tiger_latest_state_store is not None:
+                self._run_write_with_retries(
+                    "DLC batch",
+                    lambda: self._tiger_latest_state_store.sync_dlc_relationships_batch(
+                        dlc_appids_by_parent
+                    ),
+                )
+            else:
+                self._write_dlc_relationships_batch(dlc_appids_by_parent)
+            logger.info(
+                f"Synced {sum(len(ids) for ids in dlc_appids_by_parent.values())} "
+                f"DLC relationships for {len(dlc_appids_by_parent)} apps"
+            )
+            return
+        except Exception as e:
+            logger.error(
+                f"Failed to sync DLC relationships for batch of "
+                f"{len(dlc_appids_by_parent)} apps: {e}"
+            )
+
+        if len(dlc_appids_by_parent) == 1:
+            return
+
+        logger.warning(
+            "Retrying %s PICS DLC syncs individually after batch failure",
+            len(dlc_appids_by_parent),
+        )
+        for parent_appid, dlc_appids in dlc_appids_by_parent.items():
+            self._sync_dlc_relationships(parent_appid, dlc_appids)
+
+    def _write_dlc_relationships_batch(self, dlc_appids_by_parent: Dict[int, List[int]]):
+        """Seed every referenced DLC app once, then upsert the app_dlc links in chunks."""
+        dlc_appids = sorted({dlc_id for ids in dlc_appids_by_parent.values() for dlc_id in ids})
+        self._run_write_with_retries(
+            "DLC seed",
+            lambda: self._db.client.rpc(
+                "seed_discovered_apps",
+                {
+                    "p_records": [
+                        {
+                            "appid": dlc_id,
+                            "app_type": "dlc",
+                            "discovery_reason": "pics_dlc_reference",
+                        }
+                        for dlc_id in dlc_appids
+                    ]
+                },
+            ).execute(),
+        )
+
+        records = [
+            {"parent_appid": parent_appid, "dlc_appid": dlc_id, "source": "pics"}
+            for parent_appid, ids in dlc_appids_by_parent.items()
+            for dlc_id in ids
+        ]
+        self._upsert_rows_in_chunks(
+            "DLC link upsert", "app_dlc", records, on_conflict="parent_appid,dlc_appid"
+        )
+
+    def _upsert_rows_in_chunks(
+        self,
+        operation_name: str,
+        table: str,
+        rows: List[Dict[str, Any]],
+        on_conflict: str,
+    ):
+        """Upsert rows in junction-sized chunks, halving any chunk rejected as too large."""
+        chunk_size = max(1, settings.pics_junction_upsert_batch_size)
+        pending = [rows[i : i + chunk_size] for i in range(0, len(rows), chunk_size)]
+
+        while pending:
+            chunk = pending.pop(0)
+            try:
+                self._run_write_with_retries(
+                    operation_name,
+                    lambda: self._db.client.table(table)
+                    .upsert(chunk, on_conflict=on_conflict)
+                    .execute(),
+                )
+            except Exception as error:
+                if len(chunk) == 1 or not self._is_payload_too_large_error(error):
+                    raise
+
+                midpoint = len(chunk) // 2
+                logger.warning(
+                    "Splitting PICS %s of %s rows after payload-too-large response",
+                    operation_name,
+                    len(chunk),
+                )
+                pending[:0] = [chunk[:midpoint], chunk[midpoint:]]
 
     def _sync_dlc_relationships(self, parent_appid: int, dlc_appids: List[int]):
         """Sync DLC relationships from PICS listofdlc field to junction table.
@@ -1193,9 +2077,7 @@ class PICSDatabase:
         relationships to be stored even when DLC apps don't exist yet.
         This handles the case where processing order is unpredictable.
         """
-        normalized_dlc_appids = sorted(
-            {int(dlc_id) for dlc_id in (dlc_appids or []) if isinstance(dlc_id, int) and dlc_id > 0 and dlc_id != parent_appid}
-        )
+        normalized_dlc_appids = self._normalize_dlc_appids(parent_appid, dlc_appids)
 
         if not normalized_dlc_appids:
             return
@@ -1235,42 +2117,29 @@ class PICSDatabase:
         except Exception as e:
             logger.error(f"Failed to sync DLC relationships for {parent_appid}: {e}")
 
-    def _update_sync_status(self, appid: int, trigger_cursor: Optional[str] = None):
-        """Update sync status for an app."""
-        try:
-            if self._tiger_latest_state_store is not None:
-                self._tiger_latest_state_store.update_sync_status([appid], trigger_cursor)
-                return
-
-            self._db.client.table("sync_status").upsert(
-                {
-                    "appid": appid,
-                    "last_pics_sync": datetime.utcnow().isoformat(),
-                    **({"pics_change_number": int(trigger_cursor)} if trigger_cursor else {}),
-                },
-                on_conflict="appid",
-            ).execute()
-        except Exception as e:
-            logger.error(f"Failed to update sync status for {appid}: {e}")
-
-    def _batch_update_sync_status(self, appids: List[int], trigger_cursor: Optional[str] = None):
+    def _batch_update_sync_status(
+        self,
+        appids: List[int],
+        trigger_cursor: Optional[str] = None,
+        now: Optional[str] = None,
+    ):
         """Batch update sync status for multiple apps."""
         if not appids:
             return
 
         if self._tiger_latest_state_store is not None:
-            try:
-                self._tiger_latest_state_store.update_sync_status(appids, trigger_cursor)
-                logger.debug(f"Updated Tiger sync status for {len(appids)} apps")
-            except Exception as e:
-                logger.error(f"Failed to batch update Tiger sync status ({len(appids)} apps): {e}")
+            self._write_sync_status_bisecting(
+                appids,
+                lambda batch: self._tiger_latest_state_store.update_sync_status(
+                    batch, trigger_cursor
+                ),
+            )
             return
 
-        now = datetime.utcnow().isoformat()
+        now = now or _utc_now_iso()
         batch_size = 500  # Supabase batch limit
 
-        for i in range(0, len(appids), batch_size):
-            batch = appids[i : i + batch_size]
+        def upsert_batch(batch: List[int]) -> None:
             records = [
                 {
                     "appid": appid,
@@ -1279,18 +2148,37 @@ class PICSDatabase:
                 }
                 for appid in batch
             ]
+            self._db.client.table("sync_status").upsert(records, on_conflict="appid").execute()
 
-            try:
-                self._db.client.table("sync_status").upsert(
-                    records,
-                    on_conflict="appid",
-                ).execute()
-                logger.debug(f"Updated sync status for {len(batch)} apps")
-            except Exception as e:
-                logger.error(f"Failed to batch update sync status ({len(batch)} apps): {e}")
-                # Fallback to individual updates for this batch
-                for appid in batch:
-                    self._update_sync_status(appid, trigger_cursor=trigger_cursor)
+        for i in range(0, len(appids), batch_size):
+            self._write_sync_status_bisecting(appids[i : i + batch_size], upsert_batch)
+
+    def _write_sync_status_bisecting(self, appids: List[int], write: Callable[[List[int]], None]):
+        """Write sync status, halving a batch rejected for its data until the bad rows are isolated.
+
+        Transient failures are retried as a whole and then dropped rather than
+        bisected, since splitting cannot help when the database is unreachable.
+        """
+        try:
+            self._run_write_with_retries("sync status update", lambda: write(appids))
+            logger.debug(f"Updated sync status for {len(appids)} apps")
+            return
+        except Exception as e:
+            if len(appids) == 1:
+                logger.error(f"Failed to update sync status for {appids[0]}: {e}")
+                return
+            if self._is_history_transient_error(e):
+                logger.error(f"Failed to batch update sync status ({len(appids)} apps): {e}")
+                return
+            logger.warning(
+                "Bisecting PICS sync status update of %s apps after batch failure: %s",
+                len(appids),
+                e,
+            )
+
+        midpoint = len(appids) // 2
+        self._write_sync_status_bisecting(appids[:midpoint], write)
+        self._write_sync_status_bisecting(appids[midpoint:], write)
 
     def _infer_type(self, app: ExtractedPICSData) -> str:
         """Infer app type when PICS doesn't provide it.
@@ -1307,27 +2195,15 @@ class PICSDatabase:
         if app.name:
             name_lower = app.name.lower()
 
-            # Demo patterns (but not "Demon", "Democracy", etc.)
-            if (
-                " demo" in name_lower
-                or name_lower.endswith(" demo")
-                or "(demo)" in name_lower
-                or "[demo]" in name_lower
-            ):
-                if not any(x in name_lower for x in ["demon", "democracy", "demolition"]):
+            # Demo patterns (but not "Demon", "Democracy", etc.). " demo" also covers
+            # names ending in " demo".
+            if any(x in name_lower for x in _DEMO_NAME_PATTERNS):
+                if not any(x in name_lower for x in _DEMO_NAME_EXCLUSIONS):
                     return "demo"
 
-            # Music/Soundtrack patterns
-            if any(x in name_lower for x in ["soundtrack", " ost", "original score", "music pack"]):
-                return "music"
-
-            # Tool patterns
-            if any(x in name_lower for x in [" sdk", "dedicated server", "level editor", "modding tool"]):
-                return "tool"
-
-            # Video patterns
-            if any(x in name_lower for x in ["trailer", "- video", "making of", "behind the scenes"]):
-                return "video"
+            for inferred_type, patterns in _INFERRED_TYPE_NAME_PATTERNS:
+                if any(x in name_lower for x in patterns):
+                    return inferred_type
 
         return "game"  # Default fallback
 
@@ -1335,21 +2211,7 @@ class PICSDatabase:
         """Map PICS type to database enum."""
         if not pics_type:
             return "game"
-        type_map = {
-            "game": "game",
-            "dlc": "dlc",
-            "demo": "demo",
-            "mod": "mod",
-            "video": "video",
-            "tool": "tool",
-            "application": "application",
-            "hardware": "hardware",
-            "music": "music",
-            "episode": "episode",
-            "series": "series",
-            "advertising": "advertising",
-        }
-        return type_map.get(pics_type.lower(), "game")
+        return _app_type_for(pics_type)
 
     def get_all_app_ids(self, unsynced_only: bool = False) -> List[int]:
         """Get list of app IDs from database.
@@ -1357,11 +2219,24 @@ class PICSDatabase:
         Args:
             unsynced_only: If True, only return apps that haven't been PICS synced yet.
         """
+        all_appids: List[int] = []
+        for appids in self._iter_app_id_pages(unsynced_only):
+            all_appids.extend(appids)
+            if unsynced_only:
+                logger.info(f"Fetched {len(appids)} unsynced app IDs (total: {len(all_appids)})")
+
         if unsynced_only:
-            # Paginate through unsynced apps (Supabase limits to 1000 per request)
-            return self._get_unsynced_app_ids_paginated()
-        else:
-            return self._get_all_app_ids_paginated()
+            logger.info(f"Total unsynced apps to process: {len(all_appids)}")
+        return all_appids
+
+    def iter_all_app_ids(self, unsynced_only: bool = False) -> Iterator[int]:
+        """Stream app IDs from the database page by page instead of building one list.
+
+        Args:
+            unsynced_only: If True, only yield apps that haven't been PICS synced yet.
+        """
+        for appids in self._iter_app_id_pages(unsynced_only):
+            yield from appids
 
     def get_first_pass_app_ids(
         self,
@@ -1424,82 +2299,46 @@ class PICSDatabase:
         )
         return selected
 
-    def _get_unsynced_app_ids_paginated(self) -> List[int]:
-        """Get all unsynced app IDs with cursor-based pagination."""
-        all_appids = []
-        page_size = 1000  # Supabase hard limit
-        last_appid = 0
+    def _iter_app_id_pages(self, unsynced_only: bool) -> Iterator[List[int]]:
+        """Yield appid pages in ascending order with cursor-based pagination.
 
-        while True:
-            try:
-                if self._tiger_latest_state_store is not None:
-                    appids = self._tiger_latest_state_store.get_unsynced_app_ids_after(last_appid, page_size)
-                else:
-                    # Use cursor-based pagination (gt) instead of offset/range
-                    # Supabase caps range() at 1000 rows regardless of what you specify
-                    result = (
-                        self._db.client.table("sync_status")
-                        .select("appid")
-                        .is_("last_pics_sync", "null")
-                        .gt("appid", last_appid)
-                        .order("appid")
-                        .limit(page_size)
-                        .execute()
-                    )
-                    appids = [r["appid"] for r in result.data]
-
-                if not appids:
-                    break
-
-                all_appids.extend(appids)
-                last_appid = appids[-1]  # Cursor for next page
-                logger.info(f"Fetched {len(appids)} unsynced app IDs (total: {len(all_appids)})")
-
-                if len(appids) < page_size:
-                    break
-
-            except Exception as e:
-                logger.error(f"Failed to fetch unsynced app IDs after appid {last_appid}: {e}")
-                break
-
-        logger.info(f"Total unsynced apps to process: {len(all_appids)}")
-        return all_appids
-
-    def _get_all_app_ids_paginated(self) -> List[int]:
-        """Get all app IDs with cursor-based pagination."""
-        all_appids = []
-        page_size = 1000  # Supabase hard limit
+        Each page is fetched only when the previous one has been consumed.
+        """
+        page_size = self.APP_ID_PAGE_SIZE
         last_appid = 0
+        label = "unsynced app IDs" if unsynced_only else "app IDs"
 
         while True:
             try:
                 if self._tiger_latest_state_store is not None:
-                    appids = self._tiger_latest_state_store.get_all_app_ids_after(last_appid, page_size)
+                    if unsynced_only:
+                        appids = self._tiger_latest_state_store.get_unsynced_app_ids_after(
+                            last_appid, page_size
+                        )
+                    else:
+                        appids = self._tiger_latest_state_store.get_all_app_ids_after(
+                            last_appid, page_size
+                        )
                 else:
-                    result = (
-                        self._db.client.table("apps")
-                        .select("appid")
-                        .gt("appid", last_appid)
-                        .order("appid")
-                        .limit(page_size)
-                        .execute()
-                    )
-                    appids = [r["appid"] for r in result.data]
-
-                if not appids:
-                    break
-
-                all_appids.extend(appids)
-                last_appid = appids[-1]
+                    # The RPC returns each cursor page as one int[] value, which avoids
+                    # PostgREST's 1000-row cap and per-row JSON objects
+                    result = self._db.client.rpc(
+                        "get_unsynced_pics_app_ids_after" if unsynced_only else "get_app_ids_after",
+                        {"p_last_appid": last_appid, "p_limit": page_size},
+                    ).execute()
+                    appids = [int(appid) for appid in result.data or []]
+            except Exception as e:
+                logger.error(f"Failed to fetch {label} after appid {last_appid}: {e}")
+                return
 
-                if len(appids) < page_size:
-                    break
+            if not appids:
+                return
 
-            except Exception as e:
-                logger.error(f"Failed to fetch app IDs after appid {last_appid}: {e}")
-                break
+            yield appids
+            last_appid = appids[-1]  # Cursor for next page
 
-        return all_appids
+            if len(appids) < page_size:
+                return
 
     def get_last_change_number(self) -> int:
         """Get the last processed PICS change number."""
@@ -1537,7 +2376,7 @@ class PICSDatabase:
                 {
                     "id": 1,
                     "last_change_number": change_number,
-                    "updated_at": datetime.utcnow().isoformat(),
+                    "updated_at": _utc_now_iso(),
                 }
             ).execute()
         except Exception as e:
@@ -2,21 +2,111 @@
 
 from __future__ import annotations
 
-import json
 import re
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Sequence, Set
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import orjson
+
+
+def _jsonb_param(value: Any) -> str:
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 def _normalize_name(value: str) -> str:
     return re.sub(r"\s+", " ", value.strip().lower())
 
 
+# legacy.apps columns written by PICS, in insert order, with the types used to
+# decode JSON recordsets and to declare the COPY staging table.
+_APP_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("appid", "integer"),
+    ("name", "text"),
+    ("type", "text"),
+    ("pics_review_score", "smallint"),
+    ("pics_review_percentage", "smallint"),
+    ("controller_support", "text"),
+    ("metacritic_score", "smallint"),
+    ("metacritic_url", "text"),
+    ("platforms", "text"),
+    ("release_state", "text"),
+    ("homepage_url", "text"),
+    ("app_state", "text"),
+    ("last_content_update", "timestamptz"),
+    ("store_asset_mtime", "date"),
+    ("current_build_id", "text"),
+    ("content_descriptors", "jsonb"),
+    ("languages", "jsonb"),
+    ("has_workshop", "boolean"),
+    ("is_free", "boolean"),
+    ("release_date", "date"),
+    ("is_released", "boolean"),
+    ("updated_at", "timestamptz"),
+)
+_APP_JSONB_COLUMNS = frozenset(name for name, type_name in _APP_COLUMNS if type_name == "jsonb")
+_APP_COLUMN_LIST = ", ".join(name for name, _ in _APP_COLUMNS)
+_APP_COLUMN_DEFINITIONS = ", ".join(f"{name} {type_name}" for name, type_name in _APP_COLUMNS)
+_APP_SELECT_LIST = ", ".join(
+    {
+        "type": "COALESCE(type, 'game')",
+        "updated_at": "COALESCE(updated_at, now())",
+    }.get(name, name)
+    for name, _ in _APP_COLUMNS
+)
+_APP_UPSERT_CONFLICT_SQL = """
+                    ON CONFLICT (appid)
+                    DO UPDATE SET
+                      name = EXCLUDED.name,
+                      type = EXCLUDED.type,
+                      pics_review_score = EXCLUDED.pics_review_score,
+                      pics_review_percentage = EXCLUDED.pics_review_percentage,
+                      controller_support = EXCLUDED.controller_support,
+                      metacritic_score = EXCLUDED.metacritic_score,
+                      metacritic_url = EXCLUDED.metacritic_url,
+                      platforms = EXCLUDED.platforms,
+                      release_state = EXCLUDED.release_state,
+                      homepage_url = EXCLUDED.homepage_url,
+                      app_state = EXCLUDED.app_state,
+                      last_content_update = EXCLUDED.last_content_update,
+                      store_asset_mtime = EXCLUDED.store_asset_mtime,
+                      current_build_id = EXCLUDED.current_build_id,
+                      content_descriptors = EXCLUDED.content_descriptors,
+                      languages = EXCLUDED.languages,
+                      has_workshop = EXCLUDED.has_workshop,
+                      is_free = COALESCE(EXCLUDED.is_free, legacy.apps.is_free),
+                      release_date = COALESCE(EXCLUDED.release_date, legacy.apps.release_date),
+                      is_released = COALESCE(EXCLUDED.is_released, legacy.apps.is_released),
+                      updated_at = EXCLUDED.updated_at
+"""
+
+
+def _app_copy_row(record: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Order one app record's values for COPY; omitted keys become NULL."""
+    return tuple(
+        _jsonb_param(record[name])
+        if name in _APP_JSONB_COLUMNS and record.get(name) is not None
+        else record.get(name)
+        for name, _ in _APP_COLUMNS
+    )
+
+
 class TigerPICSLatestStateStore:
     """Postgres writer for PICS latest-state tables in Tiger."""
 
-    def __init__(self, database_url: str):
+    MAX_IDLE_CONNECTIONS = 4
+    # Idle connections older than this are closed instead of reused, so one the
+    # server or a proxy has already dropped is never handed out
+    MAX_IDLE_SECONDS = 60
+    DEFAULT_COPY_MIN_ROWS = 200
+
+    def __init__(self, database_url: str, copy_min_rows: int = DEFAULT_COPY_MIN_ROWS):
         self._database_url = database_url
+        self._copy_min_rows = max(1, copy_min_rows)
+        self._idle_connections: List[Tuple[Any, float]] = []
+        self._idle_lock = threading.Lock()
 
     @classmethod
     def from_settings(cls, settings: Any) -> "TigerPICSLatestStateStore":
@@ -26,7 +116,7 @@ class TigerPICSLatestStateStore:
                 "PICS_LATEST_STATE_TARGET=tiger requires "
                 "PICS_LATEST_STATE_TIGER_URL or TIGER_PRIMARY_URL."
             )
-        return cls(database_url)
+        return cls(database_url, copy_min_rows=settings.pics_app_copy_min_rows)
 
     def _connect(self) -> Any:
         try:
@@ -42,11 +132,98 @@ class TigerPICSLatestStateStore:
             application_name="publisheriq-pics-latest-state",
         )
 
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        """Borrow a pooled connection for one transaction.
+
+        Up to MAX_IDLE_CONNECTIONS idle connections are kept between calls and
+        reused while they have been idle less than MAX_IDLE_SECONDS. The
+        transaction is committed on success and rolled back on error, and
+        broken connections are discarded instead of being returned.
+        """
+        connection = self._take_idle_connection()
+        if connection is None:
+            connection = self._connect()
+
+        try:
+            yield connection
+            connection.commit()
+        except BaseException:
+            try:
+                connection.rollback()
+            except Exception:
+                connection.close()
+            raise
+        finally:
+            self._release_connection(connection)
+
+    def _take_idle_connection(self) -> Optional[Any]:
+        """Pop the most recently released usable connection, closing stale ones."""
+        stale: List[Any] = []
+        connection = None
+        cutoff = time.monotonic() - self.MAX_IDLE_SECONDS
+        with self._idle_lock:
+            while self._idle_connections:
+                candidate, released_at = self._idle_connections.pop()
+                if candidate.closed or released_at < cutoff:
+                    stale.append(candidate)
+                    continue
+                connection = candidate
+                break
+        for candidate in stale:
+            candidate.close()
+        return connection
+
+    def _release_connection(self, connection: Any) -> None:
+        if not connection.closed and not connection.broken:
+            with self._idle_lock:
+                if len(self._idle_connections) < self.MAX_IDLE_CONNECTIONS:
+                    self._idle_connections.append((connection, time.monotonic()))
+                    return
+        connection.close()
+
+    def get_app_sync_state(
+        self,
+        appids: Sequence[int],
+        name_appids: Optional[Sequence[int]] = None,
+    ) -> List[Dict[str, Any]]:
+        if not appids:
+            return []
+
+        name_filter = None if name_appids is None else list({int(appid) for appid in name_appids})
+
+        with self._connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT
+                      a.appid,
+                      CASE
+                        WHEN %s::int[] IS NULL OR a.appid = ANY(%s::int[]) THEN a.name
+                      END AS name,
+                      a.release_date_raw IS NOT NULL AS has_raw_date,
+                      COALESCE(s.last_storefront_sync IS NOT NULL, FALSE) AS has_storefront_sync
+                    FROM legacy.apps a
+                    LEFT JOIN ops.sync_status s ON s.appid = a.appid
+                    WHERE a.appid = ANY(%s::int[])
+                    """,
+                    (name_filter, name_filter, list({int(appid) for appid in appids})),
+                )
+                return [
+                    {
+                        "appid": int(row[0]),
+                        "name": row[1],
+                        "has_raw_date": bool(row[2]),
+                        "has_storefront_sync": bool(row[3]),
+                    }
+                    for row in cursor.fetchall()
+                ]
+
     def get_existing_appids(self, appids: Sequence[int]) -> List[int]:
         if not appids:
             return []
 
-        with self._connect() as connection:
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
                     "SELECT appid FROM legacy.apps WHERE appid = ANY(%s::int[])",
@@ -58,7 +235,7 @@ class TigerPICSLatestStateStore:
         if not appids:
             return {}
 
-        with self._connect() as connection:
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
                     "SELECT appid, name FROM legacy.apps WHERE appid = ANY(%s::int[]) AND name IS NOT NULL",
@@ -70,7 +247,7 @@ class TigerPICSLatestStateStore:
         if not appids:
             return set()
 
-        with self._connect() as connection:
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
                     """
@@ -87,7 +264,7 @@ class TigerPICSLatestStateStore:
         if not appids:
             return set()
 
-        with self._connect() as connection:
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
                     """
@@ -104,89 +281,73 @@ class TigerPICSLatestStateStore:
         if not records:
             return set()
 
-        payload = json.dumps(records, default=str)
-        with self._connect() as connection:
+        if len(records) >= self._copy_min_rows:
+            return self._copy_app_records(records)
+
+        payload = _jsonb_param(records)
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
-                    """
-                    INSERT INTO legacy.apps (
-                      appid, name, type, pics_review_score, pics_review_percentage,
-                      controller_support, metacritic_score, metacritic_url, platforms,
-                      release_state, homepage_url, app_state, last_content_update,
-                      store_asset_mtime, current_build_id, content_descriptors,
-                      languages, has_workshop, is_free, release_date, is_released,
-                      updated_at
-                    )
-                    SELECT
-                      appid, name, COALESCE(type, 'game'), pics_review_score,
-                      pics_review_percentage, controller_support, metacritic_score,
-                      metacritic_url, platforms, release_state, homepage_url,
-                      app_state, last_content_update, store_asset_mtime,
-                      current_build_id, content_descriptors, languages,
-                      has_workshop, is_free, release_date, is_released,
-                      COALESCE(updated_at, now())
-                    FROM jsonb_to_recordset(%s::jsonb) AS app_rows (
-                      appid integer,
-                      name text,
-                      type text,
-                      pics_review_score smallint,
-                      pics_review_percentage smallint,
-                      controller_support text,
-                      metacritic_score smallint,
-                      metacritic_url text,
-                      platforms text,
-                      release_state text,
-                      homepage_url text,
-                      app_state text,
-                      last_content_update timestamptz,
-                      store_asset_mtime date,
-                      current_build_id text,
-                      content_descriptors jsonb,
-                      languages jsonb,
-                      has_workshop boolean,
-                      is_free boolean,
-                      release_date date,
-                      is_released boolean,
-                      updated_at timestamptz
-                    )
-                    ON CONFLICT (appid)
-                    DO UPDATE SET
-                      name = EXCLUDED.name,
-                      type = EXCLUDED.type,
-                      pics_review_score = EXCLUDED.pics_review_score,
-                      pics_review_percentage = EXCLUDED.pics_review_percentage,
-                      controller_support = EXCLUDED.controller_support,
-                      metacritic_score = EXCLUDED.metacritic_score,
-                      metacritic_url = EXCLUDED.metacritic_url,
-                      platforms = EXCLUDED.platforms,
-                      release_state = EXCLUDED.release_state,
-                      homepage_url = EXCLUDED.homepage_url,
-                      app_state = EXCLUDED.app_state,
-                      last_content_update = EXCLUDED.last_content_update,
-                      store_asset_mtime = EXCLUDED.store_asset_mtime,
-                      current_build_id = EXCLUDED.current_build_id,
-                      content_descriptors = EXCLUDED.content_descriptors,
-                      languages = EXCLUDED.languages,
-                      has_workshop = EXCLUDED.has_workshop,
-                      is_free = COALESCE(EXCLUDED.is_free, legacy.apps.is_free),
-                      release_date = COALESCE(EXCLUDED.release_date, legacy.apps.release_date),
-                      is_released = COALESCE(EXCLUDED.is_released, legacy.apps.is_released),
-                      updated_at = EXCLUDED.updated_at
+                    f"""
+                    INSERT INTO legacy.apps ({_APP_COLUMN_LIST})
+                    SELECT {_APP_SELECT_LIST}
+                    FROM jsonb_to_recordset(%s::jsonb) AS app_rows ({_APP_COLUMN_DEFINITIONS})
+                    {_APP_UPSERT_CONFLICT_SQL}
                     """,
                     (payload,),
                 )
 
         return {int(record["appid"]) for record in records}
 
+    def _copy_app_records(self, records: List[Dict[str, Any]]) -> Set[int]:
+        """Stream a large app batch through COPY into a staging table, then upsert it.
+
+        Bulk sync batches skip building and parsing one large JSON document: rows
+        are copied into a transaction-scoped temp table and merged into
+        legacy.apps with a single INSERT ... ON CONFLICT.
+        """
+        with self._connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"CREATE TEMP TABLE pics_app_staging ({_APP_COLUMN_DEFINITIONS}) ON COMMIT DROP"
+                )
+                with cursor.copy(f"COPY pics_app_staging ({_APP_COLUMN_LIST}) FROM STDIN") as copy:
+                    for record in records:
+                        copy.write_row(_app_copy_row(record))
+                cursor.execute(
+                    f"""
+                    INSERT INTO legacy.apps ({_APP_COLUMN_LIST})
+                    SELECT {_APP_SELECT_LIST}
+                    FROM pics_app_staging
+                    ORDER BY appid
+                    {_APP_UPSERT_CONFLICT_SQL}
+                    """
+                )
+
+        return {int(record["appid"]) for record in records}
+
     def upsert_steam_deck(self, appid: int, record: Dict[str, Any]) -> None:
-        with self._connect() as connection:
+        self.upsert_steam_deck_batch([{**record, "appid": appid}])
+
+    def upsert_steam_deck_batch(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
                     """
                     INSERT INTO legacy.app_steam_deck (
                       appid, category, test_timestamp, tested_build_id, tests, updated_at
                     )
-                    VALUES (%s, %s, %s, %s, %s::jsonb, now())
+                    SELECT appid, category, test_timestamp, tested_build_id, tests, now()
+                    FROM jsonb_to_recordset(%s::jsonb) AS rows (
+                      appid integer,
+                      category text,
+                      test_timestamp timestamptz,
+                      tested_build_id text,
+                      tests jsonb
+                    )
                     ON CONFLICT (appid)
                     DO UPDATE SET
                       category = EXCLUDED.category,
@@ -195,17 +356,26 @@ class TigerPICSLatestStateStore:
                       tests = EXCLUDED.tests,
                       updated_at = now()
                     """,
-                    (
-                        appid,
-                        record.get("category"),
-                        record.get("test_timestamp"),
-                        record.get("tested_build_id"),
-                        json.dumps(record.get("tests")),
-                    ),
+                    (_jsonb_param(records),),
                 )
 
     def replace_categories(self, appid: int, category_records: List[Dict[str, Any]], category_ids: List[int]) -> None:
-        with self._connect() as connection:
+        self.replace_categories_batch(category_records, {appid: category_ids})
+
+    def replace_categories_batch(
+        self,
+        category_records: List[Dict[str, Any]],
+        category_ids_by_appid: Dict[int, List[int]],
+    ) -> None:
+        if not category_ids_by_appid:
+            return
+
+        category_rows = [
+            {"appid": appid, "category_id": category_id}
+            for appid, category_ids in category_ids_by_appid.items()
+            for category_id in category_ids
+        ]
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 if category_records:
                     cursor.execute(
@@ -215,21 +385,52 @@ class TigerPICSLatestStateStore:
                         FROM jsonb_to_recordset(%s::jsonb) AS rows (category_id integer, name text)
                         ON CONFLICT (category_id) DO UPDATE SET name = EXCLUDED.name
                         """,
-                        (json.dumps(category_records),),
+                        (_jsonb_param(category_records),),
                     )
-                cursor.execute("DELETE FROM legacy.app_categories WHERE appid = %s", (appid,))
-                if category_ids:
-                    cursor.execute(
-                        """
-                        INSERT INTO legacy.app_categories (appid, category_id)
-                        SELECT %s, unnest(%s::int[])
-                        ON CONFLICT DO NOTHING
-                        """,
-                        (appid, category_ids),
+                cursor.execute(
+                    """
+                    WITH desired AS (
+                      SELECT appid, category_id
+                      FROM jsonb_to_recordset(%s::jsonb) AS rows (
+                        appid integer,
+                        category_id integer
+                      )
+                    ),
+                    removed AS (
+                      DELETE FROM legacy.app_categories existing
+                      WHERE existing.appid = ANY(%s::int[])
+                        AND NOT EXISTS (
+                          SELECT 1
+                          FROM desired
+                          WHERE desired.appid = existing.appid
+                            AND desired.category_id = existing.category_id
+                        )
                     )
+                    INSERT INTO legacy.app_categories (appid, category_id)
+                    SELECT appid, category_id
+                    FROM desired
+                    ON CONFLICT DO NOTHING
+                    """,
+                    (_jsonb_param(category_rows), list(category_ids_by_appid)),
+                )
 
     def replace_genres(self, appid: int, genre_records: List[Dict[str, Any]], genre_ids: List[int], primary_genre_id: Optional[int]) -> None:
-        with self._connect() as connection:
+        self.replace_genres_batch(genre_records, {appid: (genre_ids, primary_genre_id)})
+
+    def replace_genres_batch(
+        self,
+        genre_records: List[Dict[str, Any]],
+        genres_by_appid: Dict[int, Tuple[List[int], Optional[int]]],
+    ) -> None:
+        if not genres_by_appid:
+            return
+
+        genre_rows = [
+            {"appid": appid, "genre_id": genre_id, "is_primary": genre_id == primary_genre_id}
+            for appid, (genre_ids, primary_genre_id) in genres_by_appid.items()
+            for genre_id in genre_ids
+        ]
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 if genre_records:
                     cursor.execute(
@@ -239,23 +440,55 @@ class TigerPICSLatestStateStore:
                         FROM jsonb_to_recordset(%s::jsonb) AS rows (genre_id integer, name text)
                         ON CONFLICT (genre_id) DO UPDATE SET name = EXCLUDED.name
                         """,
-                        (json.dumps(genre_records),),
+                        (_jsonb_param(genre_records),),
                     )
-                cursor.execute("DELETE FROM legacy.app_genres WHERE appid = %s", (appid,))
-                if genre_ids:
-                    cursor.execute(
-                        """
-                        INSERT INTO legacy.app_genres (appid, genre_id, is_primary)
-                        SELECT %s, genre_id, COALESCE(genre_id = %s, false)
-                        FROM unnest(%s::int[]) AS genre_id
-                        ON CONFLICT (appid, genre_id)
-                        DO UPDATE SET is_primary = EXCLUDED.is_primary
-                        """,
-                        (appid, primary_genre_id, genre_ids),
+                cursor.execute(
+                    """
+                    WITH desired AS (
+                      SELECT appid, genre_id, is_primary
+                      FROM jsonb_to_recordset(%s::jsonb) AS rows (
+                        appid integer,
+                        genre_id integer,
+                        is_primary boolean
+                      )
+                    ),
+                    removed AS (
+                      DELETE FROM legacy.app_genres existing
+                      WHERE existing.appid = ANY(%s::int[])
+                        AND NOT EXISTS (
+                          SELECT 1
+                          FROM desired
+                          WHERE desired.appid = existing.appid
+                            AND desired.genre_id = existing.genre_id
+                        )
                     )
+                    INSERT INTO legacy.app_genres (appid, genre_id, is_primary)
+                    SELECT appid, genre_id, is_primary
+                    FROM desired
+                    ON CONFLICT (appid, genre_id)
+                    DO UPDATE SET is_primary = EXCLUDED.is_primary
+                    WHERE legacy.app_genres.is_primary IS DISTINCT FROM EXCLUDED.is_primary
+                    """,
+                    (_jsonb_param(genre_rows), list(genres_by_appid)),
+                )
 
     def replace_store_tags(self, appid: int, tag_records: List[Dict[str, Any]], tag_ids: List[int]) -> None:
-        with self._connect() as connection:
+        self.replace_store_tags_batch(tag_records, {appid: tag_ids})
+
+    def replace_store_tags_batch(
+        self,
+        tag_records: List[Dict[str, Any]],
+        tag_ids_by_appid: Dict[int, List[int]],
+    ) -> None:
+        if not tag_ids_by_appid:
+            return
+
+        tag_rows = [
+            {"appid": appid, "tag_id": tag_id, "rank": rank}
+            for appid, tag_ids in tag_ids_by_appid.items()
+            for rank, tag_id in enumerate(tag_ids)
+        ]
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 if tag_records:
                     cursor.execute(
@@ -270,59 +503,106 @@ class TigerPICSLatestStateStore:
                         ON CONFLICT (tag_id)
                         DO UPDATE SET name = EXCLUDED.name, updated_at = EXCLUDED.updated_at
                         """,
-                        (json.dumps(tag_records),),
+                        (_jsonb_param(tag_records),),
                     )
-                cursor.execute("DELETE FROM legacy.app_steam_tags WHERE appid = %s", (appid,))
-                if tag_ids:
-                    cursor.execute(
-                        """
-                        INSERT INTO legacy.app_steam_tags (appid, tag_id, rank)
-                        SELECT %s, tag_id, (rank - 1)::integer
-                        FROM unnest(%s::int[]) WITH ORDINALITY AS tags(tag_id, rank)
-                        ON CONFLICT (appid, tag_id)
-                        DO UPDATE SET rank = EXCLUDED.rank
-                        """,
-                        (appid, tag_ids),
-                    )
-
-    def upsert_franchise_link(self, appid: int, franchise_name: str) -> None:
-        normalized_name = _normalize_name(franchise_name)
-        with self._connect() as connection:
-            with connection.cursor() as cursor:
                 cursor.execute(
                     """
-                    INSERT INTO legacy.franchises (name, normalized_name, updated_at)
-                    VALUES (%s, %s, now())
-                    ON CONFLICT (normalized_name)
-                    DO UPDATE SET name = EXCLUDED.name, updated_at = now()
-                    RETURNING id
+                    WITH desired AS (
+                      SELECT appid, tag_id, rank
+                      FROM jsonb_to_recordset(%s::jsonb) AS rows (
+                        appid integer,
+                        tag_id integer,
+                        rank integer
+                      )
+                    ),
+                    removed AS (
+                      DELETE FROM legacy.app_steam_tags existing
+                      WHERE existing.appid = ANY(%s::int[])
+                        AND NOT EXISTS (
+                          SELECT 1
+                          FROM desired
+                          WHERE desired.appid = existing.appid
+                            AND desired.tag_id = existing.tag_id
+                        )
+                    )
+                    INSERT INTO legacy.app_steam_tags (appid, tag_id, rank)
+                    SELECT appid, tag_id, rank
+                    FROM desired
+                    ON CONFLICT (appid, tag_id)
+                    DO UPDATE SET rank = EXCLUDED.rank
+                    WHERE legacy.app_steam_tags.rank IS DISTINCT FROM EXCLUDED.rank
                     """,
-                    (franchise_name, normalized_name),
+                    (_jsonb_param(tag_rows), list(tag_ids_by_appid)),
                 )
-                franchise_id = cursor.fetchone()[0]
+
+    def upsert_franchise_link(self, appid: int, franchise_name: str) -> None:
+        self.upsert_franchise_links_batch([(appid, franchise_name)])
+
+    def upsert_franchise_links_batch(self, franchise_links: Sequence[Tuple[int, str]]) -> None:
+        if not franchise_links:
+            return
+
+        franchise_names: Dict[str, str] = {}
+        link_rows: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        for appid, franchise_name in franchise_links:
+            normalized_name = _normalize_name(franchise_name)
+            franchise_names[normalized_name] = franchise_name
+            link_rows[(int(appid), normalized_name)] = {
+                "appid": int(appid),
+                "normalized_name": normalized_name,
+            }
+
+        franchise_rows = [
+            {"name": name, "normalized_name": normalized_name}
+            for normalized_name, name in franchise_names.items()
+        ]
+        with self._connection() as connection:
+            with connection.cursor() as cursor:
                 cursor.execute(
                     """
+                    WITH upserted AS (
+                      INSERT INTO legacy.franchises (name, normalized_name, updated_at)
+                      SELECT name, normalized_name, now()
+                      FROM jsonb_to_recordset(%s::jsonb) AS rows (name text, normalized_name text)
+                      ON CONFLICT (normalized_name)
+                      DO UPDATE SET name = EXCLUDED.name, updated_at = now()
+                      RETURNING id, normalized_name
+                    )
                     INSERT INTO legacy.app_franchises (appid, franchise_id)
-                    VALUES (%s, %s)
+                    SELECT links.appid, upserted.id
+                    FROM jsonb_to_recordset(%s::jsonb) AS links (
+                      appid integer,
+                      normalized_name text
+                    )
+                    JOIN upserted ON upserted.normalized_name = links.normalized_name
                     ON CONFLICT DO NOTHING
                     """,
-                    (appid, franchise_id),
+                    (_jsonb_param(franchise_rows), _jsonb_param(list(link_rows.values()))),
                 )
 
     def sync_dlc_relationships(self, parent_appid: int, dlc_appids: List[int]) -> None:
-        if not dlc_appids:
+        self.sync_dlc_relationships_batch({parent_appid: dlc_appids})
+
+    def sync_dlc_relationships_batch(self, dlc_appids_by_parent: Dict[int, List[int]]) -> None:
+        dlc_rows = [
+            {"parent_appid": parent_appid, "dlc_appid": dlc_appid}
+            for parent_appid, dlc_appids in dlc_appids_by_parent.items()
+            for dlc_appid in dlc_appids
+        ]
+        if not dlc_rows:
             return
 
+        updated_at = datetime.now(timezone.utc).isoformat()
         placeholder_rows = [
             {
                 "appid": appid,
                 "name": f"Steam App {appid}",
                 "type": "dlc",
-                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "updated_at": updated_at,
             }
-            for appid in dlc_appids
+            for appid in dict.fromkeys(row["dlc_appid"] for row in dlc_rows)
         ]
-        with self._connect() as connection:
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
                     """
@@ -336,15 +616,19 @@ class TigerPICSLatestStateStore:
                     )
                     ON CONFLICT (appid) DO NOTHING
                     """,
-                    (json.dumps(placeholder_rows),),
+                    (_jsonb_param(placeholder_rows),),
                 )
                 cursor.execute(
                     """
                     INSERT INTO legacy.app_dlc (parent_appid, dlc_appid, source)
-                    SELECT %s, unnest(%s::int[]), 'pics'
+                    SELECT parent_appid, dlc_appid, 'pics'
+                    FROM jsonb_to_recordset(%s::jsonb) AS rows (
+                      parent_appid integer,
+                      dlc_appid integer
+                    )
                     ON CONFLICT (parent_appid, dlc_appid) DO UPDATE SET source = EXCLUDED.source
                     """,
-                    (parent_appid, dlc_appids),
+                    (_jsonb_param(dlc_rows),),
                 )
 
     def update_sync_status(self, appids: List[int], trigger_cursor: Optional[str]) -> None:
@@ -352,7 +636,7 @@ class TigerPICSLatestStateStore:
             return
 
         pics_change_number = int(trigger_cursor) if trigger_cursor else None
-        with self._connect() as connection:
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
                     """
@@ -371,7 +655,7 @@ class TigerPICSLatestStateStore:
                 )
 
     def get_first_pass_candidates(self, limit: int) -> List[Dict[str, Any]]:
-        with self._connect() as connection:
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
                     """
@@ -406,7 +690,7 @@ class TigerPICSLatestStateStore:
                 ]
 
     def get_unsynced_app_ids_after(self, last_appid: int, limit: int) -> List[int]:
-        with self._connect() as connection:
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
                     """
@@ -422,7 +706,7 @@ class TigerPICSLatestStateStore:
                 return [int(row[0]) for row in cursor.fetchall()]
 
     def get_all_app_ids_after(self, last_appid: int, limit: int) -> List[int]:
-        with self._connect() as connection:
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
                     """
@@ -437,7 +721,7 @@ class TigerPICSLatestStateStore:
                 return [int(row[0]) for row in cursor.fetchall()]
 
     def get_last_change_number(self) -> int:
-        with self._connect() as connection:
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
                     "SELECT last_change_number FROM ops.pics_sync_state WHERE id = 1"
@@ -446,7 +730,7 @@ class TigerPICSLatestStateStore:
                 return int(row[0]) if row else 0
 
     def set_last_change_number(self, change_number: int) -> None:
-        with self._connect() as connection:
+        with self._connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(
                     """
@@ -36,6 +36,8 @@ def main():
         print(f"\nReceived data for {len(raw_data)} apps\n")
         print("=" * 80)
 
+        apps_with_tags = 0
+        apps_with_genres = 0
         for appid, data in raw_data.items():
             appid_int = int(appid)
             expected_name = TEST_APPS.get(appid_int, "Unknown")
@@ -47,36 +49,41 @@ def main():
             appinfo = data.get("appinfo", data)
             common = appinfo.get("common", {})
 
-            print(f"\n[{appid}] {expected_name}")
-            print("-" * 40)
-            print(f"  Name from PICS: {extracted.name}")
-            print(f"  Type: {extracted.type}")
-            print(f"  Developer: {extracted.developer}")
-            print(f"  Publisher: {extracted.publisher}")
-            print(f"  Platforms: {extracted.platforms}")
-            print(f"  ")
-            print(f"  Store Tags (IDs): {extracted.store_tags[:10]}{'...' if len(extracted.store_tags) > 10 else ''}")
-            print(f"  Genres (IDs): {extracted.genres}")
-            print(f"  Primary Genre: {extracted.primary_genre}")
-            print(f"  Categories: {list(extracted.categories.keys())[:10]}{'...' if len(extracted.categories) > 10 else ''}")
-            print(f"  ")
-            print(f"  Has tags in raw: {'store_tags' in common}")
-            print(f"  Has genres in raw: {'genres' in common}")
-            print(f"  Has categories in raw: {'category' in common}")
+            # Buffer the per-app report and emit it with a single write
+            lines = []
+            add = lines.append
+            add(f"\n[{appid}] {expected_name}\n")
+            add("-" * 40 + "\n")
+            add(f"  Name from PICS: {extracted.name}\n")
+            add(f"  Type: {extracted.type}\n")
+            add(f"  Developer: {extracted.developer}\n")
+            add(f"  Publisher: {extracted.publisher}\n")
+            add(f"  Platforms: {extracted.platforms}\n")
+            add("  \n")
+            tags_more = "..." if len(extracted.store_tags) > 10 else ""
+            add(f"  Store Tags (IDs): {extracted.store_tags[:10]}{tags_more}\n")
+            add(f"  Genres (IDs): {extracted.genres}\n")
+            add(f"  Primary Genre: {extracted.primary_genre}\n")
+            categories_more = "..." if len(extracted.categories) > 10 else ""
+            add(f"  Categories: {list(extracted.categories.keys())[:10]}{categories_more}\n")
+            add("  \n")
+            add(f"  Has tags in raw: {'store_tags' in common}\n")
+            add(f"  Has genres in raw: {'genres' in common}\n")
+            add(f"  Has categories in raw: {'category' in common}\n")
 
             # Show raw store_tags sample
             raw_tags = common.get("store_tags", {})
             if raw_tags:
-                print(f"  Raw store_tags sample: {dict(list(raw_tags.items())[:3])}")
+                add(f"  Raw store_tags sample: {dict(list(raw_tags.items())[:3])}\n")
+                apps_with_tags += 1
             else:
-                print(f"  Raw store_tags: EMPTY/MISSING")
+                add("  Raw store_tags: EMPTY/MISSING\n")
+            if common.get("genres"):
+                apps_with_genres += 1
+            sys.stdout.write("".join(lines))
 
         print("\n" + "=" * 80)
         print("\nSUMMARY:")
-        apps_with_tags = sum(1 for appid, data in raw_data.items()
-                           if data.get("appinfo", data).get("common", {}).get("store_tags"))
-        apps_with_genres = sum(1 for appid, data in raw_data.items()
-                             if data.get("appinfo", data).get("common", {}).get("genres"))
         print(f"  Apps with store_tags: {apps_with_tags}/{len(raw_data)}")
         print(f"  Apps with genres: {apps_with_genres}/{len(raw_data)}")
 
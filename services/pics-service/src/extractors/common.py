@@ -3,12 +3,13 @@
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SteamDeckCompatibility:
     """Steam Deck compatibility info."""
 
@@ -18,7 +19,7 @@ class SteamDeckCompatibility:
     tests: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Association:
     """Developer/Publisher/Franchise association."""
 
@@ -26,9 +27,13 @@ class Association:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedPICSData:
-    """All extracted PICS data for an app."""
+    """All extracted PICS data for an app.
+
+    Slotted, as bulk syncs create one per app; assigning attributes that are
+    not fields raises AttributeError.
+    """
 
     appid: int
     name: Optional[str] = None
@@ -84,6 +89,160 @@ class ExtractedPICSData:
     # Build info
     current_build_id: Optional[str] = None
 
+    # Backing slot for associations_by_type (cached_property needs __dict__).
+    _associations_by_type: Optional[Dict[str, List[Association]]] = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @property
+    def associations_by_type(self) -> Dict[str, List[Association]]:
+        """Associations bucketed by type, built once on first access."""
+        by_type = self._associations_by_type
+        if by_type is None:
+            by_type = {}
+            for association in self.associations:
+                by_type.setdefault(association.type, []).append(association)
+            self._associations_by_type = by_type
+        return by_type
+
+
+def _extract_associations(data: Dict) -> List[Association]:
+    """Extract associations from numbered dict format."""
+    associations = []
+    if not isinstance(data, dict):
+        return associations
+
+    append = associations.append
+    for assoc in data.values():
+        if isinstance(assoc, dict):
+            try:
+                append(Association(assoc["type"], assoc["name"]))
+            except KeyError:
+                pass
+    return associations
+
+
+def _extract_tag_ids(data: Dict) -> List[int]:
+    """Extract tag IDs from numbered dict format."""
+    if not isinstance(data, dict):
+        return []
+    try:
+        # Common case: every value is numeric, so convert in one comprehension
+        return [int(v) for v in data.values()]
+    except (ValueError, TypeError):
+        pass
+    result = []
+    for v in data.values():
+        try:
+            result.append(int(v))
+        except (ValueError, TypeError):
+            pass
+    return result
+
+
+def _extract_categories(data: Dict) -> Dict[int, bool]:
+    """Extract category flags as category_id -> True mapping."""
+    if not isinstance(data, dict):
+        return {}
+
+    result = {}
+    prefix_length = len("category_")
+    for k, v in data.items():
+        if k.startswith("category_"):
+            try:
+                result[int(k[prefix_length:])] = v == "1"
+            except ValueError:
+                pass
+    return result
+
+
+def _parse_platforms(oslist: str) -> List[str]:
+    """Parse comma-separated platform list."""
+    if not oslist:
+        return []
+    return [p.strip() for p in oslist.split(",") if p.strip()]
+
+
+def _parse_dlc_list(dlc_str: str) -> List[int]:
+    """Parse comma-separated DLC appid list."""
+    if not dlc_str:
+        return []
+    parts = dlc_str.split(",")
+    try:
+        # int() ignores surrounding whitespace, so well-formed lists convert in one pass
+        return [int(x) for x in parts]
+    except ValueError:
+        pass
+    result = []
+    for x in parts:
+        try:
+            result.append(int(x))
+        except ValueError:
+            pass
+    return result
+
+
+def _extract_steam_deck(data: Dict) -> Optional[SteamDeckCompatibility]:
+    """Extract Steam Deck compatibility info."""
+    if not data or not isinstance(data, dict):
+        return None
+    return SteamDeckCompatibility(
+        category=_safe_int(data.get("category")) or 0,
+        test_timestamp=_safe_int(data.get("test_timestamp")),
+        tested_build_id=data.get("tested_build_id"),
+        tests=data.get("tests"),
+    )
+
+
+def _extract_public_branch(depots: Dict) -> Tuple[Optional[str], Optional[datetime]]:
+    """Extract build ID and last update timestamp from the public branch."""
+    if not isinstance(depots, dict):
+        return None, None
+    try:
+        public = depots.get("branches", {}).get("public", {})
+        return public.get("buildid"), _parse_timestamp(public.get("timeupdated"))
+    except Exception:
+        return None, None
+
+
+@lru_cache(maxsize=65536)
+def _datetime_from_timestamp(timestamp: int) -> Optional[datetime]:
+    """Convert a Unix timestamp; release dates and asset mtimes recur across many apps."""
+    try:
+        return datetime.fromtimestamp(timestamp)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    """Safely parse Unix timestamp."""
+    if not value:
+        return None
+    # VDF values usually arrive as digit strings; ints skip the conversion.
+    if value.__class__ is not int:
+        # isdigit alone accepts non-ASCII digits like '²', which int() rejects
+        if value.__class__ is str and value.isascii() and value.isdigit():
+            value = int(value)
+        else:
+            try:
+                value = int(value)
+            except (ValueError, TypeError):
+                return None
+    return _datetime_from_timestamp(value)
+
+
+def _safe_int(value) -> Optional[int]:
+    """Safely convert to int."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
 
 class PICSExtractor:
     """Extracts structured data from raw PICS response."""
@@ -91,173 +250,85 @@ class PICSExtractor:
     def extract(self, appid: int, raw_data: Dict[str, Any]) -> ExtractedPICSData:
         """Extract all relevant fields from PICS app data."""
         # Handle both wrapped and unwrapped formats
-        if "appinfo" in raw_data:
-            appinfo = raw_data.get("appinfo", raw_data)
-        else:
-            appinfo = raw_data
-
-        common = appinfo.get("common", {}) if isinstance(appinfo, dict) else {}
+        appinfo = raw_data["appinfo"] if "appinfo" in raw_data else raw_data
+        common = appinfo.get("common") or {}
 
         # Debug logging to diagnose type extraction issues
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"[{appid}] Raw keys: {list(raw_data.keys())[:5]}")
-            if isinstance(appinfo, dict):
-                logger.debug(f"[{appid}] appinfo keys: {list(appinfo.keys())[:5]}")
+            logger.debug(f"[{appid}] appinfo keys: {list(appinfo.keys())[:5]}")
             logger.debug(f"[{appid}] common keys: {list(common.keys())[:10] if common else 'EMPTY'}")
             logger.debug(f"[{appid}] common.type = {common.get('type')}")
         extended = appinfo.get("extended", {})
         config = appinfo.get("config", {})
         depots = appinfo.get("depots", {})
 
+        # Bind the per-field lookups once; extract runs for every app in a bulk sync.
+        get = common.get
+        get_extended = extended.get
+        current_build_id, last_update_timestamp = _extract_public_branch(depots)
+
         return ExtractedPICSData(
             appid=appid,
-            name=common.get("name"),
-            type=common.get("type"),
+            name=get("name"),
+            type=get("type"),
             # Developer/Publisher (prefer common, fallback to extended)
-            developer=common.get("developer") or extended.get("developer"),
-            publisher=common.get("publisher") or extended.get("publisher"),
-            associations=self._extract_associations(common.get("associations", {})),
+            developer=get("developer") or get_extended("developer"),
+            publisher=get("publisher") or get_extended("publisher"),
+            associations=_extract_associations(get("associations", {})),
             # Relationships
-            parent_appid=self._safe_int(common.get("parent")),
-            dlc_appids=self._parse_dlc_list(extended.get("listofdlc", "")),
+            parent_appid=_safe_int(get("parent")),
+            dlc_appids=_parse_dlc_list(get_extended("listofdlc", "")),
             # Dates
-            steam_release_date=self._parse_timestamp(common.get("steam_release_date")),
-            original_release_date=self._parse_timestamp(common.get("original_release_date")),
-            store_asset_mtime=self._parse_timestamp(common.get("store_asset_mtime")),
-            release_state=common.get("releasestate"),
-            last_update_timestamp=self._extract_last_update(depots),
+            steam_release_date=_parse_timestamp(get("steam_release_date")),
+            original_release_date=_parse_timestamp(get("original_release_date")),
+            store_asset_mtime=_parse_timestamp(get("store_asset_mtime")),
+            release_state=get("releasestate"),
+            last_update_timestamp=last_update_timestamp,
             # Reviews
-            review_score=self._safe_int(common.get("review_score")),
-            review_percentage=self._safe_int(common.get("review_percentage")),
-            metacritic_score=self._safe_int(common.get("metacritic_score")),
-            metacritic_url=common.get("metacritic_url"),
+            review_score=_safe_int(get("review_score")),
+            review_percentage=_safe_int(get("review_percentage")),
+            metacritic_score=_safe_int(get("metacritic_score")),
+            metacritic_url=get("metacritic_url"),
             # Tags & Categories
-            store_tags=self._extract_tag_ids(common.get("store_tags", {})),
-            genres=self._extract_tag_ids(common.get("genres", {})),
-            primary_genre=self._safe_int(common.get("primary_genre")),
-            categories=self._extract_categories(common.get("category", {})),
+            store_tags=_extract_tag_ids(get("store_tags", {})),
+            genres=_extract_tag_ids(get("genres", {})),
+            primary_genre=_safe_int(get("primary_genre")),
+            categories=_extract_categories(get("category", {})),
             # Platform & Compatibility
-            platforms=self._parse_platforms(common.get("oslist", "")),
-            controller_support=common.get("controller_support"),
-            steam_deck=self._extract_steam_deck(common.get("steam_deck_compatibility", {})),
+            platforms=_parse_platforms(get("oslist", "")),
+            controller_support=get("controller_support"),
+            steam_deck=_extract_steam_deck(get("steam_deck_compatibility", {})),
             # Features
-            has_workshop="workshop" in config or common.get("workshop_visible") == "1",
-            is_free=common.get("isfreeapp") == "1",
+            has_workshop="workshop" in config or get("workshop_visible") == "1",
+            is_free=get("isfreeapp") == "1",
             # Content
-            content_descriptors=common.get("content_descriptors", {}),
-            languages=common.get("languages", {}),
+            content_descriptors=get("content_descriptors", {}),
+            languages=get("languages", {}),
             # URLs
-            homepage_url=extended.get("homepage") or extended.get("developer_url"),
+            homepage_url=get_extended("homepage") or get_extended("developer_url"),
             # State
-            app_state=extended.get("state"),
+            app_state=get_extended("state"),
             # Build info
-            current_build_id=self._extract_build_id(depots),
+            current_build_id=current_build_id,
         )
 
-    def _extract_associations(self, data: Dict) -> List[Association]:
-        """Extract associations from numbered dict format."""
-        associations = []
-        if not isinstance(data, dict):
-            return associations
-
-        for _, assoc in data.items():
-            if isinstance(assoc, dict) and "type" in assoc and "name" in assoc:
-                associations.append(Association(type=assoc["type"], name=assoc["name"]))
-        return associations
-
-    def _extract_tag_ids(self, data: Dict) -> List[int]:
-        """Extract tag IDs from numbered dict format."""
-        if not isinstance(data, dict):
-            return []
-        result = []
-        for v in data.values():
-            try:
-                result.append(int(v))
-            except (ValueError, TypeError):
-                pass
-        return result
-
-    def _extract_categories(self, data: Dict) -> Dict[int, bool]:
-        """Extract category flags as category_id -> True mapping."""
-        if not isinstance(data, dict):
-            return {}
-
-        result = {}
-        for k, v in data.items():
-            if k.startswith("category_"):
-                try:
-                    cat_id = int(k.replace("category_", ""))
-                    result[cat_id] = v == "1"
-                except ValueError:
-                    pass
-        return result
-
-    def _parse_platforms(self, oslist: str) -> List[str]:
-        """Parse comma-separated platform list."""
-        if not oslist:
-            return []
-        return [p.strip() for p in oslist.split(",") if p.strip()]
-
-    def _parse_dlc_list(self, dlc_str: str) -> List[int]:
-        """Parse comma-separated DLC appid list."""
-        if not dlc_str:
-            return []
-        result = []
-        for x in dlc_str.split(","):
+    def extract_batch(
+        self, raw_apps: Mapping[int, Dict[str, Any]]
+    ) -> Tuple[List[ExtractedPICSData], int]:
+        """Extract every app in a PICS response batch, keyed by integer appid.
+
+        Apps that fail to extract are logged and skipped. Returns the extracted
+        apps and the number of failures.
+        """
+        extract = self.extract
+        extracted: List[ExtractedPICSData] = []
+        append = extracted.append
+        failures = 0
+        for appid, raw_data in raw_apps.items():
             try:
-                result.append(int(x.strip()))
-            except ValueError:
-                pass
-        return result
-
-    def _extract_steam_deck(self, data: Dict) -> Optional[SteamDeckCompatibility]:
-        """Extract Steam Deck compatibility info."""
-        if not data or not isinstance(data, dict):
-            return None
-        return SteamDeckCompatibility(
-            category=self._safe_int(data.get("category")) or 0,
-            test_timestamp=self._safe_int(data.get("test_timestamp")),
-            tested_build_id=data.get("tested_build_id"),
-            tests=data.get("tests"),
-        )
-
-    def _extract_last_update(self, depots: Dict) -> Optional[datetime]:
-        """Extract last update timestamp from public branch."""
-        if not isinstance(depots, dict):
-            return None
-        try:
-            branches = depots.get("branches", {})
-            public = branches.get("public", {})
-            timestamp = public.get("timeupdated")
-            return self._parse_timestamp(timestamp)
-        except Exception:
-            return None
-
-    def _extract_build_id(self, depots: Dict) -> Optional[str]:
-        """Extract current build ID from public branch."""
-        if not isinstance(depots, dict):
-            return None
-        try:
-            branches = depots.get("branches", {})
-            public = branches.get("public", {})
-            return public.get("buildid")
-        except Exception:
-            return None
-
-    def _parse_timestamp(self, value) -> Optional[datetime]:
-        """Safely parse Unix timestamp."""
-        if not value:
-            return None
-        try:
-            return datetime.fromtimestamp(int(value))
-        except (ValueError, TypeError, OSError):
-            return None
-
-    def _safe_int(self, value) -> Optional[int]:
-        """Safely convert to int."""
-        if value is None:
-            return None
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return None
+                append(extract(appid, raw_data))
+            except Exception as e:
+                logger.error(f"Failed to extract app {appid}: {e}")
+                failures += 1
+        return extracted, failures
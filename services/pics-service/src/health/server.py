@@ -1,16 +1,38 @@
 """HTTP health check server for Railway."""
 
-import json
 import logging
 import threading
+from datetime import datetime, timezone
+from http import HTTPStatus
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from typing import Any, Dict, Optional
 
+import orjson
+
 from ..config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+def _build_response(code: int, content_type: str, body: bytes) -> bytes:
+    """Build a complete HTTP/1.0 response as a single byte string."""
+    head = (
+        f"HTTP/1.0 {code} {HTTPStatus(code).phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+# Health probes only ever receive one of these fixed replies, so they are
+# encoded once instead of formatting status lines and headers per request
+_TEXT_RESPONSES: Dict[tuple[int, str], bytes] = {
+    (code, message): _build_response(code, "text/plain", message.encode())
+    for code, message in ((200, "OK"), (200, "STARTING"), (503, "UNHEALTHY"), (404, "Not Found"))
+}
+
+
 class HealthHandler(BaseHTTPRequestHandler):
     """HTTP request handler for health checks."""
 
@@ -38,17 +60,16 @@ class HealthHandler(BaseHTTPRequestHandler):
 
     def _send_response(self, code: int, message: str):
         """Send a simple text response."""
-        self.send_response(code)
-        self.send_header("Content-Type", "text/plain")
-        self.end_headers()
-        self.wfile.write(message.encode())
+        response = _TEXT_RESPONSES.get((code, message))
+        if response is None:
+            response = _build_response(code, "text/plain", message.encode())
+        self.wfile.write(response)
 
     def _send_json_response(self, code: int, data: Dict[str, Any]):
         """Send a JSON response."""
-        self.send_response(code)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        # orjson returns bytes directly; naive datetimes in status data are UTC
+        body = orjson.dumps(data, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+        self.wfile.write(_build_response(code, "application/json", body))
 
     def log_message(self, format, *args):
         """Suppress default logging."""
@@ -90,6 +111,4 @@ class HealthServer:
 
     def _get_timestamp(self) -> str:
         """Get current timestamp as ISO string."""
-        from datetime import datetime
-
-        return datetime.utcnow().isoformat() + "Z"
+        return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
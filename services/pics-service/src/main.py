@@ -21,20 +21,35 @@ def setup_logging():
 
     if settings.log_json:
         # JSON format for Railway
-        import json
-        from datetime import datetime, timezone
+        import time
+
+        import orjson
 
         class JsonFormatter(logging.Formatter):
+            # Whole-second UTC prefix of the last formatted record; the handler
+            # lock serializes format() calls, so this is safe to reuse.
+            _last_second = -1
+            _last_second_prefix = ""
+
+            def _format_timestamp(self, record):
+                second = int(record.created)
+                if second != self._last_second:
+                    self._last_second = second
+                    self._last_second_prefix = time.strftime(
+                        "%Y-%m-%dT%H:%M:%S", time.gmtime(second)
+                    )
+                return f"{self._last_second_prefix}.{int(record.msecs):03d}Z"
+
             def format(self, record):
                 log_obj = {
-                    "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                    "timestamp": self._format_timestamp(record),
                     "level": record.levelname,
                     "logger": record.name,
                     "message": record.getMessage(),
                 }
                 if record.exc_info:
                     log_obj["exception"] = self.formatException(record.exc_info)
-                return json.dumps(log_obj)
+                return orjson.dumps(log_obj).decode()
 
         handler = logging.StreamHandler()
         handler.setFormatter(JsonFormatter())
@@ -1,6 +1,7 @@
 """Steam client wrapper with automatic reconnection and heartbeat."""
 
 import logging
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -25,6 +26,7 @@ class PICSSteamClient:
 
         # Connection tracking
         self._connection_time: Optional[datetime] = None
+        self._connection_started_ns: Optional[int] = None  # monotonic clock, for age math
         self._last_activity: Optional[datetime] = None
         self._last_disconnect_time: Optional[datetime] = None
         self._last_successful_connection_time: Optional[datetime] = None
@@ -56,6 +58,7 @@ class PICSSteamClient:
             if result == EResult.OK:
                 self._connected = True
                 self._connection_time = datetime.utcnow()
+                self._connection_started_ns = time.monotonic_ns()
                 self._last_activity = datetime.utcnow()
                 self._last_successful_connection_time = self._connection_time
                 self._reconnect_attempts = 0
@@ -165,6 +168,7 @@ class PICSSteamClient:
             finally:
                 self._connected = False
                 self._connection_time = None
+                self._connection_started_ns = None
                 self._client = None
 
     def _cleanup_client(self):
@@ -178,6 +182,7 @@ class PICSSteamClient:
             self._client = None
         self._connected = False
         self._connection_time = None
+        self._connection_started_ns = None
 
     def _start_heartbeat(self):
         """Start background heartbeat to prevent idle disconnect."""
@@ -218,15 +223,16 @@ class PICSSteamClient:
 
         # Calculate connection duration
         duration = None
-        if self._connection_time:
-            duration = (datetime.utcnow() - self._connection_time).total_seconds()
+        if self._connection_started_ns is not None:
+            duration = (time.monotonic_ns() - self._connection_started_ns) / 1e9
 
-        logger.warning(
-            f"Disconnected from Steam "
-            f"(was connected: {was_connected}, "
-            f"duration: {duration:.1f}s)" if duration else
-            f"Disconnected from Steam (was connected: {was_connected})"
-        )
+        if duration is not None:
+            logger.warning(
+                f"Disconnected from Steam (was connected: {was_connected}, "
+                f"duration: {duration:.1f}s)"
+            )
+        else:
+            logger.warning(f"Disconnected from Steam (was connected: {was_connected})")
 
         # Trigger auto-reconnection in a new greenlet (non-blocking)
         if self._auto_reconnect and was_connected and not self._reconnecting:
@@ -256,7 +262,6 @@ class PICSSteamClient:
         Returns:
             True if connected within timeout
         """
-        import time
         start = time.time()
         while time.time() - start < timeout:
             if self._connected:
@@ -290,8 +295,8 @@ class PICSSteamClient:
     @property
     def connection_age_seconds(self) -> Optional[float]:
         """Get the age of the current connection in seconds."""
-        if self._connection_time and self._connected:
-            return (datetime.utcnow() - self._connection_time).total_seconds()
+        if self._connection_started_ns is not None and self._connected:
+            return (time.monotonic_ns() - self._connection_started_ns) / 1e9
         return None
 
     @property
@@ -2,10 +2,14 @@
 
 import logging
 import time
+from collections import deque
+from collections.abc import Sized
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Generator, List, Optional
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
 
 import gevent
+from gevent.lock import BoundedSemaphore
 
 from .client import PICSSteamClient
 
@@ -28,6 +32,7 @@ class PICSFetcher:
     REQUEST_DELAY = 0.5  # Seconds between batches (conservative)
     DEFAULT_TIMEOUT = 60  # Seconds per batch fetch
     DEFAULT_MAX_RETRIES = 5  # Retry attempts per batch
+    DEFAULT_MAX_IN_FLIGHT = 1  # Concurrent product-info requests in fetch_all_apps
     AUTO_RECONNECT_WAIT_TIMEOUT = 30  # Seconds to wait before forcing reconnect
     MANUAL_RECONNECT_ATTEMPTS = 3  # Manual reconnect attempts when polling changes
 
@@ -39,6 +44,7 @@ class PICSFetcher:
         timeout: int = None,
         max_retries: int = None,
         change_poll_timeout: float | None = None,
+        max_in_flight: int = None,
     ):
         self._client = client
         self.batch_size = batch_size or self.BATCH_SIZE
@@ -46,15 +52,28 @@ class PICSFetcher:
         self.timeout = timeout or self.DEFAULT_TIMEOUT
         self.max_retries = max_retries or self.DEFAULT_MAX_RETRIES
         self.change_poll_timeout = change_poll_timeout or self.timeout
+        self.max_in_flight = max(1, max_in_flight or self.DEFAULT_MAX_IN_FLIGHT)
+        # Serializes connection recovery across pipelined fetches and the change poll
+        self._reconnect_lock = BoundedSemaphore(1)
 
     def _ensure_connection(self, wait_timeout: float = AUTO_RECONNECT_WAIT_TIMEOUT) -> None:
-        """Recover a disconnected Steam client before issuing a request."""
-        if self._client.ensure_connected(
-            wait_timeout=wait_timeout,
-            reconnect_attempts=self.MANUAL_RECONNECT_ATTEMPTS,
-        ):
+        """Recover a disconnected Steam client before issuing a request.
+
+        Only one greenlet recovers the connection at a time; the others wait on
+        the lock and reuse the connection it restored instead of forcing another
+        reconnect that would tear it down.
+        """
+        if self._client.is_connected:
             return
 
+        with self._reconnect_lock:
+            # Another greenlet may have reconnected while this one waited
+            if self._client.is_connected or self._client.ensure_connected(
+                wait_timeout=wait_timeout,
+                reconnect_attempts=self.MANUAL_RECONNECT_ATTEMPTS,
+            ):
+                return
+
         raise RuntimeError("Failed to reconnect to Steam")
 
     def fetch_apps_batch(self, appids: List[int]) -> Dict[int, Dict[str, Any]]:
@@ -65,7 +84,8 @@ class PICSFetcher:
             appids: List of app IDs to fetch (max ~200 recommended)
 
         Returns:
-            Dict mapping appid to PICS data
+            Dict mapping appid to PICS data; the steam library already keys it
+            by integer appid, so consumers use the keys as-is
         """
         for attempt in range(self.max_retries):
             self._ensure_connection(wait_timeout=120)
@@ -78,6 +98,9 @@ class PICSFetcher:
                     return {}
 
                 return response.get("apps", {})
+            except gevent.GreenletExit:
+                # Killed by an abandoned pipelined fetch; do not retry
+                raise
             except BaseException as e:
                 # Catch BaseException to handle gevent.timeout.Timeout which doesn't extend Exception
                 age = self._client.connection_age_seconds
@@ -89,7 +112,9 @@ class PICSFetcher:
                         f"Batch attempt {attempt + 1}/{self.max_retries} failed "
                         f"(connection age: {age_str}), retrying in {delay}s: {e}"
                     )
-                    time.sleep(delay)
+                    # gevent.sleep: pipelined fetches run in greenlets on an unpatched
+                    # hub, and time.sleep would freeze every other request meanwhile
+                    gevent.sleep(delay)
                 else:
                     logger.error(
                         f"Error fetching PICS data after {self.max_retries} attempts "
@@ -99,52 +124,136 @@ class PICSFetcher:
 
     def fetch_all_apps(
         self,
-        appids: List[int],
-        batch_callback: Optional[Callable[[Dict, int, int], None]] = None,
+        appids: Iterable[int],
+        batch_callback: Optional[Callable[[Dict, int, Optional[int]], None]] = None,
     ) -> Generator[Dict[int, Dict], None, None]:
         """
         Fetch PICS data for all apps in batches.
 
-        Yields batches of app data as they're fetched.
+        Yields batches of app data in request order. With max_in_flight > 1,
+        up to that many product-info requests are outstanding at once; the
+        Steam client matches responses to requests by job id, so later
+        requests no longer wait for earlier round-trips. Requests are still
+        started at most once per request_delay.
         At ~200 apps/request and 2 req/sec, 70k apps takes ~3 minutes.
 
         Args:
-            appids: List of all app IDs to fetch
-            batch_callback: Optional callback(result, processed, total) after each batch
+            appids: App IDs to fetch; any iterable, consumed one batch at a time
+                so a streamed source never has to be materialized
+            batch_callback: Optional callback(result, processed, total) after each
+                batch; total is None when appids has no length
 
         Yields:
             Dict mapping appid to PICS data for each batch
         """
-        total_apps = len(appids)
+        if self.max_in_flight > 1:
+            yield from self._fetch_all_apps_pipelined(appids, batch_callback)
+            return
+
+        total_apps = len(appids) if isinstance(appids, Sized) else None
         processed = 0
         failed_batches: List[List[int]] = []
 
-        for i in range(0, total_apps, self.batch_size):
-            batch = appids[i : i + self.batch_size]
-
+        for i, batch in self._iter_batches(appids):
+            started = time.monotonic()
             try:
                 result = self.fetch_apps_batch(batch)
                 processed += len(batch)
 
-                logger.info(
-                    f"Fetched {processed}/{total_apps} apps ({processed / total_apps * 100:.1f}%)"
-                )
+                self._log_fetch_progress(processed, total_apps)
 
                 if batch_callback:
                     batch_callback(result, processed, total_apps)
 
                 yield result
 
-                # Rate limiting
-                time.sleep(self.request_delay)
+                # Rate limiting: request_delay is the interval between request
+                # starts, so time already spent fetching and consuming counts
+                self._sleep_until_next_request(started, time.sleep)
 
             except Exception as e:
                 logger.error(f"Batch failed at offset {i} ({len(batch)} apps): {e}")
                 failed_batches.append(batch)
                 # Continue with next batch after delay
-                time.sleep(2)
+                gevent.sleep(2)
+
+        self._log_failed_batches(failed_batches)
+
+    def _fetch_all_apps_pipelined(
+        self,
+        appids: Iterable[int],
+        batch_callback: Optional[Callable[[Dict, int, Optional[int]], None]] = None,
+    ) -> Generator[Dict[int, Dict], None, None]:
+        """Fetch batches with up to max_in_flight requests outstanding, yielding in order."""
+        total_apps = len(appids) if isinstance(appids, Sized) else None
+        processed = 0
+        failed_batches: List[List[int]] = []
+        in_flight: Deque[Tuple[int, List[int], gevent.Greenlet]] = deque()
+
+        def reap_oldest() -> Optional[Dict[int, Dict]]:
+            nonlocal processed
+            offset, batch, request = in_flight.popleft()
+            try:
+                result = request.get()
+            except Exception as e:
+                logger.error(f"Batch failed at offset {offset} ({len(batch)} apps): {e}")
+                failed_batches.append(batch)
+                return None
+
+            processed += len(batch)
+            self._log_fetch_progress(processed, total_apps)
+            if batch_callback:
+                batch_callback(result, processed, total_apps)
+            return result
+
+        try:
+            for i, batch in self._iter_batches(appids):
+                started = time.monotonic()
+                in_flight.append((i, batch, gevent.spawn(self.fetch_apps_batch, batch)))
+
+                if len(in_flight) >= self.max_in_flight:
+                    result = reap_oldest()
+                    if result is not None:
+                        yield result
+
+                # Rate limiting: pace request starts; gevent.sleep lets in-flight requests progress
+                self._sleep_until_next_request(started, gevent.sleep)
+
+            while in_flight:
+                result = reap_oldest()
+                if result is not None:
+                    yield result
+        finally:
+            # Abandoned generator or error: do not leave requests running in the background
+            gevent.killall([request for _, _, request in in_flight], block=False)
+
+        self._log_failed_batches(failed_batches)
+
+    def _sleep_until_next_request(self, started: float, sleep: Callable[[float], None]) -> None:
+        """Sleep out whatever is left of request_delay since the request started at started."""
+        remaining = self.request_delay - (time.monotonic() - started)
+        if remaining > 0:
+            sleep(remaining)
+
+    def _iter_batches(self, appids: Iterable[int]) -> Iterator[Tuple[int, List[int]]]:
+        """Yield (offset, batch) pairs of up to batch_size app IDs."""
+        iterator = iter(appids)
+        offset = 0
+        while batch := list(islice(iterator, self.batch_size)):
+            yield offset, batch
+            offset += len(batch)
+
+    def _log_fetch_progress(self, processed: int, total_apps: Optional[int]) -> None:
+        """Log fetch progress, with a percentage when the total is known."""
+        if total_apps:
+            logger.info(
+                f"Fetched {processed}/{total_apps} apps ({processed / total_apps * 100:.1f}%)"
+            )
+        else:
+            logger.info(f"Fetched {processed} apps")
 
-        # Log summary of failed batches
+    def _log_failed_batches(self, failed_batches: List[List[int]]) -> None:
+        """Log a summary of batches that failed after all retries."""
         if failed_batches:
             total_failed = sum(len(b) for b in failed_batches)
             failed_ids = [appid for batch in failed_batches for appid in batch[:5]]  # First 5 from each
@@ -196,7 +305,8 @@ class PICSFetcher:
                         delay,
                         e,
                     )
-                    time.sleep(delay)
+                    # gevent.sleep keeps a prefetched batch fetch running meanwhile
+                    gevent.sleep(delay)
                     continue
 
                 logger.error(
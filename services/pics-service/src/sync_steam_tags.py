@@ -1,9 +1,10 @@
 """Sync Steam tag names from Steam's API to the database."""
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 import httpx
+import orjson
 
 from database.client import SupabaseClient
 
@@ -11,6 +12,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 STEAM_TAGS_URL = "https://store.steampowered.com/tagdata/populartags/english"
+UPSERT_BATCH_SIZE = 500
 
 
 def sync_steam_tag_names():
@@ -19,29 +21,39 @@ def sync_steam_tag_names():
 
     response = httpx.get(STEAM_TAGS_URL, timeout=30.0)
     response.raise_for_status()
-    tags = response.json()  # [{"tagid": 19, "name": "Action"}, ...]
+    tags = orjson.loads(response.content)  # [{"tagid": 19, "name": "Action"}, ...]
 
     logger.info(f"Fetched {len(tags)} tags from Steam API")
 
     db = SupabaseClient.get_instance()
     client = db.client
 
+    updated_at = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+    # Key by tag id: one INSERT ... ON CONFLICT cannot touch the same row twice
+    rows_by_tag_id = {
+        tag["tagid"]: {"tag_id": tag["tagid"], "name": tag["name"], "updated_at": updated_at}
+        for tag in tags
+    }
+    rows = list(rows_by_tag_id.values())
+
     updated = 0
-    for tag in tags:
+    for i in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[i : i + UPSERT_BATCH_SIZE]
         try:
-            client.table("steam_tags").upsert(
-                {
-                    "tag_id": tag["tagid"],
-                    "name": tag["name"],
-                    "updated_at": datetime.utcnow().isoformat(),
-                },
-                on_conflict="tag_id",
-            ).execute()
-            updated += 1
+            client.table("steam_tags").upsert(batch, on_conflict="tag_id").execute()
+            updated += len(batch)
+            continue
         except Exception as e:
-            logger.error(f"Failed to update tag {tag['tagid']}: {e}")
+            logger.error(f"Batch tag upsert failed, falling back to per-tag writes: {e}")
+
+        for row in batch:
+            try:
+                client.table("steam_tags").upsert(row, on_conflict="tag_id").execute()
+                updated += 1
+            except Exception as e:
+                logger.error(f"Failed to update tag {row['tag_id']}: {e}")
 
-    logger.info(f"Updated {updated}/{len(tags)} tag names in database")
+    logger.info(f"Updated {updated}/{len(rows)} tag names in database")
     return updated
 
 
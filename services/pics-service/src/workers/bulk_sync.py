@@ -1,8 +1,10 @@
 """Worker for initial bulk sync of all PICS data."""
 
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from ..steam.client import PICSSteamClient
 from ..steam.pics import PICSFetcher
@@ -40,7 +42,7 @@ class BulkSyncWorker:
         Returns:
             Dict with stats: processed, failed, elapsed
         """
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         logger.info("Starting PICS bulk sync")
 
         # Configure client for long-running operation
@@ -57,6 +59,7 @@ class BulkSyncWorker:
             request_delay=settings.bulk_request_delay,
             timeout=settings.bulk_timeout,
             max_retries=settings.bulk_max_retries,
+            max_in_flight=settings.bulk_max_in_flight,
         )
 
         # Get app IDs if not provided (only unsynced apps for resume capability)
@@ -74,64 +77,90 @@ class BulkSyncWorker:
         total_processed = 0
         total_failed = 0
         batch_count = 0
+        progress_scale = 100 / len(app_ids)
 
-        try:
-            # Fetch and process in batches
-            for batch_data in self._fetcher.fetch_all_apps(app_ids):
-                batch_count += 1
-
-                # Extract structured data
-                extracted = []
-                batch_app_count = len(batch_data)
-                logger.info(f"Processing {batch_app_count} apps from PICS response")
-
-                for appid_str, raw_data in batch_data.items():
-                    try:
-                        appid = int(appid_str)
-                        extracted.append(self._extractor.extract(appid, raw_data))
-                    except Exception as e:
-                        logger.error(f"Failed to extract app {appid_str}: {e}")
-                        total_failed += 1
-
-                logger.info(f"Extracted {len(extracted)} apps, {batch_app_count - len(extracted)} extraction failures")
-
-                # Persist to database
-                if extracted:
-                    stats = self._db.upsert_apps_batch(extracted, trigger_reason=trigger_reason)
-                    total_processed += stats["updated"]
-                    total_failed += stats["failed"]
-                    logger.info(f"Database upsert: {stats['updated']} updated, {stats['failed']} failed")
-
-                # Log progress
-                elapsed = (datetime.utcnow() - start_time).total_seconds()
-                rate = total_processed / elapsed if elapsed > 0 else 0
+        def finish_batch(batch_number: int, upsert: Optional["Future[Dict[str, int]]"]) -> None:
+            """Collect a batch's upsert result, if any, then log progress and report health."""
+            nonlocal total_processed, total_failed
+
+            if upsert is not None:
+                stats = upsert.result()
+                total_processed += stats["updated"]
+                total_failed += stats["failed"]
                 logger.info(
-                    f"Batch {batch_count}: {total_processed} processed, "
-                    f"{total_failed} failed, {rate:.1f} apps/sec"
+                    "Database upsert: %s updated, %s failed", stats["updated"], stats["failed"]
+                )
+
+            # Log progress
+            elapsed = time.monotonic() - start_time
+            rate = total_processed / elapsed if elapsed > 0 else 0
+            logger.info(
+                "Batch %s: %s processed, %s failed, %.1f apps/sec",
+                batch_number,
+                total_processed,
+                total_failed,
+                rate,
+            )
+
+            # Update health status
+            if self._health:
+                self._health.update_status(
+                    {
+                        "mode": "bulk_sync",
+                        "processed": total_processed,
+                        "failed": total_failed,
+                        "rate": round(rate, 1),
+                        "progress_pct": round(total_processed * progress_scale, 1),
+                        "connected": self._steam.is_connected,
+                        "connection_age_seconds": round(self._steam.connection_age_seconds or 0, 1),
+                    }
                 )
 
-                # Update health status
-                if self._health:
-                    self._health.update_status(
-                        {
-                            "mode": "bulk_sync",
-                            "processed": total_processed,
-                            "failed": total_failed,
-                            "rate": round(rate, 1),
-                            "progress_pct": round(total_processed / len(app_ids) * 100, 1)
-                            if app_ids
-                            else 0,
-                            "connected": self._steam.is_connected,
-                            "connection_age_seconds": round(self._steam.connection_age_seconds or 0, 1),
-                        }
+        try:
+            # Persist batches on background threads while the next one is fetched
+            # from Steam; the Steam client stays on this thread. At most
+            # BULK_UPSERT_IN_FLIGHT upserts run at once, and results are collected
+            # oldest first.
+            upsert_in_flight = max(1, settings.bulk_upsert_in_flight)
+            with ThreadPoolExecutor(
+                max_workers=upsert_in_flight, thread_name_prefix="pics-bulk-upsert"
+            ) as upsert_executor:
+                pending_upserts: Deque[Tuple[int, "Future[Dict[str, int]]"]] = deque()
+
+                # Fetch and process in batches
+                for batch_data in self._fetcher.fetch_all_apps(app_ids):
+                    batch_count += 1
+
+                    # Extract structured data
+                    logger.info("Processing %s apps from PICS response", len(batch_data))
+                    extracted, extract_failures = self._extractor.extract_batch(batch_data)
+                    total_failed += extract_failures
+                    logger.info(
+                        "Extracted %s apps, %s extraction failures",
+                        len(extracted),
+                        extract_failures,
                     )
 
+                    # Persist to database
+                    if extracted:
+                        while len(pending_upserts) >= upsert_in_flight:
+                            finish_batch(*pending_upserts.popleft())
+                        upsert = upsert_executor.submit(
+                            self._db.upsert_apps_batch, extracted, trigger_reason=trigger_reason
+                        )
+                        pending_upserts.append((batch_count, upsert))
+                    else:
+                        finish_batch(batch_count, None)
+
+                while pending_upserts:
+                    finish_batch(*pending_upserts.popleft())
+
         finally:
             # Disconnect from Steam
             self._steam.disconnect()
 
         # Final stats
-        elapsed = (datetime.utcnow() - start_time).total_seconds()
+        elapsed = time.monotonic() - start_time
         logger.info(
             f"Bulk sync complete in {elapsed:.1f}s: "
             f"{total_processed} processed, {total_failed} failed"
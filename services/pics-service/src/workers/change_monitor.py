@@ -4,7 +4,9 @@ import logging
 import time
 from collections import deque
 from datetime import datetime
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import gevent
 
 from ..steam.client import PICSSteamClient
 from ..steam.pics import PICSFetcher
@@ -30,12 +32,17 @@ class ChangeMonitorWorker:
         self._steam = PICSSteamClient()
         self._fetcher: Optional[PICSFetcher] = None
         self._extractor = PICSExtractor()
-        self._db = PICSDatabase()
+        # Adjacent change notifications often repeat appids, so reuse recent
+        # pre-upsert app state instead of re-querying it for every batch.
+        self._db = PICSDatabase(cache_app_state=True)
         self._health = health_server
 
         self._change_queue: deque = deque(maxlen=settings.max_queue_size)
+        self._queued_set: Set[int] = set()  # mirrors _change_queue for O(1) membership
+        self._queue_filled_at: Optional[float] = None  # monotonic time the queue became non-empty
         self._processing_set: Set[int] = set()
         self._running = False
+        self._poll_interval: float = float(settings.poll_interval)
         self._consecutive_poll_failures = 0
         self._last_poll_error: Optional[str] = None
         self._last_successful_change_poll_at: Optional[str] = None
@@ -72,41 +79,46 @@ class ChangeMonitorWorker:
             # Main loop
             while self._running:
                 try:
-                    # Check for new changes
-                    changes = self._fetcher.get_changes_since(last_change)
+                    # Start fetching the next queued batch so its PICS round-trip
+                    # overlaps the change poll; it is persisted as soon as the
+                    # poll returns, before the poll's own changes are queued. Both
+                    # share the fetcher's reconnect guard if Steam has dropped.
+                    pending_batch = self._start_queue_batch() if self._queue_ready() else None
+                    try:
+                        # Check for new changes
+                        changes = self._fetcher.get_changes_since(last_change)
+                    finally:
+                        if pending_batch is not None:
+                            self._finish_queue_batch(pending_batch, last_change)
                     self._consecutive_poll_failures = 0
                     self._last_poll_error = None
                     self._last_successful_change_poll_at = datetime.utcnow().isoformat()
 
+                    found_changes = False
                     if changes and changes.change_number > last_change:
+                        found_changes = bool(changes.app_changes)
                         # Queue changed apps
-                        new_apps = [
-                            appid
-                            for appid in changes.app_changes
-                            if appid not in self._processing_set
-                        ]
-
-                        for appid in new_apps:
-                            if len(self._change_queue) < settings.max_queue_size:
-                                self._change_queue.append(appid)
+                        queued = self._enqueue_changed_apps(changes.app_changes)
 
                         logger.info(
                             f"Change {changes.change_number}: "
                             f"{len(changes.app_changes)} apps changed, "
-                            f"{len(new_apps)} queued (queue size: {len(self._change_queue)})"
+                            f"{queued} queued (queue size: {len(self._change_queue)})"
                         )
 
                         last_change = changes.change_number
                         self._db.set_last_change_number(last_change)
 
-                    # Process queued apps
-                    self._process_queue(last_change)
+                    # Process queued apps right away when nothing was prefetched
+                    if pending_batch is None and self._queue_ready():
+                        self._process_queue(last_change)
 
                     # Update health status
                     self._update_health_status(last_change)
 
-                    # Wait before next poll
-                    time.sleep(settings.poll_interval)
+                    # Wait before next poll. gevent.sleep keeps the Steam client's
+                    # heartbeat and callbacks running through long idle intervals.
+                    gevent.sleep(self._adapt_poll_interval(found_changes))
 
                 except Exception as e:
                     self._consecutive_poll_failures += 1
@@ -129,37 +141,80 @@ class ChangeMonitorWorker:
                         ) from e
 
                     self._update_health_status(last_change)
-                    time.sleep(backoff_seconds)
+                    gevent.sleep(backoff_seconds)
         finally:
             self._steam.disconnect()
 
+    def _enqueue_changed_apps(self, app_changes: List[int]) -> int:
+        """Queue changed apps not already queued or processing, up to max_queue_size."""
+        queued_set = self._queued_set
+        processing_set = self._processing_set
+        # dict.fromkeys drops repeats within the change set while keeping Steam's order
+        new_apps = [
+            appid
+            for appid in dict.fromkeys(app_changes)
+            if appid not in queued_set and appid not in processing_set
+        ]
+
+        room = max(0, settings.max_queue_size - len(self._change_queue))
+        taken = new_apps[:room]
+        self._requeue(taken)
+        return len(taken)
+
+    def _requeue(self, appids: List[int]):
+        """Append apps to the queue, starting the coalescing clock if it was empty."""
+        if appids and not self._change_queue:
+            self._queue_filled_at = time.monotonic()
+        self._change_queue.extend(appids)
+        self._queued_set.update(appids)
+
+    def _queue_ready(self) -> bool:
+        """Whether queued apps fill a batch or have waited out the coalescing window."""
+        if not self._change_queue:
+            return False
+        if len(self._change_queue) >= settings.process_batch_size:
+            return True
+        waited = time.monotonic() - (self._queue_filled_at or 0.0)
+        return waited >= settings.process_coalesce_seconds
+
     def _process_queue(self, trigger_cursor: Optional[int] = None):
         """Process a batch of queued apps."""
+        pending_batch = self._start_queue_batch()
+        if pending_batch is not None:
+            self._finish_queue_batch(pending_batch, trigger_cursor)
+
+    def _start_queue_batch(self) -> Optional[Tuple[List[int], gevent.Greenlet]]:
+        """Take a batch from the queue and start fetching its PICS data in a greenlet."""
         if not self._change_queue:
-            return
+            return None
 
         # Get batch from queue
-        batch = []
-        while self._change_queue and len(batch) < settings.process_batch_size:
-            appid = self._change_queue.popleft()
-            batch.append(appid)
-            self._processing_set.add(appid)
+        popleft = self._change_queue.popleft
+        batch_size = min(len(self._change_queue), settings.process_batch_size)
+        batch = [popleft() for _ in range(batch_size)]
+        self._queued_set.difference_update(batch)
+        self._processing_set.update(batch)
+        if not self._change_queue:
+            self._queue_filled_at = None
 
         if not batch:
-            return
+            return None
+
+        return batch, gevent.spawn(self._fetcher.fetch_apps_batch, batch)
 
+    def _finish_queue_batch(
+        self,
+        pending_batch: Tuple[List[int], gevent.Greenlet],
+        trigger_cursor: Optional[int] = None,
+    ):
+        """Wait for a started batch fetch, then extract and persist it."""
+        batch, request = pending_batch
         try:
             # Fetch PICS data
-            raw_data = self._fetcher.fetch_apps_batch(batch)
+            raw_data = request.get()
 
             # Extract and persist
-            extracted = []
-            for appid_str, data in raw_data.items():
-                try:
-                    appid = int(appid_str)
-                    extracted.append(self._extractor.extract(appid, data))
-                except Exception as e:
-                    logger.error(f"Failed to extract app {appid_str}: {e}")
+            extracted, _ = self._extractor.extract_batch(raw_data)
 
             if extracted:
                 self._db.upsert_apps_batch(
@@ -173,13 +228,22 @@ class ChangeMonitorWorker:
         except Exception as e:
             logger.error(f"Failed to process queue batch: {e}")
             # Re-queue failed apps
-            for appid in batch:
-                if len(self._change_queue) < settings.max_queue_size:
-                    self._change_queue.append(appid)
+            room = max(0, settings.max_queue_size - len(self._change_queue))
+            self._requeue(batch[:room])
         finally:
             # Remove from processing set
-            for appid in batch:
-                self._processing_set.discard(appid)
+            self._processing_set.difference_update(batch)
+
+    def _adapt_poll_interval(self, found_changes: bool) -> float:
+        """Halve the poll interval while changes or a backlog are pending, else grow it by half."""
+        # The configured POLL_INTERVAL always stays inside the adaptive range
+        if found_changes or self._change_queue:
+            floor = min(settings.min_poll_interval, settings.poll_interval)
+            self._poll_interval = max(floor, self._poll_interval / 2)
+        else:
+            ceiling = max(settings.max_poll_interval, settings.poll_interval)
+            self._poll_interval = min(ceiling, self._poll_interval * 1.5)
+        return self._poll_interval
 
     def stop(self):
         """Signal the monitor to stop."""
@@ -201,6 +265,7 @@ class ChangeMonitorWorker:
                 "health_state": health_state,
                 "last_change": last_change,
                 "queue_size": len(self._change_queue),
+                "poll_interval_seconds": round(self._poll_interval, 1),
                 "processing": len(self._processing_set),
                 "connected": self._steam.is_connected,
                 "steam_connected": self._steam.is_connected,
@@ -0,0 +1,77 @@
+import os
+from pathlib import Path
+import sys
+import threading
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+import src.workers.bulk_sync as bulk_sync_module
+from src.workers.bulk_sync import BulkSyncWorker
+
+
+class FakeSteamClient:
+    is_connected = True
+    connection_age_seconds = None
+
+    def set_heartbeat_interval(self, _seconds):
+        return None
+
+    def set_auto_reconnect(self, _enabled):
+        return None
+
+    def connect(self):
+        return True
+
+    def disconnect(self):
+        return None
+
+
+class FakeExtractor:
+    def extract_batch(self, raw_apps):
+        return list(raw_apps), 0
+
+
+class OverlapDatabase:
+    """Blocks the first upsert until the next batch has been fetched."""
+
+    def __init__(self):
+        self.next_batch_fetched = threading.Event()
+        self.upserted = []
+
+    def upsert_apps_batch(self, apps, trigger_reason):
+        if not self.upserted:
+            assert self.next_batch_fetched.wait(
+                timeout=5
+            ), "next batch was not fetched during the upsert"
+        self.upserted.append((list(apps), trigger_reason))
+        return {"updated": len(apps), "failed": 0}
+
+
+def test_bulk_sync_fetches_next_batch_while_previous_upsert_runs(monkeypatch):
+    database = OverlapDatabase()
+
+    class FakeFetcher:
+        def __init__(self, *_args, **_kwargs):
+            pass
+
+        def fetch_all_apps(self, _appids):
+            yield {1: {}, 2: {}}
+            database.next_batch_fetched.set()
+            yield {3: {}}
+
+    monkeypatch.setattr(bulk_sync_module, "PICSFetcher", FakeFetcher)
+    worker = object.__new__(BulkSyncWorker)
+    worker._steam = FakeSteamClient()
+    worker._fetcher = None
+    worker._extractor = FakeExtractor()
+    worker._db = database
+    worker._health = None
+
+    result = worker.run(app_ids=[1, 2, 3], trigger_reason="bulk_sync")
+
+    assert sorted(database.upserted) == [([1, 2], "bulk_sync"), ([3], "bulk_sync")]
+    assert result["processed"] == 3
+    assert result["failed"] == 0
@@ -1,8 +1,9 @@
 import os
 from pathlib import Path
 import sys
-from types import ModuleType
+from types import ModuleType, SimpleNamespace
 
+import gevent
 import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -18,10 +19,22 @@ fake_bulk_sync_module = ModuleType("src.workers.bulk_sync")
 fake_bulk_sync_module.BulkSyncWorker = object
 sys.modules.setdefault("src.workers.bulk_sync", fake_bulk_sync_module)
 
+import src.steam.pics as pics_module
+from src.steam.pics import PICSChange, PICSFetcher
 import src.workers.change_monitor as change_monitor_module
 from src.workers.change_monitor import ChangeMonitorWorker
 
 
+class WorkerGevent:
+    """Stand-in for gevent in the worker module whose sleep runs on_sleep instead of waiting."""
+
+    def __init__(self, on_sleep):
+        self.sleep = on_sleep
+
+    def __getattr__(self, name):
+        return getattr(gevent, name)
+
+
 class FakeSteamClient:
     def __init__(self):
         self.is_connected = True
@@ -83,7 +96,7 @@ def test_change_monitor_exits_after_repeated_poll_failures(monkeypatch):
     worker._db = FakeDatabase()
 
     monkeypatch.setattr(change_monitor_module, "PICSFetcher", lambda *_args, **_kwargs: fake_fetcher)
-    monkeypatch.setattr(change_monitor_module.time, "sleep", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(change_monitor_module, "gevent", WorkerGevent(lambda *_args: None))
 
     with pytest.raises(RuntimeError, match="Exceeded consecutive change poll failures"):
         worker.run()
@@ -91,3 +104,223 @@ def test_change_monitor_exits_after_repeated_poll_failures(monkeypatch):
     assert fake_fetcher.calls == worker.MAX_CONSECUTIVE_POLL_FAILURES
     assert fake_health.updates[-1]["health_state"] == "unhealthy"
     assert worker._steam.disconnect_called is True
+
+
+def test_enqueue_changed_apps_skips_repeats_and_respects_queue_capacity(monkeypatch):
+    monkeypatch.setattr(change_monitor_module.settings, "max_queue_size", 4)
+    worker = ChangeMonitorWorker()
+    worker._enqueue_changed_apps([10])
+    worker._processing_set.add(20)
+
+    queued = worker._enqueue_changed_apps([30, 10, 20, 30, 40, 50, 60])
+
+    assert queued == 3
+    assert list(worker._change_queue) == [10, 30, 40, 50]
+    assert worker._queued_set == {10, 30, 40, 50}
+
+
+def test_process_queue_releases_apps_for_requeue_after_processing(monkeypatch):
+    monkeypatch.setattr(change_monitor_module.settings, "process_batch_size", 2)
+    worker = ChangeMonitorWorker()
+    worker._enqueue_changed_apps([1, 2, 3])
+    worker._fetcher = SimpleNamespace(fetch_apps_batch=lambda _batch: {})
+
+    worker._process_queue()
+
+    assert list(worker._change_queue) == [3]
+    assert worker._queued_set == {3}
+    assert worker._processing_set == set()
+    assert worker._enqueue_changed_apps([1, 3]) == 1
+    assert list(worker._change_queue) == [3, 1]
+
+
+def test_poll_interval_shrinks_while_busy_and_grows_while_idle(monkeypatch):
+    monkeypatch.setattr(change_monitor_module.settings, "poll_interval", 30)
+    monkeypatch.setattr(change_monitor_module.settings, "min_poll_interval", 5)
+    monkeypatch.setattr(change_monitor_module.settings, "max_poll_interval", 60)
+    worker = ChangeMonitorWorker()
+
+    assert worker._adapt_poll_interval(found_changes=True) == 15
+    worker._enqueue_changed_apps([1])
+    assert worker._adapt_poll_interval(found_changes=False) == 7.5
+    assert worker._adapt_poll_interval(found_changes=False) == 5
+    worker._change_queue.clear()
+    assert worker._adapt_poll_interval(found_changes=False) == 7.5
+    for _ in range(10):
+        worker._adapt_poll_interval(found_changes=False)
+    assert worker._poll_interval == 60
+
+
+def test_change_monitor_fetches_queued_batch_while_polling(monkeypatch):
+    events = []
+
+    class OverlappingFetcher:
+        def get_changes_since(self, change_number):
+            events.append("poll started")
+            gevent.sleep(0.02)
+            events.append("poll finished")
+            return PICSChange(change_number=change_number + 1, app_changes=[7], package_changes=[])
+
+        def fetch_apps_batch(self, batch):
+            events.append(f"fetch {batch}")
+            return {appid: {} for appid in batch}
+
+    class RecordingDatabase(FakeDatabase):
+        def upsert_apps_batch(self, extracted, trigger_reason, trigger_cursor):
+            events.append(f"upsert {[app.appid for app in extracted]} at {trigger_cursor}")
+            return {"updated": len(extracted), "failed": 0}
+
+    monkeypatch.setattr(change_monitor_module.settings, "process_coalesce_seconds", 0)
+    worker = ChangeMonitorWorker()
+    worker._steam = FakeSteamClient()
+    worker._db = RecordingDatabase()
+    worker._enqueue_changed_apps([1, 2])
+
+    def stop_after_first_poll(*_args, **_kwargs):
+        worker._running = False
+
+    monkeypatch.setattr(
+        change_monitor_module, "PICSFetcher", lambda *_args, **_kwargs: OverlappingFetcher()
+    )
+    monkeypatch.setattr(change_monitor_module, "gevent", WorkerGevent(stop_after_first_poll))
+
+    worker.run()
+
+    assert events == [
+        "poll started",
+        "fetch [1, 2]",
+        "poll finished",
+        "upsert [1, 2] at 10",
+    ]
+    assert list(worker._change_queue) == [7]
+    assert worker._db.last_change_number == 11
+
+
+def test_prefetch_and_poll_share_one_reconnect_after_disconnect(monkeypatch):
+    class DisconnectedSteamClient(FakeSteamClient):
+        def __init__(self):
+            super().__init__()
+            self.is_connected = False
+            self.reconnect_calls = 0
+            self.client = SimpleNamespace(
+                get_changes_since=lambda change_number, **_kwargs: SimpleNamespace(
+                    current_change_number=change_number, app_changes=[]
+                ),
+                get_product_info=lambda apps, timeout: {"apps": {appid: {} for appid in apps}},
+            )
+
+        def ensure_connected(self, wait_timeout=120, reconnect_attempts=3):
+            if self.is_connected:
+                return True
+            self.reconnect_calls += 1
+            gevent.sleep(0.01)
+            self.is_connected = True
+            return True
+
+    class RecordingDatabase(FakeDatabase):
+        def __init__(self):
+            super().__init__()
+            self.upserted = []
+
+        def upsert_apps_batch(self, extracted, trigger_reason, trigger_cursor):
+            self.upserted.extend(app.appid for app in extracted)
+            return {"updated": len(extracted), "failed": 0}
+
+    monkeypatch.setattr(change_monitor_module.settings, "process_coalesce_seconds", 0)
+    worker = ChangeMonitorWorker()
+    steam = DisconnectedSteamClient()
+    worker._steam = steam
+    worker._db = RecordingDatabase()
+    worker._enqueue_changed_apps([1, 2])
+
+    def stop_after_first_poll(*_args, **_kwargs):
+        worker._running = False
+
+    monkeypatch.setattr(
+        change_monitor_module,
+        "PICSFetcher",
+        lambda client, **kwargs: PICSFetcher(client, **kwargs),
+    )
+    monkeypatch.setattr(change_monitor_module, "gevent", WorkerGevent(stop_after_first_poll))
+
+    worker.run()
+
+    assert steam.reconnect_calls == 1
+    assert worker._db.upserted == [1, 2]
+    assert worker._consecutive_poll_failures == 0
+
+
+def test_prefetched_batch_keeps_fetching_while_the_poll_backs_off(monkeypatch):
+    events = []
+    poll_attempts = []
+
+    def get_changes_since(change_number, **_kwargs):
+        poll_attempts.append(change_number)
+        if len(poll_attempts) == 1:
+            events.append("poll failed")
+            raise TimeoutError("no response")
+        events.append("poll answered")
+        return SimpleNamespace(current_change_number=change_number, app_changes=[])
+
+    def get_product_info(apps, timeout):
+        events.append(f"fetch {apps}")
+        return {"apps": {appid: {} for appid in apps}}
+
+    class RecordingDatabase(FakeDatabase):
+        def upsert_apps_batch(self, extracted, trigger_reason, trigger_cursor):
+            events.append(f"upsert {[app.appid for app in extracted]}")
+            return {"updated": len(extracted), "failed": 0}
+
+    class FastGevent:
+        def __getattr__(self, name):
+            return getattr(gevent, name)
+
+        @staticmethod
+        def sleep(seconds=0):
+            gevent.sleep(seconds / 1000)
+
+    monkeypatch.setattr(change_monitor_module.settings, "process_coalesce_seconds", 0)
+    worker = ChangeMonitorWorker()
+    steam = FakeSteamClient()
+    steam.client = SimpleNamespace(
+        get_changes_since=get_changes_since,
+        get_product_info=get_product_info,
+    )
+    worker._steam = steam
+    worker._db = RecordingDatabase()
+    worker._enqueue_changed_apps([1, 2])
+
+    def stop_after_first_poll(*_args, **_kwargs):
+        worker._running = False
+
+    monkeypatch.setattr(
+        change_monitor_module,
+        "PICSFetcher",
+        lambda client, **kwargs: PICSFetcher(client, **kwargs),
+    )
+    monkeypatch.setattr(pics_module, "gevent", FastGevent())
+    monkeypatch.setattr(change_monitor_module, "gevent", WorkerGevent(stop_after_first_poll))
+
+    worker.run()
+
+    assert events == ["poll failed", "fetch [1, 2]", "poll answered", "upsert [1, 2]"]
+
+
+def test_partial_queue_waits_for_coalescing_window_unless_batch_is_full(monkeypatch):
+    clock = {"now": 100.0}
+    monkeypatch.setattr(change_monitor_module.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(change_monitor_module.settings, "process_batch_size", 3)
+    monkeypatch.setattr(change_monitor_module.settings, "process_coalesce_seconds", 10)
+    worker = ChangeMonitorWorker()
+
+    assert worker._queue_ready() is False
+    worker._enqueue_changed_apps([1, 2])
+    clock["now"] = 105.0
+    assert worker._queue_ready() is False
+    clock["now"] = 110.0
+    assert worker._queue_ready() is True
+
+    worker._change_queue.clear()
+    worker._queued_set.clear()
+    worker._enqueue_changed_apps([1, 2, 3])
+    assert worker._queue_ready() is True
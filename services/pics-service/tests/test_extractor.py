@@ -0,0 +1,107 @@
+from pathlib import Path
+import sys
+from datetime import datetime
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.extractors.common import (
+    Association,
+    PICSExtractor,
+    SteamDeckCompatibility,
+    _parse_timestamp,
+)
+
+def build_raw_app():
+    return {
+        "appinfo": {
+            "common": {
+                "name": "Counter-Strike 2",
+                "type": "Game",
+                "parent": "0",
+                "developer": "Valve",
+                "associations": {
+                    "0": {"type": "developer", "name": "Valve"},
+                    "1": {"type": "publisher", "name": "Valve"},
+                    "2": {"type": "franchise"},
+                },
+                "steam_release_date": "1695772800",
+                "releasestate": "released",
+                "review_score": "9",
+                "review_percentage": "88",
+                "store_tags": {"0": "1663", "1": "19", "2": "oops"},
+                "genres": {"0": "1"},
+                "primary_genre": "1",
+                "category": {"category_2": "1", "category_28": "0", "not_a_category": "1"},
+                "oslist": "windows, linux,",
+                "controller_support": "full",
+                "steam_deck_compatibility": {"category": "3", "test_timestamp": "1696000000"},
+                "isfreeapp": "1",
+            },
+            "extended": {
+                "publisher": "Valve Corporation",
+                "listofdlc": "100, 200,x",
+                "homepage": "https://cs.com",
+            },
+            "config": {"workshop": {}},
+            "depots": {"branches": {"public": {"buildid": "111", "timeupdated": "1696100000"}}},
+        }
+    }
+
+
+def test_extract_maps_common_extended_and_depot_fields():
+    app = PICSExtractor().extract(730, build_raw_app())
+
+    assert app.name == "Counter-Strike 2"
+    assert app.type == "Game"
+    assert app.developer == "Valve"
+    assert app.publisher == "Valve Corporation"
+    assert app.associations == [
+        Association(type="developer", name="Valve"),
+        Association(type="publisher", name="Valve"),
+    ]
+    assert app.parent_appid == 0
+    assert app.dlc_appids == [100, 200]
+    assert app.steam_release_date == datetime.fromtimestamp(1695772800)
+    assert app.last_update_timestamp == datetime.fromtimestamp(1696100000)
+    assert app.review_score == 9
+    assert app.store_tags == [1663, 19]
+    assert app.genres == [1]
+    assert app.primary_genre == 1
+    assert app.categories == {2: True, 28: False}
+    assert app.platforms == ["windows", "linux"]
+    assert app.steam_deck == SteamDeckCompatibility(category=3, test_timestamp=1696000000)
+    assert app.has_workshop is True
+    assert app.is_free is True
+    assert app.homepage_url == "https://cs.com"
+    assert app.current_build_id == "111"
+
+
+def test_extract_handles_unwrapped_and_sparse_payloads():
+    app = PICSExtractor().extract(10, {"common": {"name": "Sparse"}})
+
+    assert app.name == "Sparse"
+    assert app.dlc_appids == []
+    assert app.steam_release_date is None
+    assert app.steam_deck is None
+    assert app.current_build_id is None
+    assert app.has_workshop is False
+
+
+def test_extract_batch_skips_apps_that_fail_to_extract():
+    extracted, failures = PICSExtractor().extract_batch(
+        {10: {"common": {"name": "Sparse"}}, 20: None}
+    )
+
+    assert [app.appid for app in extracted] == [10]
+    assert failures == 1
+
+
+def test_parse_timestamp_accepts_ints_and_digit_strings_and_rejects_garbage():
+    assert _parse_timestamp(1695772800) == datetime.fromtimestamp(1695772800)
+    assert _parse_timestamp("1695772800") == datetime.fromtimestamp(1695772800)
+    assert _parse_timestamp(" 1695772800") == datetime.fromtimestamp(1695772800)
+    assert _parse_timestamp(0) is None
+    assert _parse_timestamp("") is None
+    assert _parse_timestamp("soon") is None
+    assert _parse_timestamp("²") is None
+    assert _parse_timestamp(10**20) is None
@@ -1,3 +1,6 @@
+from datetime import datetime
+from io import BytesIO
+import json
 from pathlib import Path
 import sys
 
@@ -24,3 +27,38 @@ def test_health_response_fails_when_worker_is_unhealthy():
         assert HealthHandler.get_health_response() == (503, "UNHEALTHY")
     finally:
         HealthHandler._status = original_status
+
+
+def test_status_json_response_serializes_naive_datetimes_as_utc():
+    handler = object.__new__(HealthHandler)
+    handler.wfile = BytesIO()
+
+    handler._send_json_response(
+        200, {"mode": "change_monitor", "last_poll": datetime(2026, 10, 14, 12, 0, 0)}
+    )
+
+    head, body = handler.wfile.getvalue().split(b"\r\n\r\n", 1)
+    assert head.startswith(b"HTTP/1.0 200 OK\r\n")
+    assert f"Content-Length: {len(body)}".encode() in head
+    assert json.loads(body) == {
+        "mode": "change_monitor",
+        "last_poll": "2026-10-14T12:00:00Z",
+    }
+
+
+def test_health_endpoint_writes_prebuilt_text_response():
+    original_status = dict(HealthHandler._status)
+    handler = object.__new__(HealthHandler)
+    handler.wfile = BytesIO()
+    handler.path = "/health"
+
+    try:
+        HealthHandler._status = {"status": "running", "health_state": "unhealthy"}
+        handler.do_GET()
+    finally:
+        HealthHandler._status = original_status
+
+    assert handler.wfile.getvalue() == (
+        b"HTTP/1.0 503 Service Unavailable\r\n"
+        b"Content-Type: text/plain\r\nContent-Length: 9\r\n\r\nUNHEALTHY"
+    )
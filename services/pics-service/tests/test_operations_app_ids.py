@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+
+from cachetools import TTLCache
+import pytest
+
+os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import src.database.operations as operations_module
+from src.database.operations import PICSDatabase
+
+
+class FakeRpcQuery:
+    def __init__(self, data: List[int]):
+        self._data = data
+
+    def execute(self) -> SimpleNamespace:
+        return SimpleNamespace(data=self._data)
+
+
+class FakeAppIdClient:
+    def __init__(self, appids: List[int]):
+        self.appids = appids
+        self.rpc_calls: List[Tuple[str, Dict[str, Any]]] = []
+
+    def rpc(self, name: str, params: Dict[str, Any]) -> FakeRpcQuery:
+        self.rpc_calls.append((name, params))
+        page = [appid for appid in self.appids if appid > params["p_last_appid"]]
+        return FakeRpcQuery(page[: params["p_limit"]])
+
+
+def build_database(client: FakeAppIdClient, page_size: int) -> PICSDatabase:
+    database = object.__new__(PICSDatabase)
+    database._db = SimpleNamespace(client=client)
+    database._tiger_latest_state_store = None
+    database.APP_ID_PAGE_SIZE = page_size
+    return database
+
+
+def test_get_all_app_ids_pages_through_array_rpc() -> None:
+    client = FakeAppIdClient([10, 20, 30, 40, 50])
+    database = build_database(client, page_size=2)
+
+    assert database.get_all_app_ids() == [10, 20, 30, 40, 50]
+    assert client.rpc_calls == [
+        ("get_app_ids_after", {"p_last_appid": 0, "p_limit": 2}),
+        ("get_app_ids_after", {"p_last_appid": 20, "p_limit": 2}),
+        ("get_app_ids_after", {"p_last_appid": 40, "p_limit": 2}),
+    ]
+
+
+def test_get_unsynced_app_ids_stops_on_short_page() -> None:
+    client = FakeAppIdClient([10, 20, 30])
+    database = build_database(client, page_size=5)
+
+    assert database.get_all_app_ids(unsynced_only=True) == [10, 20, 30]
+    assert client.rpc_calls == [
+        ("get_unsynced_pics_app_ids_after", {"p_last_appid": 0, "p_limit": 5}),
+    ]
+
+
+class FakeSyncStateClient:
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.rpc_calls: List[Tuple[str, Dict[str, Any]]] = []
+
+    def rpc(self, name: str, params: Dict[str, Any]) -> FakeRpcQuery:
+        self.rpc_calls.append((name, params))
+        rows = [dict(row) for row in self.rows if row["appid"] in params["p_appids"]]
+        if "p_name_appids" in params:
+            for row in rows:
+                if row["appid"] not in params["p_name_appids"]:
+                    row["name"] = None
+        return FakeRpcQuery(rows)
+
+
+def test_get_app_sync_state_reads_existence_names_and_storefront_flags_in_one_rpc() -> None:
+    client = FakeSyncStateClient(
+        [
+            {"appid": 10, "name": "Ten", "has_raw_date": True, "has_storefront_sync": False},
+            {"appid": 20, "name": None, "has_raw_date": False, "has_storefront_sync": True},
+        ]
+    )
+    database = object.__new__(PICSDatabase)
+    database._db = SimpleNamespace(client=client)
+    database._tiger_latest_state_store = None
+
+    state = database._get_app_sync_state([10, 20, 30])
+
+    assert client.rpc_calls == [("check_app_sync_state", {"p_appids": [10, 20, 30]})]
+    assert state.existing_appids == {10, 20}
+    assert state.existing_names == {10: "Ten"}
+    assert state.storefront_date_appids == {10}
+    assert state.storefront_sync_appids == {20}
+
+
+def test_get_app_sync_state_only_requests_names_for_name_appids() -> None:
+    client = FakeSyncStateClient(
+        [
+            {"appid": 10, "name": "Ten", "has_raw_date": False, "has_storefront_sync": False},
+            {"appid": 20, "name": "Twenty", "has_raw_date": False, "has_storefront_sync": False},
+        ]
+    )
+    database = object.__new__(PICSDatabase)
+    database._db = SimpleNamespace(client=client)
+    database._tiger_latest_state_store = None
+
+    state = database._get_app_sync_state([10, 20], name_appids=[20])
+
+    assert client.rpc_calls == [
+        ("check_app_sync_state", {"p_appids": [10, 20], "p_name_appids": [20]})
+    ]
+    assert state.existing_appids == {10, 20}
+    assert state.existing_names == {20: "Twenty"}
+
+
+def test_get_app_sync_state_requests_pages_concurrently_and_merges_them(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(operations_module.settings, "pics_relation_sync_workers", 3)
+    appids = list(range(1, 2501))
+    client = FakeSyncStateClient(
+        [
+            {"appid": appid, "name": None, "has_raw_date": False, "has_storefront_sync": False}
+            for appid in appids
+        ]
+    )
+    database = object.__new__(PICSDatabase)
+    database._db = SimpleNamespace(client=client)
+    database._tiger_latest_state_store = None
+
+    state = database._get_app_sync_state(appids)
+
+    assert sorted(len(params["p_appids"]) for _, params in client.rpc_calls) == [500, 1000, 1000]
+    assert state.existing_appids == set(appids)
+
+
+def test_get_app_sync_state_reuses_cached_state_for_existing_apps() -> None:
+    client = FakeSyncStateClient(
+        [
+            {"appid": 10, "name": "Ten", "has_raw_date": True, "has_storefront_sync": True},
+            {"appid": 20, "name": "Twenty", "has_raw_date": False, "has_storefront_sync": False},
+        ]
+    )
+    database = object.__new__(PICSDatabase)
+    database._db = SimpleNamespace(client=client)
+    database._tiger_latest_state_store = None
+    database._app_state_cache = TTLCache(maxsize=10, ttl=60)
+
+    database._get_app_sync_state([10, 20, 30], name_appids=[])
+    state = database._get_app_sync_state([10, 20, 30], name_appids=[20])
+
+    assert client.rpc_calls[1] == (
+        "check_app_sync_state",
+        {"p_appids": [20, 30], "p_name_appids": [20]},
+    )
+    assert state.existing_appids == {10, 20}
+    assert state.existing_names == {20: "Twenty"}
+    assert state.storefront_date_appids == {10}
+    assert state.storefront_sync_appids == {10}
+
+
+def test_iter_all_app_ids_fetches_pages_lazily() -> None:
+    client = FakeAppIdClient([10, 20, 30, 40, 50])
+    database = build_database(client, page_size=2)
+
+    appids = database.iter_all_app_ids()
+
+    assert next(appids) == 10
+    assert len(client.rpc_calls) == 1
+    assert list(appids) == [20, 30, 40, 50]
+    assert len(client.rpc_calls) == 3
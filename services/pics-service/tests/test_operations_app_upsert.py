@@ -14,7 +14,7 @@ os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import src.database.operations as operations_module
-from src.database.operations import PICSDatabase
+from src.database.operations import AppSyncState, PICSDatabase
 from src.extractors.common import ExtractedPICSData
 
 
@@ -40,9 +40,15 @@ class FakeTableQuery:
 
 
 class FakeSupabaseClient:
-    def __init__(self, fail_multi_row_batches: bool = False, always_fail_appids: Optional[List[int]] = None):
+    def __init__(
+        self,
+        fail_multi_row_batches: bool = False,
+        always_fail_appids: Optional[List[int]] = None,
+        max_rows_per_request: Optional[int] = None,
+    ):
         self.fail_multi_row_batches = fail_multi_row_batches
         self.always_fail_appids = set(always_fail_appids or [])
+        self.max_rows_per_request = max_rows_per_request
         self.upsert_calls: List[List[Dict[str, Any]]] = []
 
     def table(self, table_name: str) -> FakeTableQuery:
@@ -54,6 +60,9 @@ class FakeSupabaseClient:
         rows = payload if isinstance(payload, list) else [payload]
         self.upsert_calls.append(rows)
 
+        if self.max_rows_per_request is not None and len(rows) > self.max_rows_per_request:
+            raise Exception("413 Payload Too Large")
+
         if self.fail_multi_row_batches and len(rows) > 1:
             raise Exception("simulated batch failure")
 
@@ -74,6 +83,16 @@ class FakeTigerLatestStateStore:
         self.app_records: List[Dict[str, Any]] = []
         self.sync_status_updates: List[tuple[List[int], Optional[str]]] = []
 
+    def get_app_sync_state(
+        self,
+        appids: List[int],
+        name_appids: Optional[List[int]] = None,
+    ) -> List[Dict[str, Any]]:
+        return [
+            {"appid": appid, "name": None, "has_raw_date": False, "has_storefront_sync": False}
+            for appid in appids
+        ]
+
     def get_existing_appids(self, appids: List[int]) -> List[int]:
         return list(appids)
 
@@ -105,6 +124,27 @@ class FakeTigerLatestStateStore:
     def replace_store_tags(self, appid: int, tag_records: List[Dict[str, Any]], tag_ids: List[int]) -> None:
         pass
 
+    def replace_categories_batch(
+        self,
+        category_records: List[Dict[str, Any]],
+        category_ids_by_appid: Dict[int, List[int]],
+    ) -> None:
+        pass
+
+    def replace_genres_batch(
+        self,
+        genre_records: List[Dict[str, Any]],
+        genres_by_appid: Dict[int, tuple[List[int], Optional[int]]],
+    ) -> None:
+        pass
+
+    def replace_store_tags_batch(
+        self,
+        tag_records: List[Dict[str, Any]],
+        tag_ids_by_appid: Dict[int, List[int]],
+    ) -> None:
+        pass
+
     def update_sync_status(self, appids: List[int], trigger_cursor: Optional[str]) -> None:
         self.sync_status_updates.append((list(appids), trigger_cursor))
 
@@ -112,6 +152,7 @@ class FakeTigerLatestStateStore:
 def create_database(monkeypatch: pytest.MonkeyPatch, fake_client: FakeSupabaseClient) -> PICSDatabase:
     monkeypatch.setattr(operations_module.settings, "pics_change_history_target", "supabase")
     monkeypatch.setattr(operations_module.settings, "pics_latest_state_target", "supabase")
+    monkeypatch.setattr(operations_module.settings, "pics_relation_sync_workers", 1)
     monkeypatch.setattr(PICSDatabase, "_load_tag_names", lambda self: None)
     monkeypatch.setattr(
         "src.database.operations.SupabaseClient.get_instance",
@@ -120,6 +161,24 @@ def create_database(monkeypatch: pytest.MonkeyPatch, fake_client: FakeSupabaseCl
     return PICSDatabase()
 
 
+def patch_app_sync_state(
+    monkeypatch: pytest.MonkeyPatch,
+    existing_names: Optional[Dict[int, str]] = None,
+    storefront_date_appids: Optional[set[int]] = None,
+    storefront_sync_appids: Optional[set[int]] = None,
+) -> None:
+    monkeypatch.setattr(
+        PICSDatabase,
+        "_get_app_sync_state",
+        lambda self, appids, name_appids=None: AppSyncState(
+            set(appids),
+            existing_names or {},
+            storefront_date_appids or set(),
+            storefront_sync_appids or set(),
+        ),
+    )
+
+
 def build_app(appid: int, name: Optional[str]) -> ExtractedPICSData:
     return ExtractedPICSData(appid=appid, name=name, type="game")
 
@@ -128,16 +187,15 @@ def test_upsert_apps_batch_preserves_existing_name_when_pics_name_missing(monkey
     fake_client = FakeSupabaseClient()
     db = create_database(monkeypatch, fake_client)
 
-    monkeypatch.setattr(PICSDatabase, "_get_existing_appids", lambda self, appids: appids)
-    monkeypatch.setattr(PICSDatabase, "_get_existing_app_names", lambda self, appids: {123: "Stored Name"})
+    patch_app_sync_state(monkeypatch, existing_names={123: "Stored Name"})
     monkeypatch.setattr(PICSDatabase, "_capture_change_history", lambda *args, **kwargs: None)
-    monkeypatch.setattr(PICSDatabase, "_get_apps_with_storefront_dates", lambda self, appids: set())
-    monkeypatch.setattr(PICSDatabase, "_get_apps_with_storefront_sync", lambda self, appids: set())
     synced_appids: List[int] = []
     monkeypatch.setattr(
         PICSDatabase,
         "_sync_relationships",
-        lambda self, apps, successful_appids, trigger_cursor=None: synced_appids.extend(sorted(successful_appids)),
+        lambda self, apps, successful_appids, trigger_cursor=None, now=None: synced_appids.extend(
+            sorted(successful_appids)
+        ),
     )
 
     stats = db.upsert_apps_batch([build_app(123, None)], trigger_reason="first_pass")
@@ -153,16 +211,15 @@ def test_upsert_apps_batch_retries_individual_rows_after_batch_failure(
     fake_client = FakeSupabaseClient(fail_multi_row_batches=True, always_fail_appids=[222])
     db = create_database(monkeypatch, fake_client)
 
-    monkeypatch.setattr(PICSDatabase, "_get_existing_appids", lambda self, appids: appids)
-    monkeypatch.setattr(PICSDatabase, "_get_existing_app_names", lambda self, appids: {})
+    patch_app_sync_state(monkeypatch)
     monkeypatch.setattr(PICSDatabase, "_capture_change_history", lambda *args, **kwargs: None)
-    monkeypatch.setattr(PICSDatabase, "_get_apps_with_storefront_dates", lambda self, appids: set())
-    monkeypatch.setattr(PICSDatabase, "_get_apps_with_storefront_sync", lambda self, appids: set())
     synced_appids: List[int] = []
     monkeypatch.setattr(
         PICSDatabase,
         "_sync_relationships",
-        lambda self, apps, successful_appids, trigger_cursor=None: synced_appids.extend(sorted(successful_appids)),
+        lambda self, apps, successful_appids, trigger_cursor=None, now=None: synced_appids.extend(
+            sorted(successful_appids)
+        ),
     )
 
     stats = db.upsert_apps_batch(
@@ -177,17 +234,37 @@ def test_upsert_apps_batch_retries_individual_rows_after_batch_failure(
     assert synced_appids == [111]
 
 
+def test_upsert_apps_batch_halves_batches_rejected_as_too_large(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_client = FakeSupabaseClient(max_rows_per_request=2)
+    db = create_database(monkeypatch, fake_client)
+
+    patch_app_sync_state(monkeypatch)
+    monkeypatch.setattr(PICSDatabase, "_capture_change_history", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        PICSDatabase,
+        "_sync_relationships",
+        lambda self, apps, successful_appids, trigger_cursor=None, now=None: None,
+    )
+
+    stats = db.upsert_apps_batch(
+        [build_app(appid, f"App {appid}") for appid in range(1, 6)],
+        trigger_reason="first_pass",
+    )
+
+    assert stats == {"created": 0, "updated": 5, "failed": 0, "skipped": 0}
+    assert [len(rows) for rows in fake_client.upsert_calls] == [5, 2, 3, 1, 2]
+
+
 def test_upsert_apps_batch_splits_storefront_synced_rows_from_fallback_rows(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     fake_client = FakeSupabaseClient()
     db = create_database(monkeypatch, fake_client)
 
-    monkeypatch.setattr(PICSDatabase, "_get_existing_appids", lambda self, appids: appids)
-    monkeypatch.setattr(PICSDatabase, "_get_existing_app_names", lambda self, appids: {})
+    patch_app_sync_state(monkeypatch, storefront_sync_appids={111})
     monkeypatch.setattr(PICSDatabase, "_capture_change_history", lambda *args, **kwargs: None)
-    monkeypatch.setattr(PICSDatabase, "_get_apps_with_storefront_dates", lambda self, appids: set())
-    monkeypatch.setattr(PICSDatabase, "_get_apps_with_storefront_sync", lambda self, appids: {111})
     monkeypatch.setattr(PICSDatabase, "_sync_relationships", lambda *args, **kwargs: None)
 
     stats = db.upsert_apps_batch(
@@ -219,11 +296,8 @@ def test_upsert_apps_batch_splits_release_date_omission_into_a_separate_batch(
     fallback_dated_app = build_app(222, "Fallback Date")
     fallback_dated_app.steam_release_date = datetime(2026, 3, 31)
 
-    monkeypatch.setattr(PICSDatabase, "_get_existing_appids", lambda self, appids: appids)
-    monkeypatch.setattr(PICSDatabase, "_get_existing_app_names", lambda self, appids: {})
+    patch_app_sync_state(monkeypatch, storefront_date_appids={111})
     monkeypatch.setattr(PICSDatabase, "_capture_change_history", lambda *args, **kwargs: None)
-    monkeypatch.setattr(PICSDatabase, "_get_apps_with_storefront_dates", lambda self, appids: {111})
-    monkeypatch.setattr(PICSDatabase, "_get_apps_with_storefront_sync", lambda self, appids: set())
     monkeypatch.setattr(PICSDatabase, "_sync_relationships", lambda *args, **kwargs: None)
 
     stats = db.upsert_apps_batch(
@@ -271,3 +345,62 @@ def test_upsert_apps_batch_uses_tiger_latest_state_when_configured(
     assert fake_client.upsert_calls == []
     assert [record["appid"] for record in fake_store.app_records] == [123]
     assert fake_store.sync_status_updates == [([123], None)]
+
+
+@pytest.mark.parametrize(
+    ("name", "expected_type"),
+    [
+        ("Space Game Demo", "demo"),
+        ("Space Game (Demo)", "demo"),
+        ("Demon Hunter Demo", "game"),
+        ("Space Game Original Soundtrack", "music"),
+        ("Space Game Dedicated Server", "tool"),
+        ("Space Game - Making Of", "video"),
+        ("Space Game", "game"),
+    ],
+)
+def test_infer_type_uses_name_heuristics(name: str, expected_type: str) -> None:
+    database = object.__new__(PICSDatabase)
+
+    assert database._infer_type(ExtractedPICSData(appid=10, name=name)) == expected_type
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "server closed the connection unexpectedly",
+        "terminating connection due to idle-session timeout",
+        "the connection is closed",
+    ],
+)
+def test_dropped_postgres_connections_are_transient(message: str) -> None:
+    database = object.__new__(PICSDatabase)
+
+    assert database._is_history_transient_error(Exception(message)) is True
+
+
+def test_payload_too_large_detection_ignores_ids_containing_413() -> None:
+    database = object.__new__(PICSDatabase)
+
+    assert database._is_payload_too_large_error(
+        Exception({"code": "413", "message": "Request failed"})
+    )
+    assert database._is_payload_too_large_error(Exception("413 Payload Too Large"))
+    assert not database._is_payload_too_large_error(
+        Exception(
+            "duplicate key value violates unique constraint: Key (appid)=(41300) already exists"
+        )
+    )
+
+
+def test_gateway_errors_are_transient_only_by_status() -> None:
+    database = object.__new__(PICSDatabase)
+
+    assert database._is_history_transient_error(
+        Exception({"code": "503", "message": "Request failed"})
+    )
+    assert database._is_history_transient_error(Exception("502 Bad Gateway"))
+    assert not database._is_history_transient_error(
+        Exception("insert or update violates foreign key constraint: Key (appid)=(5030)")
+    )
+    assert not database._is_history_transient_error(Exception("invalid input value 25040"))
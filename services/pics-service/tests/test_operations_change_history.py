@@ -16,7 +16,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import src.database.operations as operations_module
 from src.database.change_intelligence import hash_normalized_snapshot, normalize_pics_snapshot
-from src.database.operations import PICSDatabase
+from src.database.operations import AppSyncState, PICSDatabase
 from src.extractors.common import Association, ExtractedPICSData, SteamDeckCompatibility
 
 
@@ -262,20 +262,25 @@ def create_history_database(monkeypatch: pytest.MonkeyPatch, fake_client: FakeSu
 
 
 def stub_latest_state_writes(monkeypatch: pytest.MonkeyPatch, database: PICSDatabase) -> None:
-    monkeypatch.setattr(database, "_get_existing_appids", lambda appids: appids)
-    monkeypatch.setattr(database, "_get_existing_app_names", lambda appids: {})
-    monkeypatch.setattr(database, "_get_apps_with_storefront_dates", lambda appids: set())
-    monkeypatch.setattr(database, "_get_apps_with_storefront_sync", lambda appids: set())
+    monkeypatch.setattr(
+        database,
+        "_get_app_sync_state",
+        lambda appids, name_appids=None: AppSyncState(set(appids), {}, set(), set()),
+    )
     monkeypatch.setattr(
         database,
         "_build_app_record",
-        lambda app, has_storefront_date=False, has_storefront_sync=False, existing_name=None: {
+        lambda app, existing_name=None, **_kwargs: {
             "appid": app.appid,
             "name": app.name or existing_name,
             "updated_at": datetime.utcnow().isoformat(),
         },
     )
-    monkeypatch.setattr(database, "_sync_relationships", lambda apps, successful_appids, trigger_cursor=None: None)
+    monkeypatch.setattr(
+        database,
+        "_sync_relationships",
+        lambda apps, successful_appids, trigger_cursor=None, now=None: None,
+    )
 
 
 def build_app(**overrides: Any) -> ExtractedPICSData:
@@ -15,7 +15,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import src.database.operations as operations_module
 from src.database.operations import PICSDatabase
-from src.extractors.common import ExtractedPICSData
+from src.extractors.common import Association, ExtractedPICSData, SteamDeckCompatibility
 
 
 class FakeResult:
@@ -65,6 +65,8 @@ class FakeSupabaseClient:
         self.calls: List[tuple[str, str]] = []
         self.rpc_calls: List[tuple[str, Dict[str, Any]]] = []
         self.fail_rpcs: set[str] = set()
+        self.upsert_payloads: List[tuple[str, List[Dict[str, Any]]]] = []
+        self.franchise_ids: Dict[str, int] = {}
         self.tables: Dict[str, List[Dict[str, Any]]] = {
             "app_categories": [],
             "app_dlc": [],
@@ -88,6 +90,7 @@ class FakeSupabaseClient:
 
         if query.action == "upsert":
             rows = self._normalize_rows(query.payload)
+            self.upsert_payloads.append((query.table_name, deepcopy(rows)))
             self._upsert_lookup_rows(query.table_name, rows)
             return FakeResult(rows)
 
@@ -103,6 +106,7 @@ class FakeSupabaseClient:
 
     def execute_rpc(self, function_name: str, params: Dict[str, Any]) -> FakeResult:
         snapshot = deepcopy(self.tables)
+        data: List[Dict[str, Any]] = []
 
         try:
             if function_name in self.fail_rpcs:
@@ -118,6 +122,25 @@ class FakeSupabaseClient:
                 )
             elif function_name == "replace_app_steam_tags":
                 self._replace_app_steam_tags(params["p_appid"], params.get("p_tag_ids"))
+            elif function_name == "replace_app_categories_batch":
+                for record in params["p_records"]:
+                    self._replace_app_categories(record["appid"], record.get("category_ids"))
+            elif function_name == "replace_app_genres_batch":
+                for record in params["p_records"]:
+                    self._replace_app_genres(
+                        record["appid"],
+                        record.get("genre_ids"),
+                        record.get("primary_genre_id"),
+                    )
+            elif function_name == "replace_app_steam_tags_batch":
+                for record in params["p_records"]:
+                    self._replace_app_steam_tags(record["appid"], record.get("tag_ids"))
+            elif function_name == "upsert_franchises_bulk":
+                for name in params["p_names"]:
+                    franchise_id = self.franchise_ids.setdefault(
+                        name.strip(), len(self.franchise_ids) + 1
+                    )
+                    data.append({"id": franchise_id, "name": name.strip()})
             elif function_name == "seed_discovered_apps":
                 pass
             else:
@@ -126,7 +149,7 @@ class FakeSupabaseClient:
             self.tables = snapshot
             raise
 
-        return FakeResult([])
+        return FakeResult(data)
 
     def _replace_app_categories(self, appid: int, category_ids: Optional[List[int]]) -> None:
         desired_ids = sorted({category_id for category_id in (category_ids or []) if category_id is not None})
@@ -280,6 +303,7 @@ def relation_database(monkeypatch: pytest.MonkeyPatch) -> tuple[PICSDatabase, Fa
 
     monkeypatch.setattr(operations_module.settings, "pics_change_history_target", "supabase")
     monkeypatch.setattr(operations_module.settings, "pics_latest_state_target", "supabase")
+    monkeypatch.setattr(operations_module.settings, "pics_relation_sync_workers", 1)
     monkeypatch.setattr(PICSDatabase, "_load_tag_names", lambda self: None)
     monkeypatch.setattr(
         "src.database.operations.SupabaseClient.get_instance",
@@ -287,7 +311,9 @@ def relation_database(monkeypatch: pytest.MonkeyPatch) -> tuple[PICSDatabase, Fa
     )
 
     database = PICSDatabase()
-    monkeypatch.setattr(database, "_batch_update_sync_status", lambda appids, trigger_cursor=None: None)
+    monkeypatch.setattr(
+        database, "_batch_update_sync_status", lambda appids, trigger_cursor=None, now=None: None
+    )
     return database, fake_client
 
 
@@ -305,10 +331,80 @@ def test_empty_relationship_payloads_clear_existing_rows(
     assert rows_for_app(fake_client, "app_genres") == []
     assert rows_for_app(fake_client, "app_steam_tags") == []
     assert [name for name, _ in fake_client.rpc_calls] == [
-        "replace_app_categories",
-        "replace_app_genres",
+        "replace_app_categories_batch",
+        "replace_app_genres_batch",
+        "replace_app_steam_tags_batch",
+    ]
+
+
+def test_sync_relationships_replaces_relations_for_whole_batch_in_one_call_per_table(
+    relation_database: tuple[PICSDatabase, FakeSupabaseClient],
+) -> None:
+    database, fake_client = relation_database
+
+    database._sync_relationships(
+        [
+            build_app(
+                appid=730, categories={2: True}, genres=[1], primary_genre=1, store_tags=[10, 20]
+            ),
+            build_app(
+                appid=570,
+                categories={2: True, 1: True},
+                genres=[1, 3],
+                primary_genre=3,
+                store_tags=[20],
+            ),
+        ],
+        {730, 570},
+    )
+
+    assert [name for name, _ in fake_client.rpc_calls] == [
+        "replace_app_categories_batch",
+        "replace_app_genres_batch",
+        "replace_app_steam_tags_batch",
+    ]
+    assert fake_client.calls.count(("steam_categories", "upsert")) == 1
+    assert fake_client.calls.count(("steam_genres", "upsert")) == 1
+    assert fake_client.calls.count(("steam_tags", "upsert")) == 1
+    assert sorted(row["tag_id"] for row in fake_client.tables["steam_tags"]) == [10, 20]
+    assert [row["category_id"] for row in rows_for_app(fake_client, "app_categories", 570)] == [
+        1,
+        2,
+    ]
+    assert [
+        (row["genre_id"], row["is_primary"]) for row in rows_for_app(fake_client, "app_genres", 570)
+    ] == [(1, False), (3, True)]
+    assert [
+        (row["tag_id"], row["rank"]) for row in rows_for_app(fake_client, "app_steam_tags", 730)
+    ] == [
+        (10, 0),
+        (20, 1),
+    ]
+
+
+def test_sync_relationships_falls_back_to_per_app_calls_after_batch_failure(
+    relation_database: tuple[PICSDatabase, FakeSupabaseClient],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    database, fake_client = relation_database
+    fake_client.fail_rpcs.add("replace_app_steam_tags_batch")
+    synced_appids: List[int] = []
+    monkeypatch.setattr(
+        database,
+        "_batch_update_sync_status",
+        lambda appids, trigger_cursor=None, now=None: synced_appids.extend(appids),
+    )
+
+    database._sync_relationships([build_app(appid=730), build_app(appid=570)], {730, 570})
+
+    assert [name for name, _ in fake_client.rpc_calls] == [
+        "replace_app_categories_batch",
+        "replace_app_genres_batch",
+        "replace_app_steam_tags_batch",
+        "replace_app_steam_tags",
         "replace_app_steam_tags",
     ]
+    assert sorted(synced_appids) == [570, 730]
 
 
 def test_unchanged_relationships_preserve_created_at(
@@ -410,3 +506,260 @@ def test_sync_dlc_relationships_seeds_missing_dlc_ids_before_upsert(
         },
     )
     assert ("app_dlc", "upsert") in fake_client.calls
+
+
+def test_sync_relationships_writes_relation_tables_concurrently_when_configured(
+    relation_database: tuple[PICSDatabase, FakeSupabaseClient],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    database, fake_client = relation_database
+    monkeypatch.setattr(operations_module.settings, "pics_relation_sync_workers", 3)
+
+    database._sync_relationships([build_app(appid=730), build_app(appid=570)], {730, 570})
+
+    assert sorted(name for name, _ in fake_client.rpc_calls) == [
+        "replace_app_categories_batch",
+        "replace_app_genres_batch",
+        "replace_app_steam_tags_batch",
+    ]
+    assert [row["tag_id"] for row in rows_for_app(fake_client, "app_steam_tags", 570)] == [10]
+    assert [row["genre_id"] for row in rows_for_app(fake_client, "app_genres", 730)] == [1]
+
+
+def test_relation_lookup_rows_use_known_names_and_placeholders(
+    relation_database: tuple[PICSDatabase, FakeSupabaseClient],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    database, _fake_client = relation_database
+    monkeypatch.setattr(PICSDatabase, "_tag_name_cache", {19: "Action"})
+
+    assert database._build_category_rows({2: True, 3: True, 500: True, 1: False}) == (
+        [2, 3, 500],
+        [
+            {"category_id": 2, "name": "Single-player"},
+            {"category_id": 3, "name": "Category 3"},
+            {"category_id": 500, "name": "Category 500"},
+        ],
+    )
+    assert database._build_genre_rows([1, 6, -1]) == (
+        [1, 6, -1],
+        [
+            {"genre_id": 1, "name": "Action"},
+            {"genre_id": 6, "name": "Genre 6"},
+            {"genre_id": -1, "name": "Genre -1"},
+        ],
+    )
+    assert database._build_store_tag_rows([19, 42], "2026-03-01T00:00:00")[1] == [
+        {"tag_id": 19, "name": "Action", "updated_at": "2026-03-01T00:00:00"},
+        {"tag_id": 42, "name": "Tag 42", "updated_at": "2026-03-01T00:00:00"},
+    ]
+
+
+def test_sync_relationships_links_batch_franchises_with_one_rpc_and_one_upsert(
+    relation_database: tuple[PICSDatabase, FakeSupabaseClient],
+) -> None:
+    database, fake_client = relation_database
+
+    database._sync_relationships(
+        [
+            build_app(
+                appid=730,
+                associations=[
+                    Association(type="developer", name="Valve"),
+                    Association(type="franchise", name="Counter-Strike"),
+                ],
+            ),
+            build_app(
+                appid=10, associations=[Association(type="franchise", name="Counter-Strike ")]
+            ),
+            build_app(appid=570, associations=[Association(type="franchise", name="Dota")]),
+        ],
+        {730, 10, 570},
+    )
+
+    franchise_rpcs = [
+        params for name, params in fake_client.rpc_calls if name == "upsert_franchises_bulk"
+    ]
+    assert franchise_rpcs == [{"p_names": ["Counter-Strike", "Dota"]}]
+    assert [
+        payload for table, payload in fake_client.upsert_payloads if table == "app_franchises"
+    ] == [
+        [
+            {"appid": 730, "franchise_id": 1},
+            {"appid": 10, "franchise_id": 1},
+            {"appid": 570, "franchise_id": 2},
+        ]
+    ]
+
+
+def test_lookup_rows_are_only_upserted_once_per_process_until_their_name_changes(
+    relation_database: tuple[PICSDatabase, FakeSupabaseClient],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    database, fake_client = relation_database
+
+    database._sync_relationships([build_app(appid=730), build_app(appid=570)], {730, 570})
+    database._sync_relationships([build_app(appid=440)], {440})
+    monkeypatch.setattr(PICSDatabase, "_tag_name_cache", {10: "Renamed Tag"})
+    database._sync_relationships([build_app(appid=10)], {10})
+
+    assert [table for table, _ in fake_client.upsert_payloads] == [
+        "steam_categories",
+        "steam_genres",
+        "steam_tags",
+        "steam_tags",
+    ]
+    assert fake_client.upsert_payloads[-1][1][0]["name"] == "Renamed Tag"
+    assert [row["appid"] for row in fake_client.tables["app_steam_tags"]] == [730, 570, 440, 10]
+
+
+def test_sync_relationships_upserts_steam_deck_rows_for_batch_in_one_call(
+    relation_database: tuple[PICSDatabase, FakeSupabaseClient],
+) -> None:
+    database, fake_client = relation_database
+
+    database._sync_relationships(
+        [
+            build_app(
+                appid=730, steam_deck=SteamDeckCompatibility(category=3, tested_build_id="42")
+            ),
+            build_app(appid=570),
+            build_app(appid=10, steam_deck=SteamDeckCompatibility(category=1)),
+        ],
+        {730, 570, 10},
+        now="2026-10-14T09:00:00",
+    )
+
+    deck_payloads = [
+        payload for table, payload in fake_client.upsert_payloads if table == "app_steam_deck"
+    ]
+    assert len(deck_payloads) == 1
+    assert [
+        (row["appid"], row["category"], row["tested_build_id"]) for row in deck_payloads[0]
+    ] == [
+        (730, "verified", "42"),
+        (10, "unsupported", None),
+    ]
+    assert {row["updated_at"] for row in deck_payloads[0]} == {"2026-10-14T09:00:00"}
+    assert {row["updated_at"] for row in fake_client.tables["steam_tags"]} == {
+        "2026-10-14T09:00:00"
+    }
+
+
+def test_relation_batch_retries_transient_failure_before_falling_back(
+    relation_database: tuple[PICSDatabase, FakeSupabaseClient],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    database, fake_client = relation_database
+    monkeypatch.setattr(PICSDatabase, "WRITE_RETRY_DELAY_SECONDS", 0)
+    original_execute_rpc = fake_client.execute_rpc
+    failures = {"replace_app_categories_batch": 1}
+
+    def flaky_execute_rpc(function_name: str, params: Dict[str, Any]) -> FakeResult:
+        if failures.get(function_name):
+            failures[function_name] -= 1
+            raise RuntimeError("503 Service Temporarily Unavailable")
+        return original_execute_rpc(function_name, params)
+
+    monkeypatch.setattr(fake_client, "execute_rpc", flaky_execute_rpc)
+
+    database._sync_relationships([build_app(appid=730), build_app(appid=570)], {730, 570})
+
+    category_rpcs = [
+        name for name, _ in fake_client.rpc_calls if name.startswith("replace_app_categories")
+    ]
+    assert category_rpcs == ["replace_app_categories_batch", "replace_app_categories_batch"]
+    assert [row["appid"] for row in fake_client.tables["app_categories"]] == [730, 570]
+
+
+def test_sync_relationships_seeds_and_links_batch_dlc_in_one_call_each(
+    relation_database: tuple[PICSDatabase, FakeSupabaseClient],
+) -> None:
+    database, fake_client = relation_database
+
+    database._sync_relationships(
+        [
+            build_app(appid=730, dlc_appids=[1001, 1002]),
+            build_app(appid=570, dlc_appids=[1002, 570]),
+            build_app(appid=10),
+        ],
+        {730, 570, 10},
+    )
+
+    seed_calls = [
+        params for name, params in fake_client.rpc_calls if name == "seed_discovered_apps"
+    ]
+    assert [[record["appid"] for record in params["p_records"]] for params in seed_calls] == [
+        [1001, 1002]
+    ]
+    assert [payload for table, payload in fake_client.upsert_payloads if table == "app_dlc"] == [
+        [
+            {"parent_appid": 730, "dlc_appid": 1001, "source": "pics"},
+            {"parent_appid": 730, "dlc_appid": 1002, "source": "pics"},
+            {"parent_appid": 570, "dlc_appid": 1002, "source": "pics"},
+        ]
+    ]
+
+
+def test_batch_sync_status_update_bisects_to_isolate_bad_rows(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(operations_module.settings, "pics_change_history_target", "supabase")
+    monkeypatch.setattr(operations_module.settings, "pics_latest_state_target", "supabase")
+    monkeypatch.setattr(PICSDatabase, "_load_tag_names", lambda self: None)
+    fake_client = FakeSupabaseClient()
+    monkeypatch.setattr(
+        "src.database.operations.SupabaseClient.get_instance",
+        lambda: FakeSupabaseWrapper(fake_client),
+    )
+    original_execute = fake_client.execute
+
+    def reject_bad_appid(query: FakeTableQuery) -> FakeResult:
+        if query.table_name == "sync_status" and any(row["appid"] == 3 for row in query.payload):
+            fake_client.calls.append((query.table_name, "rejected"))
+            raise RuntimeError("violates foreign key constraint")
+        return original_execute(query)
+
+    monkeypatch.setattr(fake_client, "execute", reject_bad_appid)
+    database = PICSDatabase()
+
+    database._batch_update_sync_status([1, 2, 3, 4], now="2026-10-14T00:00:00")
+
+    written = [
+        [row["appid"] for row in payload]
+        for table, payload in fake_client.upsert_payloads
+        if table == "sync_status"
+    ]
+    assert written == [[1, 2], [4]]
+    assert fake_client.calls.count(("sync_status", "rejected")) == 3
+
+
+def test_batch_sync_status_update_bisects_errors_that_only_mention_a_gateway_code(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(operations_module.settings, "pics_change_history_target", "supabase")
+    monkeypatch.setattr(operations_module.settings, "pics_latest_state_target", "supabase")
+    monkeypatch.setattr(PICSDatabase, "_load_tag_names", lambda self: None)
+    fake_client = FakeSupabaseClient()
+    monkeypatch.setattr(
+        "src.database.operations.SupabaseClient.get_instance",
+        lambda: FakeSupabaseWrapper(fake_client),
+    )
+    original_execute = fake_client.execute
+
+    def reject_bad_appid(query: FakeTableQuery) -> FakeResult:
+        if query.table_name == "sync_status" and any(row["appid"] == 1503 for row in query.payload):
+            raise RuntimeError("Key (appid)=(1503) is not present in table apps")
+        return original_execute(query)
+
+    monkeypatch.setattr(fake_client, "execute", reject_bad_appid)
+    database = PICSDatabase()
+
+    database._batch_update_sync_status([1501, 1502, 1503, 1504], now="2026-10-14T00:00:00")
+
+    written = [
+        [row["appid"] for row in payload]
+        for table, payload in fake_client.upsert_payloads
+        if table == "sync_status"
+    ]
+    assert written == [[1501, 1502], [1504]]
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import src.database.operations as operations_module
+from src.database.operations import PICSDatabase
+
+
+class FakeResponse:
+    def __init__(
+        self,
+        payload: Optional[List[Dict[str, Any]]] = None,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self._payload = payload or []
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        return None
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
+
+
+@pytest.fixture
+def tag_cache_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    cache_path = tmp_path / "steam-tags.json"
+    monkeypatch.setattr(operations_module, "STEAM_TAGS_CACHE_PATH", cache_path)
+    monkeypatch.setattr(PICSDatabase, "_tag_name_cache", {})
+    return cache_path
+
+
+def load_tag_names() -> None:
+    PICSDatabase._load_tag_names(object.__new__(PICSDatabase))
+
+
+def test_load_tag_names_uses_fresh_disk_cache_without_network(
+    monkeypatch: pytest.MonkeyPatch,
+    tag_cache_path: Path,
+) -> None:
+    tag_cache_path.write_text(json.dumps({"19": "Action"}), encoding="utf-8")
+
+    def fail_get(*_args: Any, **_kwargs: Any) -> FakeResponse:
+        raise AssertionError("tag API should not be called while the cache is fresh")
+
+    monkeypatch.setattr(operations_module.httpx, "get", fail_get)
+
+    load_tag_names()
+
+    assert PICSDatabase._tag_name_cache == {19: "Action"}
+
+
+def test_load_tag_names_refreshes_stale_disk_cache_and_rewrites_it(
+    monkeypatch: pytest.MonkeyPatch,
+    tag_cache_path: Path,
+) -> None:
+    tag_cache_path.write_text(json.dumps({"19": "Old Action"}), encoding="utf-8")
+    stale_mtime = time.time() - operations_module.STEAM_TAGS_CACHE_TTL_SECONDS * 3
+    os.utime(tag_cache_path, (stale_mtime, stale_mtime))
+    monkeypatch.setattr(
+        operations_module.httpx,
+        "get",
+        lambda *_args, **_kwargs: FakeResponse([{"tagid": 19, "name": "Action"}]),
+    )
+
+    load_tag_names()
+
+    assert PICSDatabase._tag_name_cache == {19: "Action"}
+    assert json.loads(tag_cache_path.read_text(encoding="utf-8")) == {"19": "Action"}
+
+
+def test_load_tag_names_falls_back_to_stale_disk_cache_when_api_fails(
+    monkeypatch: pytest.MonkeyPatch,
+    tag_cache_path: Path,
+) -> None:
+    tag_cache_path.write_text(json.dumps({"19": "Action"}), encoding="utf-8")
+    stale_mtime = time.time() - operations_module.STEAM_TAGS_CACHE_TTL_SECONDS * 3
+    os.utime(tag_cache_path, (stale_mtime, stale_mtime))
+
+    def fail_get(*_args: Any, **_kwargs: Any) -> FakeResponse:
+        raise RuntimeError("tag API unavailable")
+
+    monkeypatch.setattr(operations_module.httpx, "get", fail_get)
+
+    load_tag_names()
+
+    assert PICSDatabase._tag_name_cache == {19: "Action"}
+
+
+def test_tag_names_load_lazily_once_on_first_store_tag_build(
+    monkeypatch: pytest.MonkeyPatch,
+    tag_cache_path: Path,
+) -> None:
+    calls: List[int] = []
+
+    def fake_get(*_args: Any, **_kwargs: Any) -> FakeResponse:
+        calls.append(1)
+        return FakeResponse([{"tagid": 19, "name": "Action"}])
+
+    monkeypatch.setattr(operations_module.httpx, "get", fake_get)
+    monkeypatch.setattr(PICSDatabase, "_tag_names_load_attempted", False)
+    database = object.__new__(PICSDatabase)
+
+    assert calls == []
+    _, first_records = database._build_store_tag_rows([19], "2026-10-14T00:00:00")
+    database._build_store_tag_rows([19, 20], "2026-10-14T00:00:00")
+
+    assert calls == [1]
+    assert first_records[0]["name"] == "Action"
+
+
+def test_load_tag_names_revalidates_stale_cache_with_etag(
+    monkeypatch: pytest.MonkeyPatch,
+    tag_cache_path: Path,
+) -> None:
+    monkeypatch.setattr(
+        operations_module.httpx,
+        "get",
+        lambda *_args, **_kwargs: FakeResponse(
+            [{"tagid": 19, "name": "Action"}],
+            headers={"etag": '"v1"'},
+        ),
+    )
+    load_tag_names()
+
+    stale_mtime = time.time() - operations_module.STEAM_TAGS_CACHE_TTL_SECONDS * 3
+    os.utime(tag_cache_path, (stale_mtime, stale_mtime))
+    monkeypatch.setattr(PICSDatabase, "_tag_name_cache", {})
+    requested_headers: List[Dict[str, str]] = []
+
+    def not_modified(*_args: Any, headers: Dict[str, str], **_kwargs: Any) -> FakeResponse:
+        requested_headers.append(headers)
+        return FakeResponse(status_code=304)
+
+    monkeypatch.setattr(operations_module.httpx, "get", not_modified)
+
+    load_tag_names()
+
+    assert requested_headers == [{"If-None-Match": '"v1"'}]
+    assert PICSDatabase._tag_name_cache == {19: "Action"}
+    assert tag_cache_path.stat().st_mtime > stale_mtime
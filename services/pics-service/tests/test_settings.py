@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.config.settings import Settings
+
+
+def test_from_env_coerces_typed_fields_case_insensitively() -> None:
+    settings = Settings.from_env(
+        {
+            "SUPABASE_URL": "https://example.supabase.co",
+            "PORT": "9090",
+            "bulk_request_delay": "0.25",
+            "LOG_JSON": "false",
+            "PICS_CHANGE_HISTORY_BACKFILL_LIMIT": "42",
+            "UNRELATED_VARIABLE": "ignored",
+        },
+        env_file=None,
+    )
+
+    assert settings.supabase_url == "https://example.supabase.co"
+    assert settings.port == 9090
+    assert settings.bulk_request_delay == 0.25
+    assert settings.log_json is False
+    assert settings.pics_change_history_backfill_limit == 42
+    assert settings.mode == "change_monitor"
+
+
+def test_from_env_reads_env_file_with_process_environment_taking_precedence(tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# local overrides\nMODE=bulk_sync\nexport POLL_INTERVAL='45'\nPORT=1234\n",
+        encoding="utf-8",
+    )
+
+    settings = Settings.from_env({"PORT": "8081"}, env_file=str(env_file))
+
+    assert settings.mode == "bulk_sync"
+    assert settings.poll_interval == 45
+    assert settings.port == 8081
+
+
+def test_from_env_rejects_invalid_values() -> None:
+    with pytest.raises(ValueError, match="STEAM_AUTO_RECONNECT"):
+        Settings.from_env({"STEAM_AUTO_RECONNECT": "sometimes"}, env_file=None)
@@ -15,6 +15,17 @@ from src.steam import pics as pics_module
 from src.steam.pics import PICSFetcher
 
 
+class FastGevent:
+    """Stand-in for the gevent module that runs sleeps 1000x faster."""
+
+    def __getattr__(self, name):
+        return getattr(gevent, name)
+
+    @staticmethod
+    def sleep(seconds=0):
+        gevent.sleep(seconds / 1000)
+
+
 class FakeSteamApiClient:
     def __init__(self, responses=None):
         self.responses = list(responses or [])
@@ -119,7 +130,7 @@ def test_get_changes_since_retries_after_timeout_response(monkeypatch):
         responses=[None, build_response(700, [11, 22])],
     )
     fetcher = PICSFetcher(client, timeout=1, max_retries=2)
-    monkeypatch.setattr(pics_module.time, "sleep", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(pics_module, "gevent", FastGevent())
 
     result = fetcher.get_changes_since(650)
 
@@ -139,7 +150,7 @@ def test_get_changes_since_retries_after_hanging_poll_timeout(monkeypatch):
         responses=[slow_success, build_response(902, [42])],
     )
     fetcher = PICSFetcher(client, timeout=1, change_poll_timeout=0.01, max_retries=2)
-    monkeypatch.setattr(pics_module.time, "sleep", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(pics_module, "gevent", FastGevent())
 
     result = fetcher.get_changes_since(800)
 
@@ -147,3 +158,106 @@ def test_get_changes_since_retries_after_hanging_poll_timeout(monkeypatch):
     assert result.change_number == 902
     assert result.app_changes == [42]
     assert client.client.calls == 2
+
+
+def test_fetch_all_apps_keeps_multiple_requests_in_flight_and_yields_in_order():
+    client = FakeClient(connected=True)
+    active = []
+    max_active = []
+
+    def get_product_info(apps, timeout):
+        active.append(apps[0])
+        max_active.append(len(active))
+        # Earlier batches answer more slowly than later ones
+        gevent.sleep(0.03 if apps[0] == 1 else 0.01)
+        active.remove(apps[0])
+        return {"apps": {appid: {} for appid in apps}}
+
+    client.client.get_product_info = get_product_info
+    fetcher = PICSFetcher(client, batch_size=2, request_delay=0.001, max_in_flight=3)
+
+    batches = [sorted(batch) for batch in fetcher.fetch_all_apps([1, 2, 3, 4, 5])]
+
+    assert batches == [[1, 2], [3, 4], [5]]
+    assert max(max_active) == 3
+
+
+def test_fetch_all_apps_consumes_app_id_iterators_one_batch_at_a_time(monkeypatch):
+    client = FakeClient(connected=True)
+    client.client.get_product_info = lambda apps, timeout: {"apps": {appid: {} for appid in apps}}
+    monkeypatch.setattr(pics_module.time, "sleep", lambda *_args, **_kwargs: None)
+    fetcher = PICSFetcher(client, batch_size=2)
+    consumed = []
+
+    def appids():
+        for appid in range(1, 6):
+            consumed.append(appid)
+            yield appid
+
+    batches = fetcher.fetch_all_apps(appids())
+
+    assert sorted(next(batches)) == [1, 2]
+    assert consumed == [1, 2]
+    assert [sorted(batch) for batch in batches] == [[3, 4], [5]]
+
+
+def test_fetch_all_apps_subtracts_request_time_from_request_delay(monkeypatch):
+    clock = {"now": 0.0}
+    sleeps = []
+
+    def get_product_info(apps, timeout):
+        clock["now"] += 0.75
+        return {"apps": {appid: {} for appid in apps}}
+
+    client = FakeClient(connected=True)
+    client.client.get_product_info = get_product_info
+    monkeypatch.setattr(pics_module.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(pics_module.time, "sleep", sleeps.append)
+    fetcher = PICSFetcher(client, batch_size=2, request_delay=1.0)
+
+    assert len(list(fetcher.fetch_all_apps([1, 2, 3]))) == 2
+    assert sleeps == [0.25, 0.25]
+
+
+def test_in_flight_batches_share_one_reconnect_while_disconnected(monkeypatch):
+    client = FakeClient(connected=False, reconnect_result=True)
+    original_reconnect = client.reconnect
+
+    def slow_reconnect(max_attempts=0, force=False):
+        gevent.sleep(0.01)
+        return original_reconnect(max_attempts=max_attempts, force=force)
+
+    client.reconnect = slow_reconnect
+    client.client.get_product_info = lambda apps, timeout: {"apps": {appid: {} for appid in apps}}
+    monkeypatch.setattr(pics_module.time, "sleep", lambda *_args, **_kwargs: None)
+    fetcher = PICSFetcher(client, batch_size=2, request_delay=0.001, max_in_flight=2)
+
+    batches = [sorted(batch) for batch in fetcher.fetch_all_apps([1, 2, 3, 4])]
+
+    assert batches == [[1, 2], [3, 4]]
+    assert client.reconnect_calls == [(fetcher.MANUAL_RECONNECT_ATTEMPTS, True)]
+
+
+def test_batch_retry_backoff_does_not_block_other_in_flight_batches(monkeypatch):
+    client = FakeClient(connected=True)
+    client.connection_age_seconds = None
+    events = []
+    attempts = {}
+
+    def get_product_info(apps, timeout):
+        attempts[apps[0]] = attempts.get(apps[0], 0) + 1
+        if apps[0] == 1 and attempts[1] == 1:
+            events.append("batch 1 failed")
+            raise TimeoutError("no response")
+        gevent.sleep(0.001)
+        events.append(f"batch {apps[0]} answered")
+        return {"apps": {appid: {} for appid in apps}}
+
+    client.client.get_product_info = get_product_info
+    monkeypatch.setattr(pics_module, "gevent", FastGevent())
+    fetcher = PICSFetcher(client, batch_size=2, request_delay=0.001, max_in_flight=2)
+
+    batches = [sorted(batch) for batch in fetcher.fetch_all_apps([1, 2, 3, 4])]
+
+    assert batches == [[1, 2], [3, 4]]
+    assert events == ["batch 1 failed", "batch 3 answered", "batch 1 answered"]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import sys
+
+os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.database.client import OrjsonHttpxClient
+
+
+def test_orjson_client_encodes_json_bodies() -> None:
+    records = [{"appid": 10, "name": "Counter-Strike", "is_free": False, "platforms": None}]
+
+    with OrjsonHttpxClient() as client:
+        request = client.build_request(
+            "POST",
+            "https://example.supabase.co/rest/v1/apps",
+            json=records,
+            headers={"Prefer": "resolution=merge-duplicates"},
+        )
+
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.headers["Prefer"] == "resolution=merge-duplicates"
+    assert json.loads(request.content) == records
+
+
+def test_orjson_client_accepts_int_keys_and_oversized_ints() -> None:
+    url = "https://example.supabase.co/rest/v1/rpc/seed_discovered_apps"
+    with OrjsonHttpxClient() as client:
+        keyed = client.build_request("POST", url, json={10: "a"})
+        wide = client.build_request("POST", url, json=[2**70])
+
+    assert json.loads(keyed.content) == {"10": "a"}
+    assert json.loads(wide.content) == [2**70]
+
+
+def test_orjson_client_leaves_bodyless_requests_alone() -> None:
+    with OrjsonHttpxClient() as client:
+        request = client.build_request("GET", "https://example.supabase.co/rest/v1/apps")
+
+    assert request.content == b""
+    assert "Content-Type" not in request.headers
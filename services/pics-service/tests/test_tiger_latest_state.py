@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+from typing import Any, List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import src.database.tiger_latest_state as tiger_latest_state_module
+from src.database.tiger_latest_state import TigerPICSLatestStateStore
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def store(
+    monkeypatch: pytest.MonkeyPatch,
+) -> tuple[TigerPICSLatestStateStore, List[FakeConnection]]:
+    store = TigerPICSLatestStateStore("postgresql://example")
+    opened: List[FakeConnection] = []
+
+    def connect() -> FakeConnection:
+        connection = FakeConnection()
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(store, "_connect", connect)
+    return store, opened
+
+
+def test_connection_is_reused_across_transactions(
+    store: tuple[TigerPICSLatestStateStore, List[FakeConnection]],
+) -> None:
+    tiger_store, opened = store
+
+    with tiger_store._connection():
+        pass
+    with tiger_store._connection():
+        pass
+
+    assert len(opened) == 1
+    assert opened[0].commits == 2
+
+
+def test_failed_transaction_rolls_back_and_discards_broken_connection(
+    store: tuple[TigerPICSLatestStateStore, List[FakeConnection]],
+) -> None:
+    tiger_store, opened = store
+
+    with pytest.raises(RuntimeError):
+        with tiger_store._connection() as connection:
+            connection.broken = True
+            raise RuntimeError("server closed the connection")
+
+    with tiger_store._connection():
+        pass
+
+    assert len(opened) == 2
+    assert opened[0].rollbacks == 1
+    assert opened[0].closed
+    assert opened[1].commits == 1
+
+
+def test_connection_idle_past_the_limit_is_replaced(
+    monkeypatch: pytest.MonkeyPatch,
+    store: tuple[TigerPICSLatestStateStore, List[FakeConnection]],
+) -> None:
+    tiger_store, opened = store
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(tiger_latest_state_module.time, "monotonic", lambda: clock["now"])
+
+    with tiger_store._connection():
+        pass
+    clock["now"] += tiger_store.MAX_IDLE_SECONDS - 1
+    with tiger_store._connection():
+        pass
+    clock["now"] += tiger_store.MAX_IDLE_SECONDS + 1
+    with tiger_store._connection():
+        pass
+
+    assert len(opened) == 2
+    assert opened[0].closed
+    assert opened[1].commits == 1
+
+
+class FakeCopy:
+    def __init__(self, rows: List[tuple]):
+        self._rows = rows
+
+    def __enter__(self) -> "FakeCopy":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        return None
+
+    def write_row(self, row: tuple) -> None:
+        self._rows.append(row)
+
+
+class RecordingCursor:
+    def __init__(self):
+        self.statements: List[str] = []
+        self.copied_rows: List[tuple] = []
+
+    def __enter__(self) -> "RecordingCursor":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        return None
+
+    def execute(self, statement: str, _params: Any = None) -> None:
+        self.statements.append(statement)
+
+    def copy(self, statement: str) -> FakeCopy:
+        self.statements.append(statement)
+        return FakeCopy(self.copied_rows)
+
+
+def test_large_app_batches_are_copied_through_a_staging_table(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tiger_store = TigerPICSLatestStateStore("postgresql://example", copy_min_rows=2)
+    cursor = RecordingCursor()
+    connection = FakeConnection()
+    connection.cursor = lambda: cursor
+    monkeypatch.setattr(tiger_store, "_connect", lambda: connection)
+
+    small = tiger_store.upsert_app_records([{"appid": 1, "name": "One"}])
+    assert small == {1}
+    assert "jsonb_to_recordset" in cursor.statements[0]
+
+    cursor.statements.clear()
+    large = tiger_store.upsert_app_records(
+        [
+            {"appid": 2, "name": "Two", "languages": {"english": True}},
+            {"appid": 3, "name": "Three", "is_free": True},
+        ]
+    )
+
+    assert large == {2, 3}
+    assert cursor.statements[0].startswith("CREATE TEMP TABLE pics_app_staging")
+    assert cursor.statements[1].startswith("COPY pics_app_staging")
+    assert "FROM pics_app_staging" in cursor.statements[2]
+    assert "ON CONFLICT (appid)" in cursor.statements[2]
+    assert cursor.copied_rows[0][:2] == (2, "Two")
+    assert '{"english":true}' in cursor.copied_rows[0]
+    assert cursor.copied_rows[1][:2] == (3, "Three")
+    assert True in cursor.copied_rows[1]
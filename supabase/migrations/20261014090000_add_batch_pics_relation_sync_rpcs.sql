@@ -0,0 +1,153 @@
+-- Migration: Batch PICS latest-state relation sync RPCs
+--
+-- Adds batch variants of replace_app_categories, replace_app_genres, and
+-- replace_app_steam_tags so the PICS service can replace relations for a whole
+-- upsert batch in one round-trip. Each p_records element carries one appid and
+-- its desired ids, and the per-app semantics are unchanged: unchanged junction
+-- rows and their created_at timestamps are preserved, mutable fields are
+-- updated in place, and stale rows are deleted.
+
+CREATE OR REPLACE FUNCTION replace_app_categories_batch(p_records JSONB)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  WITH requested AS (
+    SELECT DISTINCT ON (record.appid)
+      record.appid,
+      COALESCE(record.category_ids, ARRAY[]::INTEGER[]) AS category_ids
+    FROM jsonb_to_recordset(COALESCE(p_records, '[]'::jsonb)) AS record(appid INTEGER, category_ids INTEGER[])
+    WHERE record.appid IS NOT NULL
+  ),
+  desired AS (
+    SELECT DISTINCT requested.appid, category_id
+    FROM requested
+    CROSS JOIN LATERAL unnest(requested.category_ids) AS category_id
+    WHERE category_id IS NOT NULL
+  )
+  INSERT INTO app_categories (appid, category_id)
+  SELECT desired.appid, desired.category_id
+  FROM desired
+  ON CONFLICT (appid, category_id) DO NOTHING;
+
+  DELETE FROM app_categories existing
+  USING (
+    SELECT DISTINCT ON (record.appid)
+      record.appid,
+      array_remove(COALESCE(record.category_ids, ARRAY[]::INTEGER[]), NULL) AS category_ids
+    FROM jsonb_to_recordset(COALESCE(p_records, '[]'::jsonb)) AS record(appid INTEGER, category_ids INTEGER[])
+    WHERE record.appid IS NOT NULL
+  ) requested
+  WHERE existing.appid = requested.appid
+    AND NOT (existing.category_id = ANY(requested.category_ids));
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION replace_app_genres_batch(p_records JSONB)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  WITH requested AS (
+    SELECT DISTINCT ON (record.appid)
+      record.appid,
+      COALESCE(record.genre_ids, ARRAY[]::INTEGER[]) AS genre_ids,
+      record.primary_genre_id
+    FROM jsonb_to_recordset(COALESCE(p_records, '[]'::jsonb)) AS record(
+      appid INTEGER,
+      genre_ids INTEGER[],
+      primary_genre_id INTEGER
+    )
+    WHERE record.appid IS NOT NULL
+  ),
+  desired AS (
+    SELECT DISTINCT
+      requested.appid,
+      genre_id,
+      COALESCE(genre_id = requested.primary_genre_id, FALSE) AS is_primary
+    FROM requested
+    CROSS JOIN LATERAL unnest(requested.genre_ids) AS genre_id
+    WHERE genre_id IS NOT NULL
+  )
+  INSERT INTO app_genres (appid, genre_id, is_primary)
+  SELECT desired.appid, desired.genre_id, desired.is_primary
+  FROM desired
+  ON CONFLICT (appid, genre_id) DO UPDATE
+  SET is_primary = EXCLUDED.is_primary
+  WHERE app_genres.is_primary IS DISTINCT FROM EXCLUDED.is_primary;
+
+  DELETE FROM app_genres existing
+  USING (
+    SELECT DISTINCT ON (record.appid)
+      record.appid,
+      array_remove(COALESCE(record.genre_ids, ARRAY[]::INTEGER[]), NULL) AS genre_ids
+    FROM jsonb_to_recordset(COALESCE(p_records, '[]'::jsonb)) AS record(appid INTEGER, genre_ids INTEGER[])
+    WHERE record.appid IS NOT NULL
+  ) requested
+  WHERE existing.appid = requested.appid
+    AND NOT (existing.genre_id = ANY(requested.genre_ids));
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION replace_app_steam_tags_batch(p_records JSONB)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  WITH requested AS (
+    SELECT DISTINCT ON (record.appid)
+      record.appid,
+      COALESCE(record.tag_ids, ARRAY[]::INTEGER[]) AS tag_ids
+    FROM jsonb_to_recordset(COALESCE(p_records, '[]'::jsonb)) AS record(appid INTEGER, tag_ids INTEGER[])
+    WHERE record.appid IS NOT NULL
+  ),
+  desired AS (
+    SELECT DISTINCT ON (requested.appid, desired_tag.tag_id)
+      requested.appid,
+      desired_tag.tag_id,
+      desired_tag.ordinality - 1 AS rank
+    FROM requested
+    CROSS JOIN LATERAL unnest(requested.tag_ids) WITH ORDINALITY AS desired_tag(tag_id, ordinality)
+    WHERE desired_tag.tag_id IS NOT NULL
+    ORDER BY requested.appid, desired_tag.tag_id, desired_tag.ordinality
+  )
+  INSERT INTO app_steam_tags (appid, tag_id, rank)
+  SELECT desired.appid, desired.tag_id, desired.rank
+  FROM desired
+  ON CONFLICT (appid, tag_id) DO UPDATE
+  SET rank = EXCLUDED.rank
+  WHERE app_steam_tags.rank IS DISTINCT FROM EXCLUDED.rank;
+
+  DELETE FROM app_steam_tags existing
+  USING (
+    SELECT DISTINCT ON (record.appid)
+      record.appid,
+      array_remove(COALESCE(record.tag_ids, ARRAY[]::INTEGER[]), NULL) AS tag_ids
+    FROM jsonb_to_recordset(COALESCE(p_records, '[]'::jsonb)) AS record(appid INTEGER, tag_ids INTEGER[])
+    WHERE record.appid IS NOT NULL
+  ) requested
+  WHERE existing.appid = requested.appid
+    AND NOT (existing.tag_id = ANY(requested.tag_ids));
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION replace_app_categories_batch(JSONB) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION replace_app_categories_batch(JSONB) FROM anon;
+REVOKE EXECUTE ON FUNCTION replace_app_categories_batch(JSONB) FROM authenticated;
+GRANT EXECUTE ON FUNCTION replace_app_categories_batch(JSONB) TO service_role;
+
+REVOKE EXECUTE ON FUNCTION replace_app_genres_batch(JSONB) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION replace_app_genres_batch(JSONB) FROM anon;
+REVOKE EXECUTE ON FUNCTION replace_app_genres_batch(JSONB) FROM authenticated;
+GRANT EXECUTE ON FUNCTION replace_app_genres_batch(JSONB) TO service_role;
+
+REVOKE EXECUTE ON FUNCTION replace_app_steam_tags_batch(JSONB) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION replace_app_steam_tags_batch(JSONB) FROM anon;
+REVOKE EXECUTE ON FUNCTION replace_app_steam_tags_batch(JSONB) FROM authenticated;
+GRANT EXECUTE ON FUNCTION replace_app_steam_tags_batch(JSONB) TO service_role;
@@ -0,0 +1,26 @@
+-- Migration: Bulk franchise upsert for PICS relation sync
+--
+-- Adds a set-returning variant of upsert_franchise so the PICS service can
+-- upsert every franchise referenced by an upsert batch in one round-trip and
+-- link apps to the returned ids with a single app_franchises upsert. Names are
+-- trimmed and normalized exactly like upsert_franchise.
+
+CREATE OR REPLACE FUNCTION upsert_franchises_bulk(p_names TEXT[])
+RETURNS TABLE (id INTEGER, name TEXT)
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  INSERT INTO franchises (name, normalized_name)
+  SELECT DISTINCT TRIM(requested_name), LOWER(TRIM(requested_name))
+  FROM unnest(COALESCE(p_names, ARRAY[]::TEXT[])) AS requested_name
+  WHERE requested_name IS NOT NULL
+    AND TRIM(requested_name) <> ''
+  ON CONFLICT (name) DO UPDATE SET updated_at = NOW()
+  RETURNING franchises.id, franchises.name;
+$$;
+
+REVOKE EXECUTE ON FUNCTION upsert_franchises_bulk(TEXT[]) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION upsert_franchises_bulk(TEXT[]) FROM anon;
+REVOKE EXECUTE ON FUNCTION upsert_franchises_bulk(TEXT[]) FROM authenticated;
+GRANT EXECUTE ON FUNCTION upsert_franchises_bulk(TEXT[]) TO service_role;
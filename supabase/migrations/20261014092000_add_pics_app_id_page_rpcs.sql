@@ -0,0 +1,57 @@
+-- Migration: Array-returning appid page RPCs for the PICS service
+--
+-- PostgREST caps table reads at 1000 rows and returns one JSON object per row,
+-- so listing every appid took thousands of round-trips of {"appid": ...}
+-- objects. These functions return a whole cursor page as a single INTEGER[]
+-- value, which is not subject to the row cap and decodes as a flat int list.
+
+CREATE OR REPLACE FUNCTION get_app_ids_after(
+  p_last_appid INTEGER DEFAULT 0,
+  p_limit INTEGER DEFAULT 50000
+)
+RETURNS INTEGER[]
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT COALESCE(array_agg(page.appid ORDER BY page.appid), ARRAY[]::INTEGER[])
+  FROM (
+    SELECT a.appid
+    FROM apps a
+    WHERE a.appid > COALESCE(p_last_appid, 0)
+    ORDER BY a.appid
+    LIMIT GREATEST(COALESCE(p_limit, 50000), 1)
+  ) page;
+$$;
+
+CREATE OR REPLACE FUNCTION get_unsynced_pics_app_ids_after(
+  p_last_appid INTEGER DEFAULT 0,
+  p_limit INTEGER DEFAULT 50000
+)
+RETURNS INTEGER[]
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT COALESCE(array_agg(page.appid ORDER BY page.appid), ARRAY[]::INTEGER[])
+  FROM (
+    SELECT s.appid
+    FROM sync_status s
+    WHERE s.last_pics_sync IS NULL
+      AND s.appid > COALESCE(p_last_appid, 0)
+    ORDER BY s.appid
+    LIMIT GREATEST(COALESCE(p_limit, 50000), 1)
+  ) page;
+$$;
+
+REVOKE EXECUTE ON FUNCTION get_app_ids_after(INTEGER, INTEGER) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION get_app_ids_after(INTEGER, INTEGER) FROM anon;
+REVOKE EXECUTE ON FUNCTION get_app_ids_after(INTEGER, INTEGER) FROM authenticated;
+GRANT EXECUTE ON FUNCTION get_app_ids_after(INTEGER, INTEGER) TO service_role;
+
+REVOKE EXECUTE ON FUNCTION get_unsynced_pics_app_ids_after(INTEGER, INTEGER) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION get_unsynced_pics_app_ids_after(INTEGER, INTEGER) FROM anon;
+REVOKE EXECUTE ON FUNCTION get_unsynced_pics_app_ids_after(INTEGER, INTEGER) FROM authenticated;
+GRANT EXECUTE ON FUNCTION get_unsynced_pics_app_ids_after(INTEGER, INTEGER) TO service_role;
@@ -0,0 +1,34 @@
+-- Migration: Combined pre-upsert app state lookup for the PICS service
+--
+-- Before each upsert batch the PICS service needs to know which appids exist,
+-- their current names, whether a storefront release_date_raw is present, and
+-- whether the storefront sync has run. That used to be four paginated
+-- PostgREST selects against apps and sync_status; this returns all of it in
+-- one round-trip per page of appids. Only existing apps are returned.
+
+CREATE OR REPLACE FUNCTION check_app_sync_state(p_appids INTEGER[])
+RETURNS TABLE (
+  appid INTEGER,
+  name TEXT,
+  has_raw_date BOOLEAN,
+  has_storefront_sync BOOLEAN
+)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT
+    a.appid,
+    a.name,
+    a.release_date_raw IS NOT NULL,
+    COALESCE(s.last_storefront_sync IS NOT NULL, FALSE)
+  FROM apps a
+  LEFT JOIN sync_status s ON s.appid = a.appid
+  WHERE a.appid = ANY(COALESCE(p_appids, ARRAY[]::INTEGER[]));
+$$;
+
+REVOKE EXECUTE ON FUNCTION check_app_sync_state(INTEGER[]) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION check_app_sync_state(INTEGER[]) FROM anon;
+REVOKE EXECUTE ON FUNCTION check_app_sync_state(INTEGER[]) FROM authenticated;
+GRANT EXECUTE ON FUNCTION check_app_sync_state(INTEGER[]) TO service_role;
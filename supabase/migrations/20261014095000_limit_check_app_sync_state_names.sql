@@ -0,0 +1,42 @@
+-- Migration: Only return names from check_app_sync_state when requested
+--
+-- The PICS service only needs a stored app name as a fallback for apps whose
+-- PICS payload has no name, which is rare. check_app_sync_state now takes the
+-- appids that need a fallback name in p_name_appids and returns NULL names for
+-- everything else. Passing NULL keeps the previous behavior of returning every
+-- name. The old single-argument function is dropped so PostgREST does not see
+-- two candidate overloads for {"p_appids": ...}.
+
+DROP FUNCTION IF EXISTS check_app_sync_state(INTEGER[]);
+
+CREATE OR REPLACE FUNCTION check_app_sync_state(
+  p_appids INTEGER[],
+  p_name_appids INTEGER[] DEFAULT NULL
+)
+RETURNS TABLE (
+  appid INTEGER,
+  name TEXT,
+  has_raw_date BOOLEAN,
+  has_storefront_sync BOOLEAN
+)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT
+    a.appid,
+    CASE
+      WHEN p_name_appids IS NULL OR a.appid = ANY(p_name_appids) THEN a.name
+    END,
+    a.release_date_raw IS NOT NULL,
+    COALESCE(s.last_storefront_sync IS NOT NULL, FALSE)
+  FROM apps a
+  LEFT JOIN sync_status s ON s.appid = a.appid
+  WHERE a.appid = ANY(COALESCE(p_appids, ARRAY[]::INTEGER[]));
+$$;
+
+REVOKE EXECUTE ON FUNCTION check_app_sync_state(INTEGER[], INTEGER[]) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION check_app_sync_state(INTEGER[], INTEGER[]) FROM anon;
+REVOKE EXECUTE ON FUNCTION check_app_sync_state(INTEGER[], INTEGER[]) FROM authenticated;
+GRANT EXECUTE ON FUNCTION check_app_sync_state(INTEGER[], INTEGER[]) TO service_role;